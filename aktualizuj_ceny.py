@@ -88,9 +88,12 @@ def _eksportuj_seed_csv(db: BazaCen):
 
     import sqlite3
     conn = sqlite3.connect(db.db_path)
+    # Baza trzyma początek okresu w sekundach — seed pozostaje w formacie ISO
     cur = conn.execute(
-        'SELECT timestamp_start, timestamp_end, cena_pln_mwh, '
-        'wolumen, rynek, waluta, zrodlo FROM ceny_15min ORDER BY timestamp_start'
+        "SELECT strftime('%Y-%m-%dT%H:%M:%S', timestamp_start, 'unixepoch'), "
+        "strftime('%Y-%m-%dT%H:%M:%S', timestamp_start + okres_s, 'unixepoch'), "
+        'cena_pln_mwh, wolumen, rynek, waluta, zrodlo '
+        'FROM ceny_15min ORDER BY timestamp_start'
     )
     rows = cur.fetchall()
     conn.close()
@@ -55,6 +55,39 @@ def _parsuj_date_label(label: str) -> tuple[int, int, bool]:
     return dd, mm, is_working
 
 
+def _wczytaj_wiersze(file_bytes: bytes, filename: str) -> list[tuple]:
+    """Zwraca wiersze pierwszego arkusza jako krotki wartości (puste komórki → None).
+
+    XLSX czytany przez openpyxl w trybie read_only/data_only (strumieniowo, bez
+    stylów i formuł); stary format XLS przez xlrd.
+    """
+    if filename.lower().endswith('.xls'):
+        df = pd.read_excel(io.BytesIO(file_bytes), header=None, engine='xlrd')
+        df = df.astype(object).where(df.notna(), None)
+        return list(df.itertuples(index=False, name=None))
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True, keep_links=False)
+    try:
+        rows = list(wb.worksheets[0].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    # Sformatowane, ale puste wiersze na końcu arkusza (pd.read_excel je pomijał) —
+    # bez tego stopka z firmą i transformatorem wypada poza rows[-10:]
+    while rows and all(v is None for v in rows[-1]):
+        rows.pop()
+    return rows
+
+
+def _tekst_wiersza(row: tuple) -> str:
+    return ' '.join(str(v) for v in row if v is not None)
+
+
+def _komorka(row: tuple, idx: int):
+    return row[idx] if idx < len(row) else None
+
+
 def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
     """Parsuje plik SKADEN (.xls/.xlsx) z mocami godzinowymi.
 
@@ -65,8 +98,7 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
     Returns:
         ProfilMocy z DataFrame 8760/8784 wierszy
     """
-    engine = 'xlrd' if filename.lower().endswith('.xls') else 'openpyxl'
-    df_raw = pd.read_excel(io.BytesIO(file_bytes), header=None, engine=engine)
+    rows = _wczytaj_wiersze(file_bytes, filename)
 
     # --- Metadane z nagłówka ---
     taryfa = ''
@@ -75,8 +107,8 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
     rok = 0
 
     # Szukaj metadanych w pierwszych 6 wierszach
-    for i in range(min(6, len(df_raw))):
-        row_text = ' '.join(str(v) for v in df_raw.iloc[i] if pd.notna(v))
+    for row in rows[:6]:
+        row_text = _tekst_wiersza(row)
 
         # Taryfa (np. "B23", "C22a")
         m = re.search(r'\b([ABC]\d{2}[ab]?)\b', row_text, re.IGNORECASE)
@@ -90,8 +122,8 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
             rok = int(m_okres.group(3))
 
     # Firma i transformator z footer (ostatnie wiersze)
-    for i in range(max(0, len(df_raw) - 10), len(df_raw)):
-        row_text = ' '.join(str(v) for v in df_raw.iloc[i] if pd.notna(v))
+    for row in rows[-10:]:
+        row_text = _tekst_wiersza(row)
 
         if 'Transformator' in row_text or 'trafo' in row_text.lower():
             nr_transformatora = row_text.strip()
@@ -105,18 +137,15 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
             )
             firma = m_firma.group(1).strip() if m_firma else row_text.strip()
 
-        # SKADEN version line often has company name nearby
-        if 'SKADEN' in row_text:
-            continue
-
     # --- Znajdź bloki danych ---
     # Format SKADEN: "Godziny" na jednym wierszu, wartości godzin (np. "1:00") na następnym.
     # Szukamy wierszy z wartościami godzin w kolumnie 2.
     blok1_start = None
     blok2_start = None
 
-    for i in range(len(df_raw)):
-        cell2 = str(df_raw.iloc[i, 2]).strip() if pd.notna(df_raw.iloc[i, 2]) else ''
+    for i, row in enumerate(rows):
+        cell2 = _komorka(row, 2)
+        cell2 = str(cell2).strip() if cell2 is not None else ''
 
         if cell2 == '1:00' and blok1_start is None:
             blok1_start = i + 1  # dane zaczynają się w następnym wierszu
@@ -130,18 +159,16 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
         )
 
     # --- Parsuj dane z obu bloków ---
-    records = []  # lista (datetime, moc_kw)
+    # Każdy wiersz dnia daje 12 godzin; znaczniki czasu składane wektorowo na końcu
+    dni = []      # (miesiac, dzien) per wiersz
+    offsety = []  # 0 dla bloku 1 (godz. 1-12), 12 dla bloku 2 (godz. 13-24)
+    moce = []     # 12 wartości per wiersz
 
     def _parsuj_blok(start_row: int, godziny_offset: int):
-        """Parsuje blok danych (12 godzin).
-
-        godziny_offset: 0 dla bloku 1 (godz. 1-12), 12 dla bloku 2 (godz. 13-24)
-        """
-        i = start_row
-        while i < len(df_raw):
-            cell0 = df_raw.iloc[i, 0]
-            if pd.isna(cell0):
-                i += 1
+        """Parsuje blok danych (12 godzin)."""
+        for row in rows[start_row:]:
+            cell0 = _komorka(row, 0)
+            if cell0 is None:
                 continue
 
             cell0_str = str(cell0).strip()
@@ -154,38 +181,30 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
             try:
                 dd, mm, _ = _parsuj_date_label(cell0_str)
             except ValueError:
-                i += 1
                 continue
 
-            # Odczytaj 12 wartości mocy
-            for h_idx, col_idx in enumerate(_KOLUMNY_DANYCH):
-                godzina = godziny_offset + h_idx + 1  # 1-24
-                if col_idx < len(df_raw.columns):
-                    val = df_raw.iloc[i, col_idx]
-                    moc = float(val) if pd.notna(val) else 0.0
-                else:
-                    moc = 0.0
-
-                # Godzina 24 → następny dzień godzina 0 (ale traktujemy jako 0:00)
-                if godzina == 24:
-                    dt = pd.Timestamp(year=rok, month=mm, day=dd, hour=0)
-                    # Przesuń o 1 dzień
-                    dt = dt + pd.Timedelta(days=1)
-                else:
-                    dt = pd.Timestamp(year=rok, month=mm, day=dd, hour=godzina)
-
-                records.append((dt, moc))
-
-            i += 1
+            dni.append((mm, dd))
+            offsety.append(godziny_offset)
+            moce.append([
+                float(v) if (v := _komorka(row, col_idx)) is not None else 0.0
+                for col_idx in _KOLUMNY_DANYCH
+            ])
 
     _parsuj_blok(blok1_start, 0)   # godziny 1-12
     _parsuj_blok(blok2_start, 12)  # godziny 13-24
 
-    if not records:
+    if not moce:
         raise ValueError('Nie znaleziono żadnych danych mocy w pliku.')
 
     # --- Buduj DataFrame ---
-    df = pd.DataFrame(records, columns=['datetime', 'moc_kw'])
+    # Godzina g dnia D to D + g h (godzina 24 → następny dzień 0:00)
+    mies, dzien = zip(*dni)
+    daty = pd.to_datetime({'year': [rok] * len(dni), 'month': mies, 'day': dzien}).to_numpy()
+    godziny = np.asarray(offsety)[:, None] + np.arange(1, len(_KOLUMNY_DANYCH) + 1)
+    df = pd.DataFrame({
+        'datetime': (daty[:, None] + godziny.astype('timedelta64[h]')).ravel(),
+        'moc_kw': np.asarray(moce, dtype=float).ravel(),
+    })
     df = df.sort_values('datetime').reset_index(drop=True)
 
     # Usuń duplikaty (np. godz. 24 = następny dzień 0:00)
@@ -214,20 +233,30 @@ def parsuj_profil_mocy(file_bytes: bytes, filename: str) -> ProfilMocy:
 # ANALIZA
 # ============================================================
 
+_INDEKS_MIESIECY = pd.Index(
+    ['Sty', 'Lut', 'Mar', 'Kwi', 'Maj', 'Cze', 'Lip', 'Sie', 'Wrz', 'Paź', 'Lis', 'Gru'],
+    name='Miesiąc',
+)
+
+
 def analiza_profilu(profil: ProfilMocy) -> dict:
     """Pełna analiza profilu mocy godzinowej.
 
     Returns:
         dict z kluczami: statystyki, rozklad_strefowy, profil_dobowy,
-        profil_miesieczny, top_szczyty, heatmapa, rekomendacja_moc_umowna,
-        kategoria_mocowa
+        profil_miesieczny, top_szczyty, top_szczyty_html, heatmapa,
+        rekomendacja_moc_umowna, kategoria_mocowa
     """
-    df = profil.dane.copy()
-    df['godzina'] = df['datetime'].dt.hour
-    df['miesiac'] = df['datetime'].dt.month
-    df['dzien_tygodnia'] = df['datetime'].dt.dayofweek  # 0=Pn, 6=Nd
-    df['dzien_roku'] = df['datetime'].dt.dayofyear
-    df['nazwa_dnia'] = df['datetime'].dt.day_name()
+    # Tylko kolumny kalendarza potrzebne w analizie — jako tablice, bez kopii danych
+    czas = profil.dane['datetime'].dt
+    moc = profil.dane['moc_kw'].to_numpy(dtype=float)
+    godzina = czas.hour.to_numpy()
+    miesiac = czas.month.to_numpy()
+    dzien_tygodnia = czas.dayofweek.to_numpy()  # 0=Pn, 6=Nd
+    df = pd.DataFrame({
+        'datetime': profil.dane['datetime'].to_numpy(),
+        'moc_kw': moc,
+    })
 
     wynik = {}
 
@@ -239,61 +268,73 @@ def analiza_profilu(profil: ProfilMocy) -> dict:
         'p_srednia_kw': profil.p_srednia_kw,
         'zuzycie_roczne_kwh': profil.zuzycie_roczne_kwh,
         'load_factor': load_factor,
-        'liczba_godzin': len(df),
+        'liczba_godzin': len(moc),
     }
 
-    # 2. Rozkład strefowy (definicje taryfowe)
+    # 2. Rozkład strefowy (definicje taryfowe) — maski boolowskie zamiast apply per wiersz
     # Szczyt: 7-13, 16-21 w dni robocze
     # Pozaszczyt: reszta w dni robocze
     # Noc: 22-6 (wszystkie dni)
-    def _strefa(row):
-        h = row['godzina']
-        wd = row['dzien_tygodnia']
-        if 22 <= h or h < 6:
-            return 'noc'
-        if wd < 5:  # Pn-Pt
-            if (7 <= h < 13) or (16 <= h < 21):
-                return 'szczyt'
-        return 'pozaszczyt'
-
-    df['strefa'] = df.apply(_strefa, axis=1)
-    zuzycie_per_strefa = df.groupby('strefa')['moc_kw'].sum()
-    total = zuzycie_per_strefa.sum()
+    maska_noc = (godzina >= 22) | (godzina < 6)
+    maska_szczyt = (
+        ~maska_noc & (dzien_tygodnia < 5) &
+        (((godzina >= 7) & (godzina < 13)) | ((godzina >= 16) & (godzina < 21)))
+    )
+    szczyt_kwh = moc[maska_szczyt].sum()
+    noc_kwh = moc[maska_noc].sum()
+    pozaszczyt_kwh = moc[~(maska_noc | maska_szczyt)].sum()
+    total = szczyt_kwh + pozaszczyt_kwh + noc_kwh
     wynik['rozklad_strefowy'] = {
-        'szczyt_kwh': zuzycie_per_strefa.get('szczyt', 0),
-        'pozaszczyt_kwh': zuzycie_per_strefa.get('pozaszczyt', 0),
-        'noc_kwh': zuzycie_per_strefa.get('noc', 0),
-        'szczyt_pct': zuzycie_per_strefa.get('szczyt', 0) / total * 100 if total > 0 else 0,
-        'pozaszczyt_pct': zuzycie_per_strefa.get('pozaszczyt', 0) / total * 100 if total > 0 else 0,
-        'noc_pct': zuzycie_per_strefa.get('noc', 0) / total * 100 if total > 0 else 0,
+        'szczyt_kwh': szczyt_kwh,
+        'pozaszczyt_kwh': pozaszczyt_kwh,
+        'noc_kwh': noc_kwh,
+        'szczyt_pct': szczyt_kwh / total * 100 if total > 0 else 0,
+        'pozaszczyt_pct': pozaszczyt_kwh / total * 100 if total > 0 else 0,
+        'noc_pct': noc_kwh / total * 100 if total > 0 else 0,
     }
 
-    # 3. Profil dobowy — średnia moc per godzina
-    profil_dobowy = df.groupby('godzina')['moc_kw'].mean()
-    wynik['profil_dobowy'] = profil_dobowy.to_dict()
+    # 3. Profil dobowy — średnia moc per godzina (Series gotowa do wykresu)
+    # bincount (suma/liczność per godzina) zamiast groupby; tylko godziny z danymi
+    licznosc_h = np.bincount(godzina, minlength=24)
+    obecne_h = np.flatnonzero(licznosc_h)
+    wynik['profil_dobowy'] = pd.Series(
+        np.bincount(godzina, weights=moc, minlength=24)[obecne_h] / licznosc_h[obecne_h],
+        index=pd.Index(obecne_h, name='Godzina'), name='kW',
+    )
 
-    # 4. Profil miesięczny — zużycie per miesiąc
-    profil_miesieczny = df.groupby('miesiac')['moc_kw'].sum()
-    wynik['profil_miesieczny'] = profil_miesieczny.to_dict()
+    # 4. Profil miesięczny — zużycie per miesiąc (zawsze 12 pozycji, w kolejności)
+    wynik['profil_miesieczny'] = pd.Series(
+        np.bincount(miesiac - 1, weights=moc, minlength=12),
+        index=_INDEKS_MIESIECY, name='kWh',
+    )
 
     # 5. Top 10 szczytów
     top10 = df.nlargest(10, 'moc_kw')[['datetime', 'moc_kw']].copy()
     top10['datetime'] = top10['datetime'].dt.strftime('%Y-%m-%d %H:%M')
     wynik['top_szczyty'] = top10.reset_index(drop=True)
+    # Statyczna tabela HTML do wyświetlenia (10 wierszy — bez interaktywnej siatki)
+    wynik['top_szczyty_html'] = wynik['top_szczyty'].rename(
+        columns={'datetime': 'Data/godzina', 'moc_kw': 'Moc (kW)'}
+    ).to_html(index=False, classes='szczyty', border=0, float_format='{:,.1f}'.format)
 
     # 6. Heatmapa — pivot: dzień tygodnia × godzina → średnia moc
     nazwy_dni = ['Pn', 'Wt', 'Sr', 'Cz', 'Pt', 'Sb', 'Nd']
-    heatmapa = df.pivot_table(
-        values='moc_kw',
-        index='dzien_tygodnia',
-        columns='godzina',
-        aggfunc='mean',
+    komorka = dzien_tygodnia * 24 + godzina
+    licznosc_dh = np.bincount(komorka, minlength=7 * 24).reshape(7, 24)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        srednie_dh = np.bincount(komorka, weights=moc, minlength=7 * 24).reshape(7, 24) / licznosc_dh
+    # Jak pivot_table: pomijane dni i godziny bez żadnych danych
+    dni_obecne = np.flatnonzero(licznosc_dh.any(axis=1))
+    godziny_obecne = np.flatnonzero(licznosc_dh.any(axis=0))
+    heatmapa = pd.DataFrame(
+        srednie_dh[np.ix_(dni_obecne, godziny_obecne)],
+        index=[nazwy_dni[i] for i in dni_obecne],
+        columns=pd.Index(godziny_obecne, name='godzina'),
     )
-    heatmapa.index = [nazwy_dni[i] for i in heatmapa.index]
     wynik['heatmapa'] = heatmapa
 
     # 7. Rekomendacja mocy umownej — percentyl 99.5
-    p995 = np.percentile(df['moc_kw'], 99.5)
+    p995 = np.quantile(moc, 0.995)
     wynik['rekomendacja_moc_umowna'] = {
         'p_max_kw': profil.p_max_kw,
         'percentyl_995_kw': p995,
@@ -303,11 +344,11 @@ def analiza_profilu(profil: ProfilMocy) -> dict:
     # 8. Kategoria mocowa — zużycie w szczycie systemowym
     # Szczyt systemowy: 17-19 w dni robocze (Pn-Pt), XI-III
     mask_szczyt_sys = (
-        (df['godzina'] >= 17) & (df['godzina'] < 19) &
-        (df['dzien_tygodnia'] < 5) &
-        (df['miesiac'].isin([11, 12, 1, 2, 3]))
+        (godzina >= 17) & (godzina < 19) &
+        (dzien_tygodnia < 5) &
+        np.isin(miesiac, (11, 12, 1, 2, 3))
     )
-    zuzycie_szczyt_sys = df.loc[mask_szczyt_sys, 'moc_kw'].sum()
+    zuzycie_szczyt_sys = moc[mask_szczyt_sys].sum()
     # Kategoria wg progów (uproszczone)
     if zuzycie_szczyt_sys <= 100_000:
         kategoria = 'K1'
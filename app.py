@@ -6,9 +6,15 @@ Uruchomienie:
     streamlit run app.py
 """
 
+import dataclasses
+import hashlib
 import os
-import base64
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import MappingProxyType
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 
 from kalkulator_oferta import (
@@ -23,8 +29,9 @@ from kalkulator_oferta import (
 )
 from generuj_raport import create_report_bytes
 from generuj_formularz_klienta import create_intake_form_bytes
-from baza_cen import BazaCen
+from baza_cen import BazaCen, DB_PATH
 from auth import AuthManager
+from config import ConfigManager
 from panel_admina import page_panel_admina
 from analiza_faktury import parsuj_fakture, analizuj_fakture, mapuj_na_dane_klienta
 from analiza_profilu import parsuj_profil_mocy, analiza_profilu, mapuj_profil_na_dane
@@ -34,6 +41,7 @@ from kalkulator_profil import (
     get_bess_soc_data,
 )
 from fonty_b64 import STERLING_BOOK, STERLING_REGULAR, STERLING_MEDIUM
+from logo_b64 import LOGO_SVG
 
 # ============================================================
 # CONFIG
@@ -44,21 +52,92 @@ st.set_page_config(
     layout='centered',
 )
 
+
+@st.cache_resource
+def _auth_manager() -> AuthManager:
+    """Jedna instancja AuthManager na proces (bezstanowa — tylko ścieżka do bazy)."""
+    return AuthManager()
+
+
+@st.cache_resource
+def _minify_css(css: str) -> str:
+    """Usuwa komentarze i zbędne białe znaki z CSS (raz na proces dla danego źródła)."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+@st.cache_resource
+def _minify_js(js: str) -> str:
+    """Usuwa komentarze liniowe, wcięcia i puste linie z JS (nowe linie zostają)."""
+    lines = []
+    for line in js.splitlines():
+        line = re.sub(r'\s+//[^\'"\n]*$', '', line).strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+# Formatery metryk — wzorzec formatu związany raz, wywoływany jak funkcja
+_FMT_KW = '{:,.0f} kW'.format
+_FMT_KWH = '{:,.0f} kWh'.format
+_FMT_PLN = '{:,.0f} PLN'.format
+_FMT_PCT = '{:.1%}'.format
+_FMT_PROC = '{:.1f}%'.format
+
+
 # ============================================================
 # LOGIN PAGE
 # ============================================================
+@st.fragment
+def _login_page():
+    """Formularz logowania — reruny przy logowaniu nie obejmują CSS ani animacji."""
+    col_l, col_c, col_r = st.columns([1, 1.5, 1])
+    with col_c:
+        st.markdown("""
+        <div style="text-align:center; margin-top: 28vh;">
+            <h2 style="color:#FF6A39; font-family:'Sterling','Segoe UI',sans-serif; text-shadow:0 0 10px rgba(255,106,57,0.3); margin-bottom:4px;">
+                KALKULATOR ENERGII
+            </h2>
+            <p style="color:#BEBEBE; font-family:'Sterling','Segoe UI',sans-serif; font-size:0.8rem; opacity:0.7; margin-bottom:24px;">
+                [ AUTORYZACJA WYMAGANA ]
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        with st.form('login_form', clear_on_submit=False, border=False):
+            login_input = st.text_input('Login', key='login_input', placeholder='login')
+            haslo_input = st.text_input('Password', type='password', key='haslo_input', placeholder='password')
+            submitted = st.form_submit_button('ZALOGUJ', use_container_width=True)
+        if submitted:
+            user = _auth_manager().authenticate(login_input, haslo_input)
+            if user:
+                st.session_state['zalogowany'] = True
+                st.session_state['username'] = user['username']
+                st.session_state['rola'] = user['rola']
+                st.rerun(scope='app')
+            else:
+                st.error('Nieprawidlowy login lub haslo.')
+
+
 if 'zalogowany' not in st.session_state:
     st.session_state['zalogowany'] = False
 
 if not st.session_state['zalogowany']:
     # Ukryj sidebar na stronie logowania
-    st.markdown("""
+    _LOGIN_CSS = """
     <style>
+    :root {
+        --sh-font: 'Sterling', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        --sh-orange: #FF6A39;
+        --sh-green: #18332F;
+    }
     [data-testid="stSidebar"] { display: none; }
     .stApp > header { display: none; }
     .block-container { padding-top: 0 !important; max-width: 100% !important; }
     .stApp {
-        background: #18332F !important;
+        background: var(--sh-green) !important;
         overflow: hidden;
     }
 
@@ -68,7 +147,9 @@ if not st.session_state['zalogowany']:
         top: 0; left: 0;
         width: 100vw; height: 100vh;
         z-index: 0;
+        pointer-events: none;
     }
+    .block-container { position: relative; z-index: 1; }
 
     /* Login box */
     .login-box {
@@ -77,7 +158,7 @@ if not st.session_state['zalogowany']:
         transform: translate(-50%, -50%);
         z-index: 10;
         background: rgba(24, 51, 47, 0.92);
-        border: 1px solid #FF6A39;
+        border: 1px solid var(--sh-orange);
         border-radius: 12px;
         padding: 40px 36px 32px 36px;
         width: 360px;
@@ -85,15 +166,15 @@ if not st.session_state['zalogowany']:
         text-align: center;
     }
     .login-box h2 {
-        color: #FF6A39;
-        font-family: 'Sterling', 'Segoe UI', sans-serif;
+        color: var(--sh-orange);
+        font-family: var(--sh-font);
         margin-bottom: 8px;
         font-size: 1.6rem;
         text-shadow: 0 0 10px rgba(255, 106, 57, 0.3);
     }
     .login-box .subtitle {
         color: #BEBEBE;
-        font-family: 'Sterling', 'Segoe UI', sans-serif;
+        font-family: var(--sh-font);
         font-size: 0.8rem;
         margin-bottom: 24px;
         opacity: 0.7;
@@ -102,22 +183,22 @@ if not st.session_state['zalogowany']:
     /* Streamlit inputs styling for login */
     .login-container input {
         background: rgba(24, 51, 47, 0.9) !important;
-        border: 1px solid #FF6A39 !important;
+        border: 1px solid var(--sh-orange) !important;
         color: white !important;
-        font-family: 'Sterling', 'Segoe UI', sans-serif !important;
+        font-family: var(--sh-font) !important;
     }
     .login-container input:focus {
-        border-color: #FF6A39 !important;
+        border-color: var(--sh-orange) !important;
         box-shadow: 0 0 8px rgba(255, 106, 57, 0.3) !important;
     }
     .login-container label {
         color: #BEBEBE !important;
-        font-family: 'Sterling', 'Segoe UI', sans-serif !important;
+        font-family: var(--sh-font) !important;
     }
     .login-container button {
-        background-color: #FF6A39 !important;
+        background-color: var(--sh-orange) !important;
         color: white !important;
-        font-family: 'Sterling', 'Segoe UI', sans-serif !important;
+        font-family: var(--sh-font) !important;
         font-weight: bold !important;
         border: none !important;
         width: 100% !important;
@@ -132,25 +213,38 @@ if not st.session_state['zalogowany']:
     }
     .login-container .stAlert p { color: #f66 !important; }
     </style>
+    """
 
-    <canvas id="matrix-bg"></canvas>
-
+    _MATRIX_JS = """
     <script>
-    // Matrix rain animation
+    // Matrix rain animation — skrypt działa w iframe komponentu, rysuje na
+    // canvasie w dokumencie rodzica, więc przetrwa reruny Streamlita.
     (function() {
-        const canvas = document.getElementById('matrix-bg');
-        if (!canvas) return;
+        const win = window.parent;
+        const doc = win.document;
+        if (win.__matrixRain) return;  // pętla już działa
+        win.__matrixRain = true;
+
+        const canvas = doc.createElement('canvas');
+        canvas.id = 'matrix-bg';
+        (doc.querySelector('.stApp') || doc.body).prepend(canvas);
         const ctx = canvas.getContext('2d');
 
         function resize() {
-            canvas.width = window.innerWidth;
-            canvas.height = window.innerHeight;
+            canvas.width = win.innerWidth;
+            canvas.height = win.innerHeight;
         }
         resize();
-        window.addEventListener('resize', resize);
+        win.addEventListener('resize', resize);
 
         const fontSize = 16;
         const cols = Math.floor(canvas.width / fontSize);
+        const frameMs = 33;         // ~30 fps wystarcza dla deszczu cyfr
+        const typingPauseMs = 300;  // pauza animacji po naciśnięciu klawisza
+        // Wygaszanie śladu: co klatkę tylko co fadeGroups-ta kolumna, z alfą
+        // skumulowaną tak, by tempo zanikania było takie jak przy pełnej klatce
+        const fadeGroups = 4;
+        const fadeStyle = 'rgba(24, 51, 47, ' + (1 - Math.pow(1 - 0.06, fadeGroups)).toFixed(3) + ')';
 
         // Each column: position, speed, direction
         const columns = [];
@@ -164,22 +258,52 @@ if not st.session_state['zalogowany']:
 
         const chars = '0123456789';
 
-        function draw() {
-            ctx.fillStyle = 'rgba(24, 51, 47, 0.06)';
-            ctx.fillRect(0, 0, canvas.width, canvas.height);
+        // xorshift32 — tańszy od Math.random() w pętli rysowania
+        const U32 = 4294967296;
+        const FLASH_T = 0.97 * U32;
+        const FLIP_T = 0.998 * U32;
+        let prng = (Date.now() | 0) || 1;
+        function rand() {
+            prng ^= prng << 13;
+            prng ^= prng >>> 17;
+            prng ^= prng << 5;
+            return prng >>> 0;
+        }
+
+        let rafId = null;
+        let lastTs = 0;
+        let typingUntil = 0;
+        let frame = 0;
+
+        function onKeydown() {
+            typingUntil = win.performance.now() + typingPauseMs;
+        }
+        doc.addEventListener('keydown', onKeydown, true);
+
+        function draw(ts) {
+            rafId = win.requestAnimationFrame(draw);
+            // Ukryta karta, pisanie w polach logowania lub limit 30 fps — pomiń klatkę
+            if (doc.hidden || ts < typingUntil || ts - lastTs < frameMs) return;
+            lastTs = ts;
+
+            ctx.fillStyle = fadeStyle;
+            for (let i = frame % fadeGroups; i < cols; i += fadeGroups) {
+                ctx.fillRect(i * fontSize, 0, fontSize, canvas.height);
+            }
+            frame++;
 
             ctx.font = fontSize + 'px Courier New';
 
             for (let i = 0; i < cols; i++) {
                 const col = columns[i];
-                const ch = chars[Math.floor(Math.random() * chars.length)];
+                const ch = chars[rand() % 10];
 
                 // Head character — bright green
-                const r = 255, g = 106 + Math.floor(Math.random() * 40), b = 57;
+                const r = 255, g = 106 + rand() % 40, b = 57;
                 ctx.fillStyle = 'rgba(' + r + ', ' + g + ', ' + b + ', 0.8)';
 
                 // Occasional bright flash
-                if (Math.random() > 0.97) {
+                if (rand() > FLASH_T) {
                     ctx.fillStyle = '#fff';
                 }
 
@@ -192,50 +316,51 @@ if not st.session_state['zalogowany']:
                 // Wrap around
                 if (col.dir > 0 && col.y > canvas.height + fontSize) {
                     col.y = -fontSize;
-                    col.speed = 0.5 + Math.random() * 2.5;
+                    col.speed = 0.5 + rand() / U32 * 2.5;
                 } else if (col.dir < 0 && col.y < -fontSize) {
                     col.y = canvas.height + fontSize;
-                    col.speed = 0.5 + Math.random() * 2.5;
+                    col.speed = 0.5 + rand() / U32 * 2.5;
                 }
 
                 // Rare direction change
-                if (Math.random() > 0.998) {
+                if (rand() > FLIP_T) {
                     col.dir *= -1;
                 }
             }
-            requestAnimationFrame(draw);
         }
-        draw();
+
+        function onVisibility() {
+            if (!doc.hidden && rafId === null) {
+                rafId = win.requestAnimationFrame(draw);
+            }
+        }
+        doc.addEventListener('visibilitychange', onVisibility);
+
+        // Po zalogowaniu Streamlit usuwa iframe — zatrzymaj pętlę, usuń canvas
+        // i odepnij listenery z dokumentu rodzica
+        window.addEventListener('pagehide', function() {
+            win.cancelAnimationFrame(rafId);
+            rafId = null;
+            canvas.remove();
+            win.removeEventListener('resize', resize);
+            doc.removeEventListener('keydown', onKeydown, true);
+            doc.removeEventListener('visibilitychange', onVisibility);
+            win.__matrixRain = false;
+        });
+
+        rafId = win.requestAnimationFrame(draw);
     })();
     </script>
-    """, unsafe_allow_html=True)
+    """
+
+    st.markdown(_minify_css(_LOGIN_CSS), unsafe_allow_html=True)
+    # Animacja w komponencie HTML (iframe) — st.markdown nie wykonuje <script>,
+    # a niezmieniony iframe nie jest montowany od nowa przy kolejnych rerunach.
+    components.html(_minify_js(_MATRIX_JS), height=0)
 
     # Login form (Streamlit widgets over the Matrix background)
     st.markdown('<div class="login-container">', unsafe_allow_html=True)
-    col_l, col_c, col_r = st.columns([1, 1.5, 1])
-    with col_c:
-        st.markdown("""
-        <div style="text-align:center; margin-top: 28vh;">
-            <h2 style="color:#FF6A39; font-family:'Sterling','Segoe UI',sans-serif; text-shadow:0 0 10px rgba(255,106,57,0.3); margin-bottom:4px;">
-                KALKULATOR ENERGII
-            </h2>
-            <p style="color:#BEBEBE; font-family:'Sterling','Segoe UI',sans-serif; font-size:0.8rem; opacity:0.7; margin-bottom:24px;">
-                [ AUTORYZACJA WYMAGANA ]
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        login_input = st.text_input('Login', key='login_input', placeholder='login')
-        haslo_input = st.text_input('Password', type='password', key='haslo_input', placeholder='password')
-        if st.button('ZALOGUJ', use_container_width=True):
-            auth = AuthManager()
-            user = auth.authenticate(login_input, haslo_input)
-            if user:
-                st.session_state['zalogowany'] = True
-                st.session_state['username'] = user['username']
-                st.session_state['rola'] = user['rola']
-                st.rerun()
-            else:
-                st.error('Nieprawidlowy login lub haslo.')
+    _login_page()
     st.markdown('</div>', unsafe_allow_html=True)
 
     st.stop()
@@ -244,32 +369,46 @@ if not st.session_state['zalogowany']:
 # RESPONSIVE CSS
 # ============================================================
 # Font Sterling — base64 embedded
-_font_css = (
-    "<style>"
-    "@font-face { font-family: 'Sterling'; "
-    f"src: url('data:font/opentype;base64,{STERLING_BOOK}') format('opentype'); "
-    "font-weight: 300; font-style: normal; } "
-    "@font-face { font-family: 'Sterling'; "
-    f"src: url('data:font/opentype;base64,{STERLING_REGULAR}') format('opentype'); "
-    "font-weight: 400; font-style: normal; } "
-    "@font-face { font-family: 'Sterling'; "
-    f"src: url('data:font/opentype;base64,{STERLING_MEDIUM}') format('opentype'); "
-    "font-weight: 500; font-style: normal; } "
-    "</style>"
-)
-st.markdown(_font_css, unsafe_allow_html=True)
+@st.cache_resource
+def _font_css_str() -> str:
+    """Składa CSS z @font-face (base64) raz na proces."""
+    faces = ''.join(
+        f"@font-face {{ font-family: 'Sterling'; "
+        f"src: url('data:font/opentype;base64,{b64}') format('opentype'); "
+        f"font-weight: {weight}; font-style: normal; }} "
+        for b64, weight in (
+            (STERLING_BOOK, 300),
+            (STERLING_REGULAR, 400),
+            (STERLING_MEDIUM, 500),
+        )
+    )
+    return f'<style>{faces}</style>'
+
+
+# Streamlit usuwa elementy niewyemitowane w danym przebiegu, więc CSS fontów
+# musi trafić na stronę przy każdym rerunie — cache'ujemy tylko jego złożenie.
+st.markdown(_font_css_str(), unsafe_allow_html=True)
 
-st.markdown("""
+_APP_CSS = """
 <style>
 /* ============================================
    SUN HELP Brand Design System
    Based on Sunhelp_prezentacja_wzor_2026.pptx
    ============================================ */
 
+/* Zmienne marki — font i kolory w jednym miejscu */
+:root {
+    --sh-font: 'Sterling', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    --sh-orange: #FF6A39;
+    --sh-green: #18332F;
+    --sh-sand: #F0EEEA;
+    --sh-grey: #AEB0B1;
+}
+
 /* Globalny font — wykluczamy ikony */
 html, body, [class*="css"], .stMarkdown, .stText, p, div, h1, h2, h3, h4, h5, h6,
 input, textarea, select, button, label, td, th, li, a {
-    font-family: 'Sterling', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
+    font-family: var(--sh-font) !important;
 }
 /* Przywróć font ikon */
 [data-testid="stIcon"], svg, .material-icons, [class*="icon"], [class*="Icon"],
@@ -280,16 +419,16 @@ span[data-baseweb], [data-testid="stExpanderToggleIcon"],
 
 /* ---------- SIDEBAR ---------- */
 [data-testid="stSidebar"] {
-    background-color: #18332F;
+    background-color: var(--sh-green);
 }
 [data-testid="stSidebar"] * {
-    color: #F0EEEA !important;
+    color: var(--sh-sand) !important;
 }
 [data-testid="stSidebar"] .stRadio label span {
-    color: #F0EEEA !important;
+    color: var(--sh-sand) !important;
 }
 [data-testid="stSidebar"] .stRadio label[data-checked="true"] span {
-    color: #FF6A39 !important;
+    color: var(--sh-orange) !important;
     font-weight: 500;
 }
 [data-testid="stSidebar"] hr {
@@ -299,8 +438,8 @@ span[data-baseweb], [data-testid="stExpanderToggleIcon"],
 /* ---------- PAGE HEADERS ---------- */
 /* Ciemne nagłówki — styl prezentacji (tytuł na ciemnym tle) */
 h1 {
-    color: #F0EEEA !important;
-    background: #18332F;
+    color: var(--sh-sand) !important;
+    background: var(--sh-green);
     padding: 20px 28px !important;
     border-radius: 10px;
     margin-bottom: 24px !important;
@@ -309,21 +448,21 @@ h1 {
     font-size: 1.8rem !important;
 }
 h2 {
-    color: #18332F !important;
+    color: var(--sh-green) !important;
     font-weight: 400 !important;
     font-size: 1.35rem !important;
     padding-bottom: 8px;
-    border-bottom: 2px solid #FF6A39;
+    border-bottom: 2px solid var(--sh-orange);
     margin-top: 20px !important;
     margin-bottom: 16px !important;
 }
 h3 {
-    color: #18332F !important;
+    color: var(--sh-green) !important;
     font-weight: 500 !important;
     font-size: 1.1rem !important;
 }
 h4 {
-    color: #18332F !important;
+    color: var(--sh-green) !important;
     font-weight: 500 !important;
     font-size: 1rem !important;
 }
@@ -332,7 +471,7 @@ h4 {
 [data-testid="stMetric"] {
     background: #ffffff;
     border: 1px solid #e8e6e2;
-    border-left: 4px solid #FF6A39;
+    border-left: 4px solid var(--sh-orange);
     border-radius: 8px;
     padding: 16px 20px;
     box-shadow: 0 1px 4px rgba(24, 51, 47, 0.06);
@@ -342,19 +481,19 @@ h4 {
     box-shadow: 0 3px 12px rgba(24, 51, 47, 0.1);
 }
 [data-testid="stMetric"] label {
-    color: #AEB0B1 !important;
+    color: var(--sh-grey) !important;
     font-weight: 500 !important;
     font-size: 0.8rem !important;
     text-transform: uppercase;
     letter-spacing: 0.04em;
 }
 [data-testid="stMetric"] [data-testid="stMetricValue"] {
-    color: #18332F !important;
+    color: var(--sh-green) !important;
     font-weight: 400 !important;
     font-size: 1.5rem !important;
 }
 [data-testid="stMetric"] [data-testid="stMetricDelta"] {
-    color: #FF6A39 !important;
+    color: var(--sh-orange) !important;
 }
 
 /* ---------- EXPANDERS ---------- */
@@ -369,11 +508,11 @@ h4 {
     background: #f7f6f4 !important;
     padding: 14px 20px !important;
     font-weight: 500 !important;
-    color: #18332F !important;
+    color: var(--sh-green) !important;
     transition: background 0.2s ease;
 }
 [data-testid="stExpander"] summary:hover {
-    background: #f0eeea !important;
+    background: var(--sh-sand) !important;
 }
 [data-testid="stExpander"] [data-testid="stExpanderDetails"] {
     padding: 16px 20px !important;
@@ -389,8 +528,8 @@ h4 {
     letter-spacing: 0.01em;
 }
 .stButton > button[kind="primary"], .stDownloadButton > button {
-    background-color: #FF6A39 !important;
-    border-color: #FF6A39 !important;
+    background-color: var(--sh-orange) !important;
+    border-color: var(--sh-orange) !important;
     color: white !important;
 }
 .stButton > button[kind="primary"]:hover, .stDownloadButton > button:hover {
@@ -401,12 +540,12 @@ h4 {
 }
 .stButton > button[kind="secondary"] {
     background-color: transparent !important;
-    border: 1.5px solid #18332F !important;
-    color: #18332F !important;
+    border: 1.5px solid var(--sh-green) !important;
+    color: var(--sh-green) !important;
 }
 .stButton > button[kind="secondary"]:hover {
-    background-color: #18332F !important;
-    color: #F0EEEA !important;
+    background-color: var(--sh-green) !important;
+    color: var(--sh-sand) !important;
 }
 
 /* ---------- TABS ---------- */
@@ -417,16 +556,16 @@ h4 {
 .stTabs [data-baseweb="tab"] {
     padding: 10px 24px !important;
     font-weight: 500 !important;
-    color: #AEB0B1 !important;
+    color: var(--sh-grey) !important;
     border-bottom: 3px solid transparent;
     transition: all 0.2s ease;
 }
 .stTabs [data-baseweb="tab"]:hover {
-    color: #18332F !important;
+    color: var(--sh-green) !important;
 }
 .stTabs [aria-selected="true"] {
-    color: #18332F !important;
-    border-bottom-color: #FF6A39 !important;
+    color: var(--sh-green) !important;
+    border-bottom-color: var(--sh-orange) !important;
 }
 
 /* ---------- INPUTS ---------- */
@@ -437,7 +576,7 @@ h4 {
     transition: border-color 0.2s ease, box-shadow 0.2s ease;
 }
 .stTextInput input:focus, .stNumberInput input:focus, .stTextArea textarea:focus {
-    border-color: #FF6A39 !important;
+    border-color: var(--sh-orange) !important;
     box-shadow: 0 0 0 2px rgba(255, 106, 57, 0.15) !important;
 }
 
@@ -450,13 +589,13 @@ h4 {
 
 /* ---------- ALERTS ---------- */
 .stAlert [data-testid="stNotificationContentInfo"] {
-    border-left-color: #18332F !important;
+    border-left-color: var(--sh-green) !important;
 }
 .stAlert [data-testid="stNotificationContentSuccess"] {
     border-left-color: #2ecc71 !important;
 }
 .stAlert [data-testid="stNotificationContentWarning"] {
-    border-left-color: #FF6A39 !important;
+    border-left-color: var(--sh-orange) !important;
 }
 
 /* ---------- DIVIDER ---------- */
@@ -472,6 +611,32 @@ hr {
     padding: 8px 0;
 }
 
+/* ---------- TABELE PROFILU (heatmapa, top szczyty) ---------- */
+.heatmapa {
+    overflow-x: auto;
+    font-size: 0.8rem;
+}
+.heatmapa table {
+    border-collapse: collapse;
+}
+.heatmapa th, .heatmapa td {
+    padding: 4px 6px;
+    text-align: right;
+}
+table.szczyty {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 0.85rem;
+}
+table.szczyty th, table.szczyty td {
+    padding: 6px 10px;
+    border-bottom: 1px solid #e8e6e2;
+    text-align: right;
+}
+table.szczyty th:first-child, table.szczyty td:first-child {
+    text-align: left;
+}
+
 /* ---------- MOBILE RESPONSIVE ---------- */
 @media (max-width: 768px) {
     /* Nagłówek strony */
@@ -549,163 +714,167 @@ hr {
     }
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_minify_css(_APP_CSS), unsafe_allow_html=True)
 
 # ============================================================
 # NAVIGATION
 # ============================================================
-_rola = st.session_state.get('rola', 'guest')
-
-if _rola == 'guest':
-    PAGES = [
+_PAGES_BY_ROLE = {
+    'guest': (
         'Dane klienta',
         'Analiza & Rekomendacje',
-    ]
-elif _rola == 'admin':
-    PAGES = [
+    ),
+    'handlowiec': (
         'Dane klienta',
         'Analiza & Rekomendacje',
         'Finansowanie',
         'Generuj ofertę',
         'Baza cen',
-        'Panel admina',
-    ]
-else:
-    PAGES = [
+    ),
+    'admin': (
         'Dane klienta',
         'Analiza & Rekomendacje',
         'Finansowanie',
         'Generuj ofertę',
         'Baza cen',
-    ]
+        'Panel admina',
+    ),
+}
 
-# Logo w sidebarze
-_logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logo.svg')
-with open(_logo_path, 'r') as _f:
-    _svg = _f.read()
-_b64 = base64.b64encode(_svg.encode()).decode()
-st.sidebar.markdown(
-    f'<div style="text-align:center;padding:18px 0 8px 0;">'
-    f'<img src="data:image/svg+xml;base64,{_b64}" width="160">'
-    f'</div>',
-    unsafe_allow_html=True,
-)
+_rola = st.session_state.get('rola', 'guest')
+_ROLE_IMPORTU = frozenset({'admin', 'handlowiec'})  # role z dostępem do importu faktur/profili
+PAGES = _PAGES_BY_ROLE.get(_rola, _PAGES_BY_ROLE['guest'])
+
+_DEMO_DATA = MappingProxyType({
+    'nazwa_firmy': 'Przykładowy Zakład Produkcyjny Sp. z o.o.',
+    'nip': '1234567890',
+    'branza': 'Produkcja metalowa',
+    'dni_pracy': 'Pn-Pt',
+    'godziny_pracy': '6:00-22:00 (2 zmiany)',
+    'roczne_zuzycie_ee_kwh': 800_000.0,
+    'moc_umowna_kw': 350.0,
+    'moc_przylaczeniowa_kw': 400.0,
+    'grupa_taryfowa': 'C22a',
+    'osd': 'Tauron',
+    'sredni_rachunek_ee_mies_pln': 55_000.0,
+    'cena_ee_pln_kwh': 0.68,
+    'oplata_dystr_pln_kwh': 0.27,
+    'oplata_mocowa_pln_mwh': 219.40,
+    'kategoria_mocowa': 'K3',
+    'data_konca_umowy_ee': '2026-09-30',
+    'typ_umowy_ee': 'FIX',
+    'roczne_zuzycie_gaz_kwh': 200_000.0,
+    'sredni_rachunek_gaz_mies_pln': 8_000.0,
+    'cena_gaz_pln_kwh': 0.28,
+    'data_konca_umowy_gaz': '2026-12-31',
+    'ma_pv': True,
+    'moc_pv_kwp': 200.0,
+    'roczna_produkcja_pv_kwh': 210_000.0,
+    'autokonsumpcja_pv_procent': 35.0,
+    'ma_kmb': False,
+    'moc_bierna_kvar': 0.0,
+    'ma_agregat': False,
+    'potrzebuje_go': True,
+    'powierzchnia_dachu_m2': 800.0,
+    'wspolczynnik_cos_phi': 0.85,
+})
 
-st.sidebar.markdown(
+
+def _load_demo():
+    """Ładuje dane demo do session_state."""
+    st.session_state.update(_DEMO_DATA)
+
+
+def _logout():
+    """Czyści dane sesji użytkownika (callback przycisku Wyloguj)."""
+    for key in ('zalogowany', 'username', 'rola'):
+        st.session_state.pop(key, None)
+
+
+# Logo w sidebarze (base64 wygenerowany przez bake_assets.py)
+_SIDEBAR_HEADER_HTML = (
+    f'<div style="text-align:center;padding:18px 0 8px 0;">'
+    f'<img src="data:image/svg+xml;base64,{LOGO_SVG}" width="160">'
+    f'</div>'
     '<p style="text-align:center;color:#AEB0B1 !important;font-size:0.7rem;'
     'letter-spacing:0.12em;text-transform:uppercase;margin:0 0 16px 0;">'
-    'Kalkulator Ofertowy</p>',
-    unsafe_allow_html=True,
+    'Kalkulator Ofertowy</p>'
+    '<hr>'
+)
+_SIDEBAR_USER_HTML = (
+    '<div style="margin-top:16px;padding:12px 16px;background:rgba(255,255,255,0.06);'
+    'border-radius:8px;">'
+    '<span style="color:#AEB0B1 !important;font-size:0.7rem;text-transform:uppercase;'
+    'letter-spacing:0.05em;">Zalogowano jako</span><br>'
+    '<span style="color:#F0EEEA !important;font-weight:500;">{username}</span>'
+    '<span style="color:#AEB0B1 !important;font-size:0.8rem;"> &middot; {rola}</span>'
+    '</div>'
 )
 
-st.sidebar.markdown('---')
+st.sidebar.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
 page = st.sidebar.radio('Nawigacja', PAGES)
 
 st.sidebar.markdown('---')
 
 # Demo button
-if st.sidebar.button('Załaduj dane DEMO', use_container_width=True):
-    st.session_state['demo'] = True
-    st.rerun()
+st.sidebar.button('Załaduj dane DEMO', on_click=_load_demo, use_container_width=True)
 
 # Zalogowany user info + wyloguj
 _username = st.session_state.get('username', '')
 st.sidebar.markdown(
-    f'<div style="margin-top:16px;padding:12px 16px;background:rgba(255,255,255,0.06);'
-    f'border-radius:8px;">'
-    f'<span style="color:#AEB0B1 !important;font-size:0.7rem;text-transform:uppercase;'
-    f'letter-spacing:0.05em;">Zalogowano jako</span><br>'
-    f'<span style="color:#F0EEEA !important;font-weight:500;">{_username}</span>'
-    f'<span style="color:#AEB0B1 !important;font-size:0.8rem;"> &middot; {_rola}</span>'
-    f'</div>',
+    _SIDEBAR_USER_HTML.format(username=_username, rola=_rola),
     unsafe_allow_html=True,
 )
-if st.sidebar.button('Wyloguj', use_container_width=True):
-    for key in ['zalogowany', 'username', 'rola']:
-        st.session_state.pop(key, None)
-    st.rerun()
-
-
-def _load_demo():
-    """Ładuje dane demo do session_state."""
-    d = {
-        'nazwa_firmy': 'Przykładowy Zakład Produkcyjny Sp. z o.o.',
-        'nip': '1234567890',
-        'branza': 'Produkcja metalowa',
-        'dni_pracy': 'Pn-Pt',
-        'godziny_pracy': '6:00-22:00 (2 zmiany)',
-        'roczne_zuzycie_ee_kwh': 800_000.0,
-        'moc_umowna_kw': 350.0,
-        'moc_przylaczeniowa_kw': 400.0,
-        'grupa_taryfowa': 'C22a',
-        'osd': 'Tauron',
-        'sredni_rachunek_ee_mies_pln': 55_000.0,
-        'cena_ee_pln_kwh': 0.68,
-        'oplata_dystr_pln_kwh': 0.27,
-        'oplata_mocowa_pln_mwh': 219.40,
-        'kategoria_mocowa': 'K3',
-        'data_konca_umowy_ee': '2026-09-30',
-        'typ_umowy_ee': 'FIX',
-        'roczne_zuzycie_gaz_kwh': 200_000.0,
-        'sredni_rachunek_gaz_mies_pln': 8_000.0,
-        'cena_gaz_pln_kwh': 0.28,
-        'data_konca_umowy_gaz': '2026-12-31',
-        'ma_pv': True,
-        'moc_pv_kwp': 200.0,
-        'roczna_produkcja_pv_kwh': 210_000.0,
-        'autokonsumpcja_pv_procent': 35.0,
-        'ma_kmb': False,
-        'moc_bierna_kvar': 0.0,
-        'ma_agregat': False,
-        'potrzebuje_go': True,
-        'powierzchnia_dachu_m2': 800.0,
-        'wspolczynnik_cos_phi': 0.85,
-    }
-    for k, v in d.items():
-        st.session_state[k] = v
+st.sidebar.button('Wyloguj', on_click=_logout, use_container_width=True)
+
+
+# (klucz session_state / pole DaneKlienta, wartość domyślna)
+_DANE_FIELDS = (
+    ('nazwa_firmy', ''),
+    ('nip', ''),
+    ('branza', ''),
+    ('dni_pracy', 'Pn-Pt'),
+    ('godziny_pracy', ''),
+    ('roczne_zuzycie_ee_kwh', 0.0),
+    ('moc_umowna_kw', 0.0),
+    ('moc_przylaczeniowa_kw', 0.0),
+    ('grupa_taryfowa', 'C22a'),
+    ('osd', 'Tauron'),
+    ('sredni_rachunek_ee_mies_pln', 0.0),
+    ('cena_ee_pln_kwh', 0.65),
+    ('oplata_dystr_pln_kwh', 0.25),
+    ('oplata_mocowa_pln_mwh', 219.40),
+    ('kategoria_mocowa', 'K3'),
+    ('data_konca_umowy_ee', ''),
+    ('typ_umowy_ee', 'FIX'),
+    ('roczne_zuzycie_gaz_kwh', 0.0),
+    ('sredni_rachunek_gaz_mies_pln', 0.0),
+    ('cena_gaz_pln_kwh', 0.25),
+    ('data_konca_umowy_gaz', ''),
+    ('ma_pv', False),
+    ('moc_pv_kwp', 0.0),
+    ('roczna_produkcja_pv_kwh', 0.0),
+    ('autokonsumpcja_pv_procent', 0.0),
+    ('ma_kmb', False),
+    ('moc_bierna_kvar', 0.0),
+    ('ma_agregat', False),
+    ('potrzebuje_go', False),
+    ('powierzchnia_dachu_m2', 0.0),
+    ('wspolczynnik_cos_phi', 0.85),
+)
 
 
-if st.session_state.pop('demo', False):
-    _load_demo()
+@st.cache_resource(max_entries=8)
+def _build_dane_cached(key: tuple) -> DaneKlienta:
+    return DaneKlienta(**dict(zip((k for k, _ in _DANE_FIELDS), key)))
 
 
 def _get_dane() -> DaneKlienta:
-    """Buduje DaneKlienta z session_state."""
+    """Buduje DaneKlienta z session_state (ta sama instancja dopóki dane się nie zmienią)."""
     s = st.session_state
-    return DaneKlienta(
-        nazwa_firmy=s.get('nazwa_firmy', ''),
-        nip=s.get('nip', ''),
-        branza=s.get('branza', ''),
-        dni_pracy=s.get('dni_pracy', 'Pn-Pt'),
-        godziny_pracy=s.get('godziny_pracy', ''),
-        roczne_zuzycie_ee_kwh=s.get('roczne_zuzycie_ee_kwh', 0.0),
-        moc_umowna_kw=s.get('moc_umowna_kw', 0.0),
-        moc_przylaczeniowa_kw=s.get('moc_przylaczeniowa_kw', 0.0),
-        grupa_taryfowa=s.get('grupa_taryfowa', 'C22a'),
-        osd=s.get('osd', 'Tauron'),
-        sredni_rachunek_ee_mies_pln=s.get('sredni_rachunek_ee_mies_pln', 0.0),
-        cena_ee_pln_kwh=s.get('cena_ee_pln_kwh', 0.65),
-        oplata_dystr_pln_kwh=s.get('oplata_dystr_pln_kwh', 0.25),
-        oplata_mocowa_pln_mwh=s.get('oplata_mocowa_pln_mwh', 219.40),
-        kategoria_mocowa=s.get('kategoria_mocowa', 'K3'),
-        data_konca_umowy_ee=s.get('data_konca_umowy_ee', ''),
-        typ_umowy_ee=s.get('typ_umowy_ee', 'FIX'),
-        roczne_zuzycie_gaz_kwh=s.get('roczne_zuzycie_gaz_kwh', 0.0),
-        sredni_rachunek_gaz_mies_pln=s.get('sredni_rachunek_gaz_mies_pln', 0.0),
-        cena_gaz_pln_kwh=s.get('cena_gaz_pln_kwh', 0.25),
-        data_konca_umowy_gaz=s.get('data_konca_umowy_gaz', ''),
-        ma_pv=s.get('ma_pv', False),
-        moc_pv_kwp=s.get('moc_pv_kwp', 0.0),
-        roczna_produkcja_pv_kwh=s.get('roczna_produkcja_pv_kwh', 0.0),
-        autokonsumpcja_pv_procent=s.get('autokonsumpcja_pv_procent', 0.0),
-        ma_kmb=s.get('ma_kmb', False),
-        moc_bierna_kvar=s.get('moc_bierna_kvar', 0.0),
-        ma_agregat=s.get('ma_agregat', False),
-        potrzebuje_go=s.get('potrzebuje_go', False),
-        powierzchnia_dachu_m2=s.get('powierzchnia_dachu_m2', 0.0),
-        wspolczynnik_cos_phi=s.get('wspolczynnik_cos_phi', 0.85),
-    )
+    return _build_dane_cached(tuple(s.get(k, d) for k, d in _DANE_FIELDS))
 
 
 def _dane_ready() -> bool:
@@ -714,39 +883,112 @@ def _dane_ready() -> bool:
     return bool(s.get('nazwa_firmy')) and s.get('roczne_zuzycie_ee_kwh', 0) > 0
 
 
+def _klucz_pliku(plik) -> bytes:
+    """Krótki skrót zawartości pliku — klucz cache zamiast hashowania całych bajtów.
+
+    Przyjmuje strumień (UploadedFile), który po odczycie jest przewijany na początek.
+    """
+    klucz = hashlib.file_digest(plik, lambda: hashlib.blake2b(digest_size=16)).digest()
+    plik.seek(0)
+    return klucz
+
+
+def _klucz_uploadu(plik, prefiks: str) -> bytes:
+    """Klucz cache dla UploadedFile — liczony raz na plik (file_id), nie przy każdym rerunie."""
+    s = st.session_state
+    if s.get(f'_{prefiks}_file_id') != plik.file_id:
+        s[f'_{prefiks}_klucz'] = _klucz_pliku(plik)
+        s[f'_{prefiks}_file_id'] = plik.file_id
+    return s[f'_{prefiks}_klucz']
+
+
+# Parametry z prefiksem '_' nie są hashowane przez st.cache_data — kluczem jest skrót
+@st.cache_data(max_entries=16, show_spinner=False)
+def _parsuj_fakture_cached(klucz: bytes, _pdf):
+    _pdf.seek(0)
+    return parsuj_fakture(_pdf)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _analizuj_fakture_cached(klucz: bytes, _dane_faktury):
+    return analizuj_fakture(_dane_faktury)
+
+
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """Wspólna pula wątków do parsowania dużych plików w tle."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+def _parsuj_i_analizuj_profil(xls_bytes: bytes, nazwa: str) -> tuple:
+    profil = parsuj_profil_mocy(xls_bytes, nazwa)
+    return profil, analiza_profilu(profil)
+
+
+def _zadanie_profilu(plik, klucz: bytes) -> Future:
+    """Zadanie parsowania profilu w tle — jedno na plik, trzymane w session_state."""
+    zadanie = st.session_state.get('_xls_zadanie')
+    if zadanie is None or zadanie[0] != klucz:
+        fut = _executor().submit(_parsuj_i_analizuj_profil, plik.getvalue(), plik.name)
+        zadanie = st.session_state['_xls_zadanie'] = (klucz, fut)
+    return zadanie[1]
+
+
+@st.fragment(run_every=0.5)
+def _czekaj_na_profil():
+    """Odpytuje zadanie parsowania; po jego zakończeniu przeładowuje stronę."""
+    if st.session_state['_xls_zadanie'][1].done():
+        st.rerun()
+    st.info('Parsuję profil mocy...')
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _heatmapa_html(klucz: int, _heatmapa: pd.DataFrame) -> str:
+    """Heatmapa jako gotowy HTML — Styler liczy gradient raz, nie przy każdym rerunie."""
+    styl = _heatmapa.style.background_gradient(cmap='YlOrRd', axis=None).format('{:.0f}')
+    return f'<div class="heatmapa">{styl.to_html()}</div>'
+
+
 # ============================================================
 # PAGE 1: DANE KLIENTA
 # ============================================================
+_IKONY_PRIORYTETU = {'wysoki': '🔴', 'sredni': '🟡', 'niski': '🟢'}
+
+
 def page_dane_klienta():
     st.markdown('<h1>Dane klienta</h1>', unsafe_allow_html=True)
 
-    # --- Analiza rachunku za energię (PDF) — tylko admin/handlowiec ---
-    if _rola in ('admin', 'handlowiec'):
+    # --- Import z plików (PDF, XLS/XLSX) — tylko admin/handlowiec ---
+    if _rola in _ROLE_IMPORTU:
+        # --- Analiza rachunku za energię (PDF) ---
         with st.expander('Analiza rachunku za energię (PDF)'):
             uploaded_pdf = st.file_uploader(
                 'Wybierz fakturę PDF', type=['pdf'], key='faktura_pdf',
             )
             if uploaded_pdf is not None:
-                pdf_bytes = uploaded_pdf.read()
+                # Parser czyta bezpośrednio z bufora uploadera — bez kopii bajtów
+                klucz_pdf = _klucz_uploadu(uploaded_pdf, 'pdf')
                 with st.spinner('Analizuję fakturę...'):
-                    dane_faktury = parsuj_fakture(pdf_bytes)
-                del pdf_bytes  # zwolnij pamięć
+                    dane_faktury = _parsuj_fakture_cached(klucz_pdf, uploaded_pdf)
 
                 # --- Odczytane dane ---
                 st.markdown('#### Odczytane dane')
                 col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f'**Taryfa:** {dane_faktury.taryfa or "—"}')
-                    st.markdown(f'**OSD:** {dane_faktury.osd or "—"}')
-                    st.markdown(f'**Moc umowna:** {dane_faktury.moc_umowna_kw:.0f} kW' if dane_faktury.moc_umowna_kw > 0 else '**Moc umowna:** —')
-                    st.markdown(f'**PPE:** {dane_faktury.ppe or "—"}')
-                    st.markdown(f'**Nr faktury:** {dane_faktury.nr_faktury or "—"}')
-                with col2:
-                    st.markdown(f'**Zużycie:** {dane_faktury.zuzycie_calkowite_kwh:,.0f} kWh' if dane_faktury.zuzycie_calkowite_kwh > 0 else '**Zużycie:** —')
-                    st.markdown(f'**Cena energii:** {dane_faktury.cena_energii_pln_kwh:.4f} PLN/kWh' if dane_faktury.cena_energii_pln_kwh > 0 else '**Cena energii:** —')
-                    st.markdown(f'**Kwota netto:** {dane_faktury.kwota_netto_pln:,.2f} PLN' if dane_faktury.kwota_netto_pln > 0 else '**Kwota netto:** —')
-                    st.markdown(f'**Typ:** {dane_faktury.typ_faktury}')
-                    st.markdown(f'**Okres:** {dane_faktury.okres_od} – {dane_faktury.okres_do}' if dane_faktury.okres_od else '**Okres:** —')
+                # Jedna wiadomość markdown na kolumnę (twarde łamanie linii: "  \n")
+                col1.markdown('  \n'.join((
+                    f'**Taryfa:** {dane_faktury.taryfa or "—"}',
+                    f'**OSD:** {dane_faktury.osd or "—"}',
+                    f'**Moc umowna:** {dane_faktury.moc_umowna_kw:.0f} kW' if dane_faktury.moc_umowna_kw > 0 else '**Moc umowna:** —',
+                    f'**PPE:** {dane_faktury.ppe or "—"}',
+                    f'**Nr faktury:** {dane_faktury.nr_faktury or "—"}',
+                )))
+                col2.markdown('  \n'.join((
+                    f'**Zużycie:** {dane_faktury.zuzycie_calkowite_kwh:,.0f} kWh' if dane_faktury.zuzycie_calkowite_kwh > 0 else '**Zużycie:** —',
+                    f'**Cena energii:** {dane_faktury.cena_energii_pln_kwh:.4f} PLN/kWh' if dane_faktury.cena_energii_pln_kwh > 0 else '**Cena energii:** —',
+                    f'**Kwota netto:** {dane_faktury.kwota_netto_pln:,.2f} PLN' if dane_faktury.kwota_netto_pln > 0 else '**Kwota netto:** —',
+                    f'**Typ:** {dane_faktury.typ_faktury}',
+                    f'**Okres:** {dane_faktury.okres_od} – {dane_faktury.okres_do}' if dane_faktury.okres_od else '**Okres:** —',
+                )))
 
                 # Wskaźnik pewności
                 if dane_faktury.pewnosc < 0.30:
@@ -764,13 +1006,15 @@ def page_dane_klienta():
                 # --- Analiza optymalizacji ---
                 st.markdown('---')
                 st.markdown('#### Analiza optymalizacji (bezkosztowa)')
-                analiza = analizuj_fakture(dane_faktury)
+                analiza = _analizuj_fakture_cached(klucz_pdf, dane_faktury)
 
                 if analiza.rekomendacje:
-                    for rek in analiza.rekomendacje:
-                        ikona = '🔴' if rek.priorytet == 'wysoki' else '🟡' if rek.priorytet == 'sredni' else '🟢'
-                        st.markdown(f'- {ikona} **{rek.tytul}** — szac. oszczędność: **{rek.oszczednosc_roczna_pln:,.0f} PLN/rok**')
-                        st.caption(rek.opis)
+                    st.markdown('\n'.join(
+                        f'- {_IKONY_PRIORYTETU.get(rek.priorytet, "🟢")} **{rek.tytul}** — '
+                        f'szac. oszczędność: **{rek.oszczednosc_roczna_pln:,.0f} PLN/rok**  \n'
+                        f'  <small style="color:var(--sh-grey);">{rek.opis}</small>'
+                        for rek in analiza.rekomendacje
+                    ), unsafe_allow_html=True)
                     st.metric(
                         'Łączna potencjalna oszczędność',
                         f'{analiza.laczna_oszczednosc_roczna_pln:,.0f} PLN/rok',
@@ -793,8 +1037,7 @@ def page_dane_klienta():
                     'Nie jest zapisywany na dysku ani przesyłany do zewnętrznych serwisów.'
                 )
 
-    # --- Profil mocy godzinowej (XLS/XLSX) — tylko admin/handlowiec ---
-    if _rola in ('admin', 'handlowiec'):
+        # --- Profil mocy godzinowej (XLS/XLSX) ---
         with st.expander('Profil mocy godzinowej (XLS/XLSX)'):
             uploaded_xls = st.file_uploader(
                 'Wgraj plik z mocami godzinowymi (SKADEN)',
@@ -802,16 +1045,16 @@ def page_dane_klienta():
                 key='profil_mocy_xls',
             )
             if uploaded_xls is not None:
-                xls_bytes = uploaded_xls.read()
-                with st.spinner('Parsuję profil mocy...'):
-                    try:
-                        profil = parsuj_profil_mocy(xls_bytes, uploaded_xls.name)
-                        wynik_analizy = analiza_profilu(profil)
-                    except Exception as e:
-                        st.error(f'Błąd parsowania: {e}')
-                        profil = None
-                        wynik_analizy = None
-                del xls_bytes
+                # Parsowanie w tle — reszta formularza pozostaje responsywna
+                fut = _zadanie_profilu(uploaded_xls, _klucz_uploadu(uploaded_xls, 'xls'))
+                profil = None
+                wynik_analizy = None
+                if not fut.done():
+                    _czekaj_na_profil()
+                elif fut.exception() is not None:
+                    st.error(f'Błąd parsowania: {fut.exception()}')
+                else:
+                    profil, wynik_analizy = fut.result()
 
                 if profil is not None and wynik_analizy is not None:
                     # Zapisz do session_state
@@ -823,56 +1066,37 @@ def page_dane_klienta():
                     st.markdown('#### Statystyki profilu')
                     stats = wynik_analizy['statystyki']
                     c1, c2 = st.columns(2)
-                    c1.metric('P max', f'{stats["p_max_kw"]:,.0f} kW')
-                    c2.metric('P średnia', f'{stats["p_srednia_kw"]:,.0f} kW')
+                    c1.metric('P max', _FMT_KW(stats['p_max_kw']))
+                    c2.metric('P średnia', _FMT_KW(stats['p_srednia_kw']))
                     c1, c2 = st.columns(2)
-                    c1.metric('Zużycie roczne', f'{stats["zuzycie_roczne_kwh"]:,.0f} kWh')
-                    c2.metric('Load factor', f'{stats["load_factor"]:.1%}')
+                    c1.metric('Zużycie roczne', _FMT_KWH(stats['zuzycie_roczne_kwh']))
+                    c2.metric('Load factor', _FMT_PCT(stats['load_factor']))
 
-                    if profil.taryfa:
-                        st.markdown(f'**Taryfa:** {profil.taryfa}')
-                    if profil.firma:
-                        st.markdown(f'**Firma:** {profil.firma}')
+                    meta = [f'**{etykieta}:** {wartosc}' for etykieta, wartosc in (
+                        ('Taryfa', profil.taryfa), ('Firma', profil.firma),
+                    ) if wartosc]
+                    if meta:
+                        st.markdown('  \n'.join(meta))
 
                     # Profil dobowy
                     st.markdown('#### Średni profil dobowy (kW)')
-                    pd_dobowy = wynik_analizy['profil_dobowy']
-                    df_dobowy = pd.DataFrame({
-                        'Godzina': list(pd_dobowy.keys()),
-                        'kW': list(pd_dobowy.values()),
-                    })
-                    st.bar_chart(df_dobowy.set_index('Godzina'))
+                    st.bar_chart(wynik_analizy['profil_dobowy'])
 
                     # Profil miesięczny
                     st.markdown('#### Zużycie miesięczne (kWh)')
-                    pd_mies = wynik_analizy['profil_miesieczny']
-                    nazwy_mies = {
-                        1: 'Sty', 2: 'Lut', 3: 'Mar', 4: 'Kwi', 5: 'Maj', 6: 'Cze',
-                        7: 'Lip', 8: 'Sie', 9: 'Wrz', 10: 'Paź', 11: 'Lis', 12: 'Gru',
-                    }
-                    df_mies = pd.DataFrame({
-                        'Miesiąc': [nazwy_mies.get(k, k) for k in pd_mies.keys()],
-                        'kWh': list(pd_mies.values()),
-                    })
-                    st.bar_chart(df_mies.set_index('Miesiąc'))
+                    st.bar_chart(wynik_analizy['profil_miesieczny'])
 
                     # Rozkład strefowy
                     st.markdown('#### Rozkład strefowy')
                     rs = wynik_analizy['rozklad_strefowy']
                     c1, c2, c3 = st.columns(3)
-                    c1.metric('Szczyt', f'{rs["szczyt_pct"]:.1f}%')
-                    c2.metric('Pozaszczyt', f'{rs["pozaszczyt_pct"]:.1f}%')
-                    c3.metric('Noc', f'{rs["noc_pct"]:.1f}%')
+                    c1.metric('Szczyt', _FMT_PROC(rs['szczyt_pct']))
+                    c2.metric('Pozaszczyt', _FMT_PROC(rs['pozaszczyt_pct']))
+                    c3.metric('Noc', _FMT_PROC(rs['noc_pct']))
 
                     # Top 10 szczytów
                     st.markdown('#### Top 10 szczytów')
-                    st.dataframe(
-                        wynik_analizy['top_szczyty'].rename(
-                            columns={'datetime': 'Data/godzina', 'moc_kw': 'Moc (kW)'}
-                        ),
-                        use_container_width=True,
-                        hide_index=True,
-                    )
+                    st.markdown(wynik_analizy['top_szczyty_html'], unsafe_allow_html=True)
 
                     # Przycisk wypełnienia formularza
                     if st.button(
@@ -983,6 +1207,28 @@ def page_dane_klienta():
 # ============================================================
 # PAGE 2: ANALIZA & REKOMENDACJE
 # ============================================================
+@st.cache_data(max_entries=8, show_spinner=False)
+def _rekomendacje_cached(klucz: bytes, _dane: DaneKlienta) -> tuple:
+    return (
+        oblicz_rekomendacje_ee(_dane),
+        oblicz_rekomendacje_pv(_dane),
+        oblicz_rekomendacje_bess(_dane),
+        oblicz_rekomendacje_dsr(_dane),
+        oblicz_rekomendacje_kmb(_dane),
+    )
+
+
+def _klucz_dane(dane: DaneKlienta) -> bytes:
+    """Skrót danych klienta i parametrów konfiguracji — klucz cache wyników kalkulatora."""
+    stan = (dataclasses.astuple(dane), ConfigManager().get_all())
+    return hashlib.blake2b(repr(stan).encode(), digest_size=16).digest()
+
+
+def _rekomendacje(dane: DaneKlienta) -> tuple:
+    """Rekomendacje (ee, pv, bess, dsr, kmb) — przeliczane tylko po zmianie danych lub konfiguracji."""
+    return _rekomendacje_cached(_klucz_dane(dane), dane)
+
+
 def page_analiza():
     st.markdown('<h1>Analiza & Rekomendacje</h1>', unsafe_allow_html=True)
 
@@ -996,24 +1242,16 @@ def page_analiza():
     profil_obj = st.session_state.get('profil_obiekt')
     uzyto_profilu = False
 
-    rek_ee = oblicz_rekomendacje_ee(dane)
-    rek_dsr = oblicz_rekomendacje_dsr(dane)
-    rek_kmb = oblicz_rekomendacje_kmb(dane)
+    rek_ee, rek_pv_std, rek_bess_std, rek_dsr, rek_kmb = _rekomendacje(dane)
+    rek_bess, rek_pv = rek_bess_std, rek_pv_std
 
     if profil_obj is not None:
         try:
             rek_bess = oblicz_rekomendacje_bess_z_profilem(dane, profil_obj)
             rek_pv = oblicz_rekomendacje_pv_z_profilem(dane, profil_obj)
-            # Zachowaj standardowe do porównania
-            rek_bess_std = oblicz_rekomendacje_bess(dane)
-            rek_pv_std = oblicz_rekomendacje_pv(dane)
             uzyto_profilu = True
         except Exception:
-            rek_bess = oblicz_rekomendacje_bess(dane)
-            rek_pv = oblicz_rekomendacje_pv(dane)
-    else:
-        rek_bess = oblicz_rekomendacje_bess(dane)
-        rek_pv = oblicz_rekomendacje_pv(dane)
+            rek_bess, rek_pv = rek_bess_std, rek_pv_std
 
     if uzyto_profilu:
         st.success('Kalkulacje oparte na rzeczywistym profilu mocy godzinowej')
@@ -1054,17 +1292,17 @@ def page_analiza():
 
     # Metryki – 2x2 grid (lepiej na mobile niż 4 w rzędzie)
     col1, col2 = st.columns(2)
-    col1.metric('Łączny CAPEX', f'{capex_total:,.0f} PLN')
-    col2.metric('Oszczędność roczna', f'{oszcz_total:,.0f} PLN')
+    col1.metric('Łączny CAPEX', _FMT_PLN(capex_total))
+    col2.metric('Oszczędność roczna', _FMT_PLN(oszcz_total))
     col1, col2 = st.columns(2)
     col1.metric('Okres zwrotu', f'{okres_zw:.1f} lat')
     col2.metric('Redukcja kosztów', f'{redukcja:.0f}%')
 
     # Wykres oszczędności
     st.subheader('Struktura oszczędności rocznych')
-    df_oszcz = pd.DataFrame(oszcz_items, columns=['Źródło', 'PLN/rok'])
-    df_oszcz = df_oszcz[df_oszcz['PLN/rok'] > 0]
-    st.bar_chart(df_oszcz.set_index('Źródło'))
+    s_oszcz = pd.Series({k: v for k, v in oszcz_items if v > 0}, name='PLN/rok', dtype=float)
+    s_oszcz.index.name = 'Źródło'
+    st.bar_chart(s_oszcz)
 
     # Szczegóły produktów
     with st.expander('Kontrakt na energię elektryczną', expanded=True):
@@ -1134,19 +1372,17 @@ def page_analiza():
             st.markdown('#### Heatmapa zużycia (dzień tygodnia x godzina)')
             heatmapa = wa.get('heatmapa')
             if heatmapa is not None:
-                st.dataframe(
-                    heatmapa.style.background_gradient(cmap='YlOrRd', axis=None).format('{:.0f}'),
-                    use_container_width=True,
-                )
+                klucz = int(pd.util.hash_pandas_object(heatmapa).sum())
+                st.markdown(_heatmapa_html(klucz, heatmapa), unsafe_allow_html=True)
 
             # Rekomendacja mocy umownej
             st.markdown('#### Rekomendacja mocy umownej')
             rek_mu = wa['rekomendacja_moc_umowna']
             obecna_mu = dane.moc_umowna_kw
             c1, c2, c3 = st.columns(3)
-            c1.metric('P max (profil)', f'{rek_mu["p_max_kw"]:,.0f} kW')
-            c2.metric('Percentyl 99.5%', f'{rek_mu["percentyl_995_kw"]:,.0f} kW')
-            c3.metric('Rekomendacja', f'{rek_mu["rekomendacja_kw"]:,.0f} kW')
+            c1.metric('P max (profil)', _FMT_KW(rek_mu['p_max_kw']))
+            c2.metric('Percentyl 99.5%', _FMT_KW(rek_mu['percentyl_995_kw']))
+            c3.metric('Rekomendacja', _FMT_KW(rek_mu['rekomendacja_kw']))
 
             if obecna_mu > 0:
                 roznica = obecna_mu - rek_mu['rekomendacja_kw']
@@ -1169,7 +1405,7 @@ def page_analiza():
             km = wa['kategoria_mocowa']
             st.metric(
                 'Zużycie w szczycie systemowym (XI-III, 17-19, Pn-Pt)',
-                f'{km["zuzycie_szczyt_systemowy_kwh"]:,.0f} kWh',
+                _FMT_KWH(km['zuzycie_szczyt_systemowy_kwh']),
             )
             st.metric('Obliczona kategoria', km['kategoria'])
 
@@ -1259,25 +1495,27 @@ def page_finansowanie():
     opcje = oblicz_opcje_finansowania(capex_total)
 
     # Tabela porównawcza
-    rows = []
-    for o in opcje:
-        rows.append({
-            'Model': o.nazwa,
-            'Wkład własny': f'{o.wklad_wlasny_procent:.0f}%',
-            'Rata/mies.': f'{o.rata_miesieczna_pln:,.0f}' if o.rata_miesieczna_pln > 0 else '-',
-            'Koszt całk.': f'{o.koszt_calkowity_pln:,.0f}' if o.koszt_calkowity_pln > 0 else '-',
-        })
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame({
+        'Model': [o.nazwa for o in opcje],
+        'Wkład własny': [f'{o.wklad_wlasny_procent:.0f}%' for o in opcje],
+        'Rata/mies.': [f'{o.rata_miesieczna_pln:,.0f}' if o.rata_miesieczna_pln > 0 else '-' for o in opcje],
+        'Koszt całk.': [f'{o.koszt_calkowity_pln:,.0f}' if o.koszt_calkowity_pln > 0 else '-' for o in opcje],
+    })
     st.dataframe(df, use_container_width=True, hide_index=True)
 
     # Wykres kosztów
     st.subheader('Porównanie kosztów całkowitych')
-    chart_data = pd.DataFrame({
-        'Model': [o.nazwa for o in opcje],
-        'Koszt całkowity (PLN)': [o.koszt_calkowity_pln for o in opcje],
-    })
-    chart_data = chart_data[chart_data['Koszt całkowity (PLN)'] > 0]
-    st.bar_chart(chart_data.set_index('Model'))
+    # Dane wykresu budowane ponownie tylko gdy zmienią się modele lub koszty
+    fin_key = (tuple(o.nazwa for o in opcje), tuple(o.koszt_calkowity_pln for o in opcje))
+    if st.session_state.get('_fin_key') != fin_key:
+        chart_data = pd.DataFrame({
+            'Model': [o.nazwa for o in opcje],
+            'Koszt całkowity (PLN)': [o.koszt_calkowity_pln for o in opcje],
+        })
+        chart_data = chart_data[chart_data['Koszt całkowity (PLN)'] > 0]
+        st.session_state['_fin_chart'] = chart_data.set_index('Model')
+        st.session_state['_fin_key'] = fin_key
+    st.bar_chart(st.session_state['_fin_chart'])
 
     # Szczegóły każdej opcji
     st.subheader('Szczegóły')
@@ -1296,6 +1534,43 @@ def page_finansowanie():
 # ============================================================
 # PAGE 4: GENERUJ OFERTĘ
 # ============================================================
+_DOC_CARD = (
+    '<div style="display:flex;align-items:center;gap:16px;padding:16px 20px;'
+    'background:#f7f6f4;border-radius:10px;margin-bottom:6px;">'
+    '<span style="font-size:2.2rem;font-weight:300;color:#18332F;line-height:1;">{num}</span>'
+    '<div><p style="font-weight:500;color:#18332F;margin:0;">{title}</p>'
+    '<p style="color:#AEB0B1;font-size:0.78rem;margin:2px 0 0 0;">{desc}</p></div></div>'
+)
+_CARD_01 = _DOC_CARD.format(
+    num='01', title='Oferta XLSX',
+    desc='7 arkuszy: podsumowanie, EE, BESS, PV/DSR/KMB, finansowanie, analiza 10-letnia',
+)
+_CARD_02 = _DOC_CARD.format(
+    num='02', title='Raport DOCX',
+    desc='Raport analityczny: PV + BESS dla zakładów produkcyjnych',
+)
+_CARD_03 = _DOC_CARD.format(
+    num='03', title='Formularz XLSX',
+    desc='Formularz zbierania danych od klienta z checklistą dokumentów',
+)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _oferta_bytes_cached(klucz: bytes, _dane: DaneKlienta) -> bytes:
+    return generuj_oferte_bytes(_dane)
+
+
+# Raport i formularz nie zależą od danych klienta — generowane raz na proces
+@st.cache_resource(show_spinner=False)
+def _raport_bytes() -> bytes:
+    return create_report_bytes()
+
+
+@st.cache_resource(show_spinner=False)
+def _formularz_bytes() -> bytes:
+    return create_intake_form_bytes()
+
+
 def page_generuj():
     st.markdown('<h1>Generuj ofertę</h1>', unsafe_allow_html=True)
 
@@ -1313,22 +1588,11 @@ def page_generuj():
     )
 
     # --- Document cards — vertical layout (mobile-friendly) ---
-    _doc_card = (
-        '<div style="display:flex;align-items:center;gap:16px;padding:16px 20px;'
-        'background:#f7f6f4;border-radius:10px;margin-bottom:6px;">'
-        '<span style="font-size:2.2rem;font-weight:300;color:#18332F;line-height:1;">{num}</span>'
-        '<div><p style="font-weight:500;color:#18332F;margin:0;">{title}</p>'
-        '<p style="color:#AEB0B1;font-size:0.78rem;margin:2px 0 0 0;">{desc}</p></div></div>'
-    )
-
     # 01 — Oferta XLSX
-    st.markdown(_doc_card.format(
-        num='01', title='Oferta XLSX',
-        desc='7 arkuszy: podsumowanie, EE, BESS, PV/DSR/KMB, finansowanie, analiza 10-letnia',
-    ), unsafe_allow_html=True)
+    st.markdown(_CARD_01, unsafe_allow_html=True)
     if st.button('Generuj ofertę', use_container_width=True, key='gen_oferta'):
         with st.spinner('Generowanie oferty...'):
-            data = generuj_oferte_bytes(dane)
+            data = _oferta_bytes_cached(_klucz_dane(dane), dane)
         st.download_button(
             label='Pobierz XLSX',
             data=data,
@@ -1338,13 +1602,10 @@ def page_generuj():
         )
 
     # 02 — Raport DOCX
-    st.markdown(_doc_card.format(
-        num='02', title='Raport DOCX',
-        desc='Raport analityczny: PV + BESS dla zakładów produkcyjnych',
-    ), unsafe_allow_html=True)
+    st.markdown(_CARD_02, unsafe_allow_html=True)
     if st.button('Generuj raport', use_container_width=True, key='gen_raport'):
         with st.spinner('Generowanie raportu...'):
-            data = create_report_bytes()
+            data = _raport_bytes()
         st.download_button(
             label='Pobierz DOCX',
             data=data,
@@ -1354,13 +1615,10 @@ def page_generuj():
         )
 
     # 03 — Formularz XLSX
-    st.markdown(_doc_card.format(
-        num='03', title='Formularz XLSX',
-        desc='Formularz zbierania danych od klienta z checklistą dokumentów',
-    ), unsafe_allow_html=True)
+    st.markdown(_CARD_03, unsafe_allow_html=True)
     if st.button('Generuj formularz', use_container_width=True, key='gen_form'):
         with st.spinner('Generowanie formularza...'):
-            data = create_intake_form_bytes()
+            data = _formularz_bytes()
         st.download_button(
             label='Pobierz XLSX',
             data=data,
@@ -1373,207 +1631,260 @@ def page_generuj():
 # ============================================================
 # PAGE 5: BAZA CEN
 # ============================================================
+# Streamlit Cloud (brak Chrome/Selenium) — wykrywane raz przy imporcie modułu
+_IS_CLOUD = bool(os.environ.get('STREAMLIT_SHARING_MODE')) or os.path.exists('/home/appuser')
+
+
+# Odczyty z bazy cen memoizowane między rerunami — każda interakcja z widgetem
+# nie otwiera już połączenia SQLite ani nie powtarza read_sql.
+@st.cache_resource
+def _baza_cen(db_path: str = DB_PATH) -> BazaCen:
+    """Jedna instancja BazaCen (i jej połączenie SQLite) na proces."""
+    return BazaCen(db_path)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_pobierz_ostatnie(db_path: str, n: int, rynek: str = 'RDB') -> pd.DataFrame:
+    return _baza_cen(db_path).pobierz_ostatnie(n, rynek)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_pobierz_ceny(db_path: str, data_od: str, data_do: str,
+                         rynek: str = 'RDB') -> pd.DataFrame:
+    return _baza_cen(db_path).pobierz_ceny(data_od, data_do, rynek)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_pobierz_agregaty(db_path: str, data_od: str, data_do: str, ziarno: str,
+                             rynek: str = 'RDB') -> pd.DataFrame:
+    return _baza_cen(db_path).pobierz_agregaty(data_od, data_do, ziarno, rynek)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_profil_godzinowy(db_path: str, data_od: str, data_do: str,
+                             rynek: str = 'RDB') -> pd.DataFrame:
+    return _baza_cen(db_path).profil_godzinowy(data_od, data_do, rynek)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_statystyki_panel(db_path: str, rynek: str = 'RDB') -> dict:
+    return _baza_cen(db_path).statystyki_panel((30, 7), rynek)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_pobierz_logi(db_path: str, limit: int = 20) -> pd.DataFrame:
+    return _baza_cen(db_path).pobierz_logi(limit)
+
+
+_CACHE_BAZY_CEN = (
+    _cached_pobierz_ostatnie, _cached_pobierz_ceny, _cached_pobierz_agregaty,
+    _cached_profil_godzinowy, _cached_statystyki_panel, _cached_pobierz_logi,
+)
+
+
+def _wyczysc_cache_cen():
+    """Unieważnia odczyty bazy cen po zapisie (scraping / import)."""
+    for f in _CACHE_BAZY_CEN:
+        f.clear()
+
+
 def page_baza_cen():
     st.markdown('<h1>Baza cen TGE RDB</h1>', unsafe_allow_html=True)
 
-    db = BazaCen()
+    sciezka = DB_PATH
+    db = _baza_cen(sciezka)
 
+    # Leniwe zakładki — kod (i zapytania) wykonuje tylko otwarta zakładka
     tab1, tab2, tab3, tab4 = st.tabs([
         'Ostatnie ceny', 'Wykres historyczny', 'Statystyki', 'Import / Scraping'
-    ])
+    ], key='baza_cen_zakladka', on_change='rerun')
 
     # --- Tab 1: Ostatnie ceny ---
     with tab1:
-        st.subheader('Ostatnie ceny 15-minutowe')
-        n_rec = st.selectbox('Liczba rekordów', [96, 192, 288, 672],
-                             format_func=lambda x: f'{x} ({x // 4}h)')
-        df = db.pobierz_ostatnie(n_rec)
-        if df.empty:
-            st.info('Brak danych w bazie. Użyj zakładki "Import / Scraping" aby dodać ceny.')
-        else:
-            col1, col2, col3 = st.columns(3)
-            col1.metric('Rekordów', len(df))
-            col2.metric('Śr. cena', f'{df["cena_pln_mwh"].mean():.2f} PLN/MWh')
-            col3.metric('Śr. cena', f'{df["cena_pln_kwh"].mean():.4f} PLN/kWh')
-
-            st.dataframe(
-                df[['timestamp_start', 'timestamp_end', 'cena_pln_mwh', 'cena_pln_kwh', 'wolumen']].rename(
-                    columns={
-                        'timestamp_start': 'Od',
-                        'timestamp_end': 'Do',
-                        'cena_pln_mwh': 'PLN/MWh',
-                        'cena_pln_kwh': 'PLN/kWh',
-                        'wolumen': 'Wolumen',
-                    }
-                ),
-                use_container_width=True,
-                hide_index=True,
-            )
+        if tab1.open:
+            st.subheader('Ostatnie ceny 15-minutowe')
+            n_rec = st.selectbox('Liczba rekordów', [96, 192, 288, 672],
+                                 format_func=lambda x: f'{x} ({x // 4}h)')
+            df = _cached_pobierz_ostatnie(sciezka, n_rec)
+            if df.empty:
+                st.info('Brak danych w bazie. Użyj zakładki "Import / Scraping" aby dodać ceny.')
+            else:
+                col1, col2, col3 = st.columns(3)
+                col1.metric('Rekordów', len(df))
+                col2.metric('Śr. cena', f'{df["cena_pln_mwh"].mean():.2f} PLN/MWh')
+                col3.metric('Śr. cena', f'{df["cena_pln_kwh"].mean():.4f} PLN/kWh')
+
+                st.dataframe(
+                    df[['timestamp_start', 'timestamp_end', 'cena_pln_mwh', 'cena_pln_kwh', 'wolumen']].rename(
+                        columns={
+                            'timestamp_start': 'Od',
+                            'timestamp_end': 'Do',
+                            'cena_pln_mwh': 'PLN/MWh',
+                            'cena_pln_kwh': 'PLN/kWh',
+                            'wolumen': 'Wolumen',
+                        }
+                    ),
+                    use_container_width=True,
+                    hide_index=True,
+                )
 
     # --- Tab 2: Wykres historyczny ---
     with tab2:
-        st.subheader('Wykres cen historycznych')
-        col1, col2 = st.columns(2)
-        from datetime import datetime, timedelta
-        default_od = (datetime.now() - timedelta(days=7)).date()
-        default_do = datetime.now().date()
-        data_od = col1.date_input('Od', value=default_od)
-        data_do = col2.date_input('Do', value=default_do)
-
-        data_do_query = (data_do + timedelta(days=1)).strftime('%Y-%m-%d')
-        df_hist = db.pobierz_ceny(
-            data_od.strftime('%Y-%m-%d'), data_do_query
-        )
+        if tab2.open:
+            st.subheader('Wykres cen historycznych')
+            col1, col2 = st.columns(2)
+            default_od = (datetime.now() - timedelta(days=7)).date()
+            default_do = datetime.now().date()
+            data_od = col1.date_input('Od', value=default_od)
+            data_do = col2.date_input('Do', value=default_do)
+
+            data_do_query = (data_do + timedelta(days=1)).strftime('%Y-%m-%d')
+            # Dłuższe zakresy z tabel agregatów — mniej punktów do wykresu
+            dni = (data_do - data_od).days
+            if dni <= 7:
+                tytul = 'Ceny 15-minutowe (PLN/MWh)'
+                df_hist = _cached_pobierz_ceny(
+                    sciezka, data_od.strftime('%Y-%m-%d'), data_do_query
+                )
+            else:
+                ziarno, tytul = (('1h', 'Średnie godzinowe (PLN/MWh)') if dni <= 90
+                                 else ('1d', 'Średnie dobowe (PLN/MWh)'))
+                df_hist = _cached_pobierz_agregaty(
+                    sciezka, data_od.strftime('%Y-%m-%d'), data_do_query, ziarno
+                )
 
-        if df_hist.empty:
-            st.info('Brak danych dla wybranego zakresu dat.')
-        else:
-            # Wykres liniowy cen
-            st.markdown('#### Ceny 15-minutowe (PLN/MWh)')
-            chart_df = df_hist.set_index('timestamp_start')[['cena_pln_mwh']]
-            chart_df.columns = ['PLN/MWh']
-            st.line_chart(chart_df)
-
-            # Profil godzinowy
-            st.markdown('#### Średni profil godzinowy')
-            profil = db.profil_godzinowy(
-                data_od.strftime('%Y-%m-%d'), data_do_query
-            )
-            if not profil.empty:
-                profil_chart = profil.set_index('godzina')[['srednia_cena_pln_mwh']]
-                profil_chart.columns = ['Śr. PLN/MWh']
-                st.bar_chart(profil_chart)
+            if df_hist.empty:
+                st.info('Brak danych dla wybranego zakresu dat.')
+            else:
+                # Wykres liniowy cen
+                st.markdown(f'#### {tytul}')
+                chart_df = df_hist.set_index('timestamp_start')[['cena_pln_mwh']]
+                chart_df.columns = ['PLN/MWh']
+                st.line_chart(chart_df)
+
+                # Profil godzinowy
+                st.markdown('#### Średni profil godzinowy')
+                profil = _cached_profil_godzinowy(
+                    sciezka, data_od.strftime('%Y-%m-%d'), data_do_query
+                )
+                if not profil.empty:
+                    profil_chart = profil.set_index('godzina')[['srednia_cena_pln_mwh']]
+                    profil_chart.columns = ['Śr. PLN/MWh']
+                    st.bar_chart(profil_chart)
 
     # --- Tab 3: Statystyki ---
     with tab3:
-        st.subheader('Statystyki cenowe')
-        total = db.liczba_rekordow()
-        st.metric('Łączna liczba rekordów w bazie', total)
-
-        if total > 0:
-            st.markdown('---')
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown('**Ostatnie 30 dni**')
-                avg30 = db.srednia_rdb(30)
-                avg30k = db.srednia_rdb_kwh(30)
-                spr30 = db.spread_sredni_kwh(30)
-                if avg30 is not None:
-                    st.metric('Średnia RDB', f'{avg30:.2f} PLN/MWh')
-                    st.metric('Średnia RDB', f'{avg30k:.4f} PLN/kWh')
-                if spr30 is not None:
-                    st.metric('Średni spread dzienny', f'{spr30:.4f} PLN/kWh')
-
-            with col2:
-                st.markdown('**Ostatnie 7 dni**')
-                avg7 = db.srednia_rdb(7)
-                avg7k = db.srednia_rdb_kwh(7)
-                spr7 = db.spread_sredni_kwh(7)
-                if avg7 is not None:
-                    st.metric('Średnia RDB', f'{avg7:.2f} PLN/MWh')
-                    st.metric('Średnia RDB', f'{avg7k:.4f} PLN/kWh')
-                if spr7 is not None:
-                    st.metric('Średni spread dzienny', f'{spr7:.4f} PLN/kWh')
-
-            # Logi scrapera
-            st.markdown('---')
-            st.markdown('**Ostatnie uruchomienia scrapera**')
-            logi = db.pobierz_logi(10)
-            if not logi.empty:
-                st.dataframe(logi, use_container_width=True, hide_index=True)
-            else:
-                st.caption('Brak logów.')
+        if tab3.open:
+            st.subheader('Statystyki cenowe')
+            # Jedno zapytanie o średnie (30 i 7 dni) + jedno o dzienne spready
+            panel = _cached_statystyki_panel(sciezka)
+            total = panel['liczba_rekordow']
+            st.metric('Łączna liczba rekordów w bazie', total)
+
+            if total > 0:
+                st.markdown('---')
+                for col, (dni, stat) in zip(st.columns(2), panel['okresy'].items()):
+                    with col:
+                        st.markdown(f'**Ostatnie {dni} dni**')
+                        if stat['srednia_pln_mwh'] is not None:
+                            st.metric('Średnia RDB', f'{stat["srednia_pln_mwh"]:.2f} PLN/MWh')
+                            st.metric('Średnia RDB', f'{stat["srednia_pln_kwh"]:.4f} PLN/kWh')
+                        if stat['spread_sredni_kwh'] is not None:
+                            st.metric('Średni spread dzienny', f'{stat["spread_sredni_kwh"]:.4f} PLN/kWh')
+
+                # Logi scrapera
+                st.markdown('---')
+                st.markdown('**Ostatnie uruchomienia scrapera**')
+                logi = _cached_pobierz_logi(sciezka, 10)
+                if not logi.empty:
+                    st.dataframe(logi, use_container_width=True, hide_index=True)
+                else:
+                    st.caption('Brak logów.')
 
     # --- Tab 4: Import / Scraping ---
     with tab4:
-        st.subheader('Import danych')
+        if tab4.open:
+            st.subheader('Import danych')
 
-        # Wykryj Streamlit Cloud (brak Chrome/Selenium)
-        _is_cloud = os.environ.get('STREAMLIT_SHARING_MODE') or os.path.exists('/home/appuser')
+            # Ręczny scraping — tylko lokalnie
+            if not _IS_CLOUD:
+                st.markdown('#### Scraping z TGE')
+                st.caption(
+                    'Uruchom scraper, aby pobrać najnowsze ceny z TGE RDB. '
+                    'Wymaga zainstalowanego Chrome i selenium.'
+                )
+                scrape_date = st.date_input('Data sesji', value=datetime.now().date(),
+                                            key='scrape_date')
+                if st.button('Uruchom scraper', use_container_width=True):
+                    with st.spinner('Pobieram ceny z TGE...'):
+                        try:
+                            from scraper_tge import ScraperTGE
+                            with ScraperTGE(headless=True) as scraper:
+                                ceny = scraper.pobierz_ceny_rdb(scrape_date.strftime('%Y-%m-%d'))
+
+                            if ceny:
+                                rekordy = [{
+                                    'timestamp_start': c.timestamp_start,
+                                    'timestamp_end': c.timestamp_end,
+                                    'cena_pln_mwh': c.cena_pln_mwh,
+                                    'wolumen': c.wolumen_mwh,
+                                    'rynek': 'RDB',
+                                    'waluta': 'PLN',
+                                    'zrodlo': 'TGE_scraper',
+                                } for c in ceny]
+                                n = db.zapisz_ceny(rekordy)
+                                db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
+                                              n, 'OK', f'Scraping z UI: {n} rekordów')
+                                _wyczysc_cache_cen()
+                                st.success(f'Pobrano i zapisano {n} rekordów cenowych.')
+                            else:
+                                db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
+                                              0, 'EMPTY', 'Scraping z UI: brak danych')
+                                _wyczysc_cache_cen()
+                                st.warning('Scraper nie znalazł danych cenowych na stronie TGE.')
+                        except ImportError:
+                            st.error('Brak modułu selenium. Zainstaluj: pip install selenium webdriver-manager')
+                        except Exception as e:
+                            db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
+                                          0, 'ERROR', str(e))
+                            _wyczysc_cache_cen()
+                            st.error(f'Błąd scrapera: {e}')
+                st.divider()
+            else:
+                st.info(
+                    'Scraping TGE jest niedostępny w wersji Cloud (brak Chrome). '
+                    'Użyj importu z pliku CSV/XLSX lub synchronizuj bazę lokalnie.'
+                )
 
-        # Ręczny scraping — tylko lokalnie
-        if not _is_cloud:
-            st.markdown('#### Scraping z TGE')
+            # Upload pliku
+            st.markdown('#### Import z pliku CSV / XLSX')
             st.caption(
-                'Uruchom scraper, aby pobrać najnowsze ceny z TGE RDB. '
-                'Wymaga zainstalowanego Chrome i selenium.'
-            )
-            scrape_date = st.date_input('Data sesji', value=datetime.now().date(),
-                                        key='scrape_date')
-            if st.button('Uruchom scraper', use_container_width=True):
-                with st.spinner('Pobieram ceny z TGE...'):
-                    try:
-                        from scraper_tge import ScraperTGE
-                        with ScraperTGE(headless=True) as scraper:
-                            ceny = scraper.pobierz_ceny_rdb(scrape_date.strftime('%Y-%m-%d'))
-
-                        if ceny:
-                            rekordy = [{
-                                'timestamp_start': c.timestamp_start,
-                                'timestamp_end': c.timestamp_end,
-                                'cena_pln_mwh': c.cena_pln_mwh,
-                                'wolumen': c.wolumen_mwh,
-                                'rynek': 'RDB',
-                                'waluta': 'PLN',
-                                'zrodlo': 'TGE_scraper',
-                            } for c in ceny]
-                            n = db.zapisz_ceny(rekordy)
-                            db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
-                                          n, 'OK', f'Scraping z UI: {n} rekordów')
-                            st.success(f'Pobrano i zapisano {n} rekordów cenowych.')
-                        else:
-                            db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
-                                          0, 'EMPTY', 'Scraping z UI: brak danych')
-                            st.warning('Scraper nie znalazł danych cenowych na stronie TGE.')
-                    except ImportError:
-                        st.error('Brak modułu selenium. Zainstaluj: pip install selenium webdriver-manager')
-                    except Exception as e:
-                        db.zapisz_log('RDB', scrape_date.strftime('%Y-%m-%d'),
-                                      0, 'ERROR', str(e))
-                        st.error(f'Błąd scrapera: {e}')
-            st.divider()
-        else:
-            st.info(
-                'Scraping TGE jest niedostępny w wersji Cloud (brak Chrome). '
-                'Użyj importu z pliku CSV/XLSX lub synchronizuj bazę lokalnie.'
+                'Wymagane kolumny: timestamp_start, cena_pln_mwh. '
+                'Opcjonalne: timestamp_end (domyślnie +15 min), wolumen, waluta, zrodlo.'
             )
+            uploaded = st.file_uploader('Wybierz plik', type=['csv', 'xlsx', 'xls'])
+            if uploaded is not None:
+                if st.button('Importuj plik', use_container_width=True):
+                    with st.spinner('Importuję...'):
+                        try:
+                            # UploadedFile czytany bezpośrednio — bez pliku tymczasowego
+                            if uploaded.name.endswith('.csv'):
+                                n = db.importuj_csv(uploaded)
+                            else:
+                                n = db.importuj_xlsx(uploaded)
+
+                            db.zapisz_log('RDB', '-', n, 'OK',
+                                          f'Import z pliku {uploaded.name}: {n} rekordów')
+                            _wyczysc_cache_cen()
+                            st.success(f'Zaimportowano {n} rekordów z pliku {uploaded.name}.')
+                        except Exception as e:
+                            st.error(f'Błąd importu: {e}')
 
-        # Upload pliku
-        st.markdown('#### Import z pliku CSV / XLSX')
-        st.caption(
-            'Wymagane kolumny: timestamp_start, timestamp_end, cena_pln_mwh. '
-            'Opcjonalne: wolumen, waluta, zrodlo.'
-        )
-        uploaded = st.file_uploader('Wybierz plik', type=['csv', 'xlsx', 'xls'])
-        if uploaded is not None:
-            if st.button('Importuj plik', use_container_width=True):
-                with st.spinner('Importuję...'):
-                    try:
-                        if uploaded.name.endswith('.csv'):
-                            import io
-                            tmp_df = pd.read_csv(io.BytesIO(uploaded.read()))
-                            uploaded.seek(0)
-                            # Zapis tymczasowy
-                            import tempfile
-                            with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
-                                f.write(uploaded.read())
-                                tmp_path = f.name
-                            n = db.importuj_csv(tmp_path)
-                            os.unlink(tmp_path)
-                        else:
-                            import tempfile
-                            with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-                                f.write(uploaded.read())
-                                tmp_path = f.name
-                            n = db.importuj_xlsx(tmp_path)
-                            os.unlink(tmp_path)
-
-                        db.zapisz_log('RDB', '-', n, 'OK',
-                                      f'Import z pliku {uploaded.name}: {n} rekordów')
-                        st.success(f'Zaimportowano {n} rekordów z pliku {uploaded.name}.')
-                    except Exception as e:
-                        st.error(f'Błąd importu: {e}')
+            st.divider()
+            st.caption('Odczyty z bazy są buforowane przez 5 minut (liczniki i logi przez 1 minutę).')
+            if st.button('Wyczyść cache', key='btn_cache_cen'):
+                _wyczysc_cache_cen()
+                st.rerun()
 
 
 # ============================================================
@@ -2,19 +2,29 @@
 """
 AuthManager — zarządzanie użytkownikami w SQLite.
 
-Tabela `users` w ceny_tge.db. Hasła: sha256(salt + password).
+Tabela `users` w ceny_tge.db. Hasła: scrypt (prefiks `scrypt$`), sól jako
+surowe 16 bajtów; stare hashe sha256(salt_hex + password) są akceptowane
+i przy logowaniu przepisywane na scrypt.
 Role: admin, handlowiec, guest.
 """
 
 import hashlib
+import hmac
 import os
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ceny_tge.db')
 
+# Parametry scrypt (~16 MB pamięci na hash)
+_SCRYPT = {'n': 16384, 'r': 8, 'p': 1, 'dklen': 32}
+_PREFIKS_SCRYPT = 'scrypt$'
+
+# Minimalny odstęp między zapisami ostatnie_logowanie
+_ODSTEP_LOGOWANIA = timedelta(seconds=60)
+
 
 class AuthManager:
     """CRUD użytkowników z hashowaniem haseł."""
@@ -48,8 +58,28 @@ class AuthManager:
                 self.create_user('admin', 'admin', 'admin', _conn=conn)
 
     @staticmethod
-    def _hash_password(password: str, salt: str) -> str:
-        return hashlib.sha256((salt + password).encode()).hexdigest()
+    def _hash_password(password: str, salt: bytes | str) -> str:
+        # Nowe sole to surowe 16 bajtów (BLOB); starsze konta mają sól hex (TEXT)
+        if isinstance(salt, str):
+            salt = bytes.fromhex(salt)
+        return _PREFIKS_SCRYPT + hashlib.scrypt(
+            password.encode(), salt=salt, **_SCRYPT
+        ).hex()
+
+    @staticmethod
+    def _hash_sha256(password: str, salt: str) -> str:
+        """Stary schemat sha256(salt + password) — tylko do weryfikacji."""
+        h = hashlib.sha256(salt.encode())
+        h.update(password.encode())
+        return h.hexdigest()
+
+    @classmethod
+    def _verify_password(cls, password: str, salt: bytes | str, pw_hash: str) -> bool:
+        if pw_hash.startswith(_PREFIKS_SCRYPT):
+            wyliczony = cls._hash_password(password, salt)
+        else:
+            wyliczony = cls._hash_sha256(password, salt)
+        return hmac.compare_digest(wyliczony, pw_hash)
 
     def authenticate(self, username: str, password: str) -> Optional[dict]:
         """Zwraca dict z danymi usera lub None jeśli błąd."""
@@ -60,12 +90,23 @@ class AuthManager:
             ).fetchone()
             if row is None:
                 return None
-            if self._hash_password(password, row['salt']) != row['password_hash']:
+            if not self._verify_password(password, row['salt'], row['password_hash']):
                 return None
-            conn.execute(
-                'UPDATE users SET ostatnie_logowanie = ? WHERE id = ?',
-                (datetime.now().isoformat(), row['id']),
-            )
+            if not row['password_hash'].startswith(_PREFIKS_SCRYPT):
+                # Migracja starego hasha sha256 na scrypt (z nową solą) przy poprawnym logowaniu
+                salt = os.urandom(16)
+                conn.execute(
+                    'UPDATE users SET password_hash = ?, salt = ? WHERE id = ?',
+                    (self._hash_password(password, salt), salt, row['id']),
+                )
+            teraz = datetime.now()
+            ostatnie = row['ostatnie_logowanie']
+            # Zapis (i fsync) pomijany przy ponownym logowaniu w ciągu minuty
+            if not ostatnie or teraz - datetime.fromisoformat(ostatnie) >= _ODSTEP_LOGOWANIA:
+                conn.execute(
+                    'UPDATE users SET ostatnie_logowanie = ? WHERE id = ?',
+                    (teraz.isoformat(), row['id']),
+                )
             return dict(row)
 
     def list_users(self) -> list[dict]:
@@ -78,7 +119,7 @@ class AuthManager:
 
     def create_user(self, username: str, password: str, rola: str = 'handlowiec',
                     _conn=None) -> bool:
-        salt = os.urandom(16).hex()
+        salt = os.urandom(16)
         pw_hash = self._hash_password(password, salt)
         conn = _conn or self._conn()
         try:
@@ -114,7 +155,7 @@ class AuthManager:
             )
 
     def change_password(self, user_id: int, new_password: str):
-        salt = os.urandom(16).hex()
+        salt = os.urandom(16)
         pw_hash = self._hash_password(new_password, salt)
         with self._conn() as conn:
             conn.execute(
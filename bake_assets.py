@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Generator modułów z zasobami statycznymi zakodowanymi w base64.
+
+Kodowanie odbywa się raz, przy budowie — aplikacja importuje gotowe stałe
+zamiast czytać i kodować pliki przy starcie.
+
+- fonty_b64.py: fonty Sterling (static/*.otf)
+- logo_b64.py:  logo SunHelp (logo.svg)
+
+Użycie:
+    python3 bake_assets.py
+"""
+
+import base64
+import os
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+_FONTY = [
+    ('STERLING_BOOK', 'static/Sterling-Book.otf'),
+    ('STERLING_REGULAR', 'static/Sterling-Regular.otf'),
+    ('STERLING_MEDIUM', 'static/Sterling-Medium.otf'),
+]
+
+_LOGO = [
+    ('LOGO_SVG', 'logo.svg'),
+]
+
+
+def _b64(sciezka: str) -> str:
+    with open(os.path.join(_HERE, sciezka), 'rb') as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def zapisz_modul(nazwa_pliku: str, naglowek: str, zasoby: list[tuple[str, str]]):
+    """Zapisuje moduł Pythona ze stałymi NAZWA = "<base64>"."""
+    linie = [f'# {naglowek}']
+    linie += [f'{nazwa} = "{_b64(sciezka)}"' for nazwa, sciezka in zasoby]
+    with open(os.path.join(_HERE, nazwa_pliku), 'w') as f:
+        f.write('\n'.join(linie) + '\n')
+    print(f'Zapisano: {nazwa_pliku}')
+
+
+def main():
+    zapisz_modul('fonty_b64.py', 'Auto-generated base64 font data for Sterling', _FONTY)
+    zapisz_modul('logo_b64.py', 'Auto-generated base64 logo data (logo.svg)', _LOGO)
+
+
+if __name__ == '__main__':
+    main()
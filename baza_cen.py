@@ -3,7 +3,10 @@
 Manager bazy danych SQLite z cenami 15-minutowymi z TGE RDB.
 
 Tabele:
-- ceny_15min: ceny energii z interwałem 15-minutowym
+- ceny_15min: ceny energii z interwałem 15-minutowym; początek okresu jako
+  INTEGER (sekundy od epoki, czas lokalny bez strefy), koniec liczony
+  z długości okresu okres_s
+- ceny_1h, ceny_1d: agregaty (średnia/min/max) odświeżane przy każdym zapisie
 - scraper_log: historia uruchomień scrapera
 
 Użycie:
@@ -15,66 +18,225 @@ Użycie:
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from statistics import fmean
+from typing import IO, Iterator, Optional
 
 import pandas as pd
 
 
 # Domyślna ścieżka bazy danych — obok tego pliku
-_DEFAULT_DB_PATH = os.path.join(
+DB_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), 'ceny_tge.db'
 )
 
+# Długość okresu notowań (15 min) — domyślna, gdy brak timestamp_end
+_OKRES_S = 900
+
+_EPOKA = datetime(1970, 1, 1)
+# Strefa, w której liczony jest zapisywany czas lokalny (dla kolumn ze strefą)
+_STREFA_LOKALNA = 'Europe/Warsaw'
+# Przesunięcie strefy (Z / ±HH:MM) po czasie w tekście ISO
+_STREFA_ISO = r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)(?:Z|[+-]\d{2}:?\d{2})$'
+
+_SCHEMAT = """
+    CREATE TABLE IF NOT EXISTS ceny_15min (
+        timestamp_start INTEGER NOT NULL,
+        okres_s         INTEGER NOT NULL DEFAULT 900,
+        rynek           TEXT NOT NULL DEFAULT 'RDB',
+        cena_pln_mwh    REAL NOT NULL,
+        wolumen         REAL,
+        waluta          TEXT NOT NULL DEFAULT 'PLN',
+        zrodlo          TEXT NOT NULL DEFAULT 'TGE',
+        PRIMARY KEY (timestamp_start, rynek)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_ceny_ts
+        ON ceny_15min(timestamp_start);
+    CREATE INDEX IF NOT EXISTS idx_ceny_rynek
+        ON ceny_15min(rynek);
+    CREATE INDEX IF NOT EXISTS idx_ceny_rynek_ts
+        ON ceny_15min(rynek, timestamp_start);
+
+    -- Agregaty godzinowe i dobowe (do wykresów długich zakresów)
+    CREATE TABLE IF NOT EXISTS ceny_1h (
+        timestamp_start INTEGER NOT NULL,
+        rynek           TEXT NOT NULL,
+        cena_srednia    REAL NOT NULL,
+        cena_min        REAL NOT NULL,
+        cena_max        REAL NOT NULL,
+        liczba          INTEGER NOT NULL,
+        PRIMARY KEY (rynek, timestamp_start)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS ceny_1d (
+        timestamp_start INTEGER NOT NULL,
+        rynek           TEXT NOT NULL,
+        cena_srednia    REAL NOT NULL,
+        cena_min        REAL NOT NULL,
+        cena_max        REAL NOT NULL,
+        liczba          INTEGER NOT NULL,
+        PRIMARY KEY (rynek, timestamp_start)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS scraper_log (
+        id              INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp       TEXT NOT NULL,
+        rynek           TEXT NOT NULL DEFAULT 'RDB',
+        data_sesji      TEXT,
+        liczba_rekordow INTEGER DEFAULT 0,
+        status          TEXT NOT NULL,
+        komunikat       TEXT
+    );
+"""
+
+# Tekst ISO bez przesunięcia strefy (Z / ±HH:MM) — strftime('%s') przeliczyłby
+# je na UTC, a zapisz_ceny trzyma czas lokalny (jak _na_sekundy)
+_BEZ_STREFY = """
+    CASE WHEN {k} LIKE '%Z' THEN substr({k}, 1, length({k}) - 1)
+         WHEN substr({k}, -6, 1) IN ('+', '-') AND substr({k}, -3, 1) = ':'
+              THEN substr({k}, 1, length({k}) - 6)
+         ELSE {k} END"""
+
+# Migracja starego schematu (TEXT ISO timestamp_start/timestamp_end)
+_MIGRACJA_TEKST = """
+    BEGIN;
+    DROP INDEX IF EXISTS idx_ceny_ts;
+    DROP INDEX IF EXISTS idx_ceny_rynek;
+    DROP INDEX IF EXISTS idx_ceny_rynek_ts;
+    ALTER TABLE ceny_15min RENAME TO _ceny_15min_tekst;
+    """ + _SCHEMAT + """
+    INSERT OR REPLACE INTO ceny_15min
+        (timestamp_start, okres_s, rynek, cena_pln_mwh, wolumen, waluta, zrodlo)
+    SELECT CAST(strftime('%s', ts) AS INTEGER),
+           COALESCE(CAST(strftime('%s', te) AS INTEGER)
+                    - CAST(strftime('%s', ts) AS INTEGER), 900),
+           rynek, cena_pln_mwh, wolumen, waluta, zrodlo
+    FROM (
+        SELECT """ + _BEZ_STREFY.format(k='timestamp_start') + """ AS ts,
+               """ + _BEZ_STREFY.format(k='timestamp_end') + """ AS te,
+               rynek, cena_pln_mwh, wolumen, waluta, zrodlo
+        FROM _ceny_15min_tekst
+    )
+    WHERE strftime('%s', ts) IS NOT NULL;
+    DROP TABLE _ceny_15min_tekst;
+    COMMIT;
+"""
+
+# Tabele agregatów: ziarno → (tabela, długość przedziału w sekundach)
+_AGREGATY = {'1h': ('ceny_1h', 3600), '1d': ('ceny_1d', 86400)}
+
+# Kolumny odczytu — timestamp_end odtwarzany z okres_s
+_KOLUMNY_ODCZYTU = """
+    timestamp_start, timestamp_start + okres_s AS timestamp_end, rynek,
+    cena_pln_mwh, wolumen, waluta, zrodlo
+"""
+
+
+def _na_sekundy(ts) -> int:
+    """Znacznik czasu (ISO lub datetime, bez strefy) → sekundy od epoki."""
+    if not isinstance(ts, datetime):
+        ts = datetime.fromisoformat(str(ts))
+    return int((ts.replace(tzinfo=None) - _EPOKA).total_seconds())
+
+
+def _okres(r: dict, start: int) -> int:
+    """Długość okresu rekordu w sekundach (z timestamp_end lub domyślna)."""
+    koniec = r.get('timestamp_end')
+    return _na_sekundy(koniec) - start if koniec else _OKRES_S
+
+
+def _kolumna_na_sekundy(kolumna: pd.Series) -> pd.Series:
+    """Kolumna dat (tekst ISO / datetime) → sekundy od epoki.
+
+    Jak _na_sekundy: zapisywany jest czas lokalny bez strefy. Kolumny ze strefą
+    (np. UTC) są najpierw przeliczane na czas polski.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(kolumna):
+        # Przesunięcie odcinane z tekstu — zimą i latem bywa różne w jednej kolumnie
+        kolumna = kolumna.astype(str).str.replace(_STREFA_ISO, r'\1', regex=True)
+    try:
+        daty = pd.to_datetime(kolumna, format='ISO8601')
+    except ValueError:
+        daty = pd.to_datetime(kolumna, format='mixed', dayfirst=True)
+    if daty.dt.tz is not None:
+        daty = daty.dt.tz_convert(_STREFA_LOKALNA).dt.tz_localize(None)
+    return (daty - pd.Timestamp(0)) // pd.Timedelta(seconds=1)
+
 
 class BazaCen:
     """Manager bazy SQLite z cenami 15-minutowymi TGE."""
 
-    def __init__(self, db_path: str = _DEFAULT_DB_PATH):
+    def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
         self._init_db()
 
     # ------------------------------------------------------------------
     # Inicjalizacja
     # ------------------------------------------------------------------
 
-    def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _polacz(self) -> sqlite3.Connection:
+        """Otwiera połączenie i ustawia PRAGMA — raz na instancję."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Współdzielone połączenie (pod blokadą); commit/rollback na wyjściu."""
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._polacz()
+            with self._connection as conn:
+                yield conn
+
+    def zamknij(self):
+        """Zamyka współdzielone połączenie (kolejne wywołanie otworzy nowe)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
     def _init_db(self):
         with self._conn() as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS ceny_15min (
-                    timestamp_start TEXT NOT NULL,
-                    timestamp_end   TEXT NOT NULL,
-                    rynek           TEXT NOT NULL DEFAULT 'RDB',
-                    cena_pln_mwh    REAL NOT NULL,
-                    wolumen         REAL,
-                    waluta          TEXT NOT NULL DEFAULT 'PLN',
-                    zrodlo          TEXT NOT NULL DEFAULT 'TGE',
-                    PRIMARY KEY (timestamp_start, rynek)
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_ceny_ts
-                    ON ceny_15min(timestamp_start);
-                CREATE INDEX IF NOT EXISTS idx_ceny_rynek
-                    ON ceny_15min(rynek);
-
-                CREATE TABLE IF NOT EXISTS scraper_log (
-                    id              INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp       TEXT NOT NULL,
-                    rynek           TEXT NOT NULL DEFAULT 'RDB',
-                    data_sesji      TEXT,
-                    liczba_rekordow INTEGER DEFAULT 0,
-                    status          TEXT NOT NULL,
-                    komunikat       TEXT
-                );
-            """)
+            kolumny = {r[1] for r in conn.execute("PRAGMA table_info(ceny_15min)")}
+            conn.executescript(
+                _MIGRACJA_TEKST if 'timestamp_end' in kolumny else _SCHEMAT
+            )
         # Auto-seed z CSV gdy baza pusta (np. Streamlit Cloud)
         self._seed_from_csv()
+        # Agregaty dla bazy sprzed ich wprowadzenia (lub po seedzie)
+        with self._conn() as conn:
+            if conn.execute('SELECT 1 FROM ceny_1d LIMIT 1').fetchone() is None:
+                self._odswiez_agregaty(conn)
+
+    @staticmethod
+    def _odswiez_agregaty(conn: sqlite3.Connection,
+                          od: Optional[int] = None, do: Optional[int] = None):
+        """Przelicza agregaty 1h/1d dla pełnych dób obejmujących [od, do].
+
+        Bez zakresu — przelicza całą tabelę.
+        """
+        od = -2**62 if od is None else od - od % 86400
+        do = 2**62 if do is None else do - do % 86400 + 86400
+        for tabela, krok in _AGREGATY.values():
+            conn.execute(f"""
+                INSERT OR REPLACE INTO {tabela}
+                    (timestamp_start, rynek, cena_srednia, cena_min, cena_max, liczba)
+                SELECT timestamp_start - timestamp_start % {krok} AS t, rynek,
+                       AVG(cena_pln_mwh), MIN(cena_pln_mwh), MAX(cena_pln_mwh), COUNT(*)
+                FROM ceny_15min
+                WHERE timestamp_start >= ? AND timestamp_start < ?
+                GROUP BY rynek, t
+            """, (od, do))
 
     def _seed_from_csv(self):
         """Importuje dane z dane/ceny_seed.csv jeśli baza jest pusta."""
@@ -95,14 +257,14 @@ class BazaCen:
                 return
             conn.executemany("""
                 INSERT OR IGNORE INTO ceny_15min
-                    (timestamp_start, timestamp_end, cena_pln_mwh,
+                    (timestamp_start, okres_s, cena_pln_mwh,
                      wolumen, rynek, waluta, zrodlo)
                 VALUES
-                    (:timestamp_start, :timestamp_end, :cena_pln_mwh,
+                    (:timestamp_start, :okres_s, :cena_pln_mwh,
                      :wolumen, :rynek, :waluta, :zrodlo)
             """, [{
-                'timestamp_start': r['timestamp_start'],
-                'timestamp_end': r['timestamp_end'],
+                'timestamp_start': (start := _na_sekundy(r['timestamp_start'])),
+                'okres_s': _okres(r, start),
                 'cena_pln_mwh': float(r['cena_pln_mwh']),
                 'wolumen': float(r['wolumen']) if r.get('wolumen') else None,
                 'rynek': r.get('rynek', 'RDB'),
@@ -117,35 +279,78 @@ class BazaCen:
     def zapisz_ceny(self, rekordy: list[dict]) -> int:
         """Zapisuje listę rekordów cenowych (upsert).
 
-        Każdy rekord: {timestamp_start, timestamp_end, cena_pln_mwh,
+        Każdy rekord: {timestamp_start, timestamp_end?, cena_pln_mwh,
                        wolumen?, rynek?, waluta?, zrodlo?}
+        Znaczniki czasu jako tekst ISO lub datetime; bez timestamp_end
+        przyjmowany jest okres 15 min.
         Zwraca liczbę zapisanych rekordów.
         """
         if not rekordy:
             return 0
+        wiersze = [
+            {
+                'timestamp_start': (start := _na_sekundy(r['timestamp_start'])),
+                'okres_s': _okres(r, start),
+                'rynek': r.get('rynek', 'RDB'),
+                'cena_pln_mwh': r['cena_pln_mwh'],
+                'wolumen': r.get('wolumen'),
+                'waluta': r.get('waluta', 'PLN'),
+                'zrodlo': r.get('zrodlo', 'TGE'),
+            }
+            for r in rekordy
+        ]
+        starty = [w['timestamp_start'] for w in wiersze]
         with self._conn() as conn:
             conn.executemany("""
                 INSERT OR REPLACE INTO ceny_15min
-                    (timestamp_start, timestamp_end, rynek, cena_pln_mwh,
+                    (timestamp_start, okres_s, rynek, cena_pln_mwh,
                      wolumen, waluta, zrodlo)
                 VALUES
-                    (:timestamp_start, :timestamp_end,
+                    (:timestamp_start, :okres_s,
                      :rynek, :cena_pln_mwh,
                      :wolumen, :waluta, :zrodlo)
-            """, [
-                {
-                    'timestamp_start': r['timestamp_start'],
-                    'timestamp_end': r['timestamp_end'],
-                    'rynek': r.get('rynek', 'RDB'),
-                    'cena_pln_mwh': r['cena_pln_mwh'],
-                    'wolumen': r.get('wolumen'),
-                    'waluta': r.get('waluta', 'PLN'),
-                    'zrodlo': r.get('zrodlo', 'TGE'),
-                }
-                for r in rekordy
-            ])
+            """, wiersze)
+            self._odswiez_agregaty(conn, min(starty), max(starty))
         return len(rekordy)
 
+    def zapisz_ceny_df(self, df: pd.DataFrame) -> int:
+        """Zapisuje DataFrame cen (upsert) przez tabelę pomocniczą.
+
+        Kolumny jak w zapisz_ceny (wszystkie poza timestamp_end wymagane).
+        Zamiast wiązania parametrów wiersz po wierszu dane trafiają do
+        tymczasowej _stg_ceny wielowierszowymi INSERT-ami po 1000 wierszy,
+        a do ceny_15min jednym INSERT ... SELECT — całość w jednej transakcji.
+        """
+        if df.empty:
+            return 0
+        kolumny = ['timestamp_start', 'okres_s', 'rynek', 'cena_pln_mwh',
+                   'wolumen', 'waluta', 'zrodlo']
+        start = _kolumna_na_sekundy(df['timestamp_start'])
+        okres = (_kolumna_na_sekundy(df['timestamp_end']) - start
+                 if 'timestamp_end' in df.columns else _OKRES_S)
+        df = df.assign(timestamp_start=start, okres_s=okres)[kolumny]
+        # Wartości jako obiekty Pythona, braki (NaN/NA) jako NULL
+        dane = df.astype(object).where(df.notna(), None).to_numpy()
+        wiersz = f"({', '.join('?' * len(kolumny))})"
+        with self._conn() as conn:
+            # Nie df.to_sql: commituje sam i nie umie tabeli TEMP — a tak błąd
+            # upsertu wycofuje też tabelę pomocniczą (nic nie zostaje w bazie)
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(f"CREATE TEMP TABLE _stg_ceny ({', '.join(kolumny)})")
+            for i in range(0, len(dane), 1000):
+                paczka = dane[i:i + 1000]
+                conn.execute(
+                    f"INSERT INTO temp._stg_ceny VALUES {', '.join([wiersz] * len(paczka))}",
+                    paczka.ravel().tolist(),
+                )
+            conn.execute(f"""
+                INSERT OR REPLACE INTO ceny_15min ({', '.join(kolumny)})
+                SELECT {', '.join(kolumny)} FROM temp._stg_ceny
+            """)
+            conn.execute("DROP TABLE temp._stg_ceny")
+            self._odswiez_agregaty(conn, int(start.min()), int(start.max()))
+        return len(df)
+
     def zapisz_log(self, rynek: str, data_sesji: str, liczba_rekordow: int,
                    status: str, komunikat: str = ''):
         with self._conn() as conn:
@@ -167,35 +372,34 @@ class BazaCen:
         """Pobiera ceny z zakresu dat (format YYYY-MM-DD lub ISO)."""
         with self._conn() as conn:
             df = pd.read_sql_query("""
-                SELECT timestamp_start, timestamp_end, rynek,
-                       cena_pln_mwh, wolumen, waluta, zrodlo
+                SELECT """ + _KOLUMNY_ODCZYTU + """
                 FROM ceny_15min
                 WHERE timestamp_start >= ? AND timestamp_start < ?
                   AND rynek = ?
                 ORDER BY timestamp_start
-            """, conn, params=(data_od, data_do, rynek))
+            """, conn, params=(_na_sekundy(data_od), _na_sekundy(data_do), rynek))
         if not df.empty:
-            df['timestamp_start'] = pd.to_datetime(df['timestamp_start'])
-            df['timestamp_end'] = pd.to_datetime(df['timestamp_end'])
-            df['cena_pln_kwh'] = df['cena_pln_mwh'] / 1000.0
+            df['timestamp_start'] = pd.to_datetime(df['timestamp_start'], unit='s')
+            df['timestamp_end'] = pd.to_datetime(df['timestamp_end'], unit='s')
+            df['cena_pln_kwh'] = df['cena_pln_mwh'].to_numpy() * 0.001
         return df
 
     def pobierz_ostatnie(self, n: int = 96, rynek: str = 'RDB') -> pd.DataFrame:
         """Pobiera ostatnich n rekordów (domyślnie 96 = 24h)."""
         with self._conn() as conn:
             df = pd.read_sql_query("""
-                SELECT timestamp_start, timestamp_end, rynek,
-                       cena_pln_mwh, wolumen, waluta, zrodlo
+                SELECT """ + _KOLUMNY_ODCZYTU + """
                 FROM ceny_15min
                 WHERE rynek = ?
                 ORDER BY timestamp_start DESC
                 LIMIT ?
             """, conn, params=(rynek, n))
         if not df.empty:
-            df = df.sort_values('timestamp_start').reset_index(drop=True)
-            df['timestamp_start'] = pd.to_datetime(df['timestamp_start'])
-            df['timestamp_end'] = pd.to_datetime(df['timestamp_end'])
-            df['cena_pln_kwh'] = df['cena_pln_mwh'] / 1000.0
+            # SQLite zwraca malejąco — odwrócenie zamiast ponownego sortowania
+            df = df.iloc[::-1].reset_index(drop=True)
+            df['timestamp_start'] = pd.to_datetime(df['timestamp_start'], unit='s')
+            df['timestamp_end'] = pd.to_datetime(df['timestamp_end'], unit='s')
+            df['cena_pln_kwh'] = df['cena_pln_mwh'].to_numpy() * 0.001
         return df
 
     def statystyki_dzienne(self, data: str, rynek: str = 'RDB') -> dict:
@@ -214,16 +418,38 @@ class BazaCen:
             'srednia_pln_kwh': round(df['cena_pln_mwh'].mean() / 1000.0, 4),
         }
 
+    def pobierz_agregaty(self, data_od: str, data_do: str, ziarno: str = '1h',
+                         rynek: str = 'RDB') -> pd.DataFrame:
+        """Ceny uśrednione godzinowo ('1h') lub dobowo ('1d') ze średnią/min/max."""
+        tabela, _ = _AGREGATY[ziarno]
+        with self._conn() as conn:
+            df = pd.read_sql_query(f"""
+                SELECT timestamp_start, cena_srednia AS cena_pln_mwh,
+                       cena_min AS min_pln_mwh, cena_max AS max_pln_mwh, liczba
+                FROM {tabela}
+                WHERE rynek = ? AND timestamp_start >= ? AND timestamp_start < ?
+                ORDER BY timestamp_start
+            """, conn, params=(rynek, _na_sekundy(data_od), _na_sekundy(data_do)))
+        if not df.empty:
+            df['timestamp_start'] = pd.to_datetime(df['timestamp_start'], unit='s')
+        return df
+
     def profil_godzinowy(self, data_od: str, data_do: str,
                          rynek: str = 'RDB') -> pd.DataFrame:
         """Średnia cena w podziale na godziny (0-23)."""
-        df = self.pobierz_ceny(data_od, data_do, rynek)
-        if df.empty:
+        with self._conn() as conn:
+            profil = pd.read_sql_query("""
+                SELECT (timestamp_start % 86400) / 3600 AS godzina,
+                       AVG(cena_pln_mwh) AS srednia_cena_pln_mwh
+                FROM ceny_15min
+                WHERE timestamp_start >= ? AND timestamp_start < ?
+                  AND rynek = ?
+                GROUP BY godzina
+                ORDER BY godzina
+            """, conn, params=(_na_sekundy(data_od), _na_sekundy(data_do), rynek))
+        if profil.empty:
             return pd.DataFrame()
-        df['godzina'] = df['timestamp_start'].dt.hour
-        profil = df.groupby('godzina')['cena_pln_mwh'].mean().reset_index()
-        profil.columns = ['godzina', 'srednia_cena_pln_mwh']
-        profil['srednia_cena_pln_kwh'] = profil['srednia_cena_pln_mwh'] / 1000.0
+        profil['srednia_cena_pln_kwh'] = profil['srednia_cena_pln_mwh'].to_numpy() * 0.001
         return profil
 
     def spread_dzienny(self, data: str, rynek: str = 'RDB') -> Optional[float]:
@@ -237,10 +463,14 @@ class BazaCen:
         """Średnia cena RDB z ostatnich N dni (PLN/MWh)."""
         data_do = datetime.now().strftime('%Y-%m-%d')
         data_od = (datetime.now() - timedelta(days=dni)).strftime('%Y-%m-%d')
-        df = self.pobierz_ceny(data_od, data_do, rynek)
-        if df.empty:
+        with self._conn() as conn:
+            avg = conn.execute("""
+                SELECT AVG(cena_pln_mwh) FROM ceny_15min
+                WHERE timestamp_start >= ? AND timestamp_start < ? AND rynek = ?
+            """, (_na_sekundy(data_od), _na_sekundy(data_do), rynek)).fetchone()[0]
+        if avg is None:
             return None
-        return round(df['cena_pln_mwh'].mean(), 2)
+        return round(avg, 2)
 
     def srednia_rdb_kwh(self, dni: int = 30, rynek: str = 'RDB') -> Optional[float]:
         """Średnia cena RDB z ostatnich N dni (PLN/kWh)."""
@@ -249,18 +479,63 @@ class BazaCen:
             return None
         return round(avg / 1000.0, 4)
 
+    def _spready_dzienne(self, dni: int, rynek: str) -> list[tuple[int, float]]:
+        """Spready max-min (PLN/MWh) dni z ostatnich N dni: [(nr_dnia, spread)]."""
+        dzis = datetime.now()
+        data_od = (dzis - timedelta(days=dni - 1)).strftime('%Y-%m-%d')
+        data_do = (dzis + timedelta(days=1)).strftime('%Y-%m-%d')
+        with self._conn() as conn:
+            wiersze = conn.execute("""
+                SELECT timestamp_start / 86400 AS d,
+                       MIN(cena_pln_mwh), MAX(cena_pln_mwh)
+                FROM ceny_15min
+                WHERE rynek = ? AND timestamp_start >= ? AND timestamp_start < ?
+                GROUP BY d
+            """, (rynek, _na_sekundy(data_od), _na_sekundy(data_do))).fetchall()
+        # Zaokrąglenia jak w spread_dzienny (min/max do 0.01 PLN/MWh)
+        return [(d, round(round(mx, 2) - round(mn, 2), 2)) for d, mn, mx in wiersze]
+
     def spread_sredni_kwh(self, dni: int = 30, rynek: str = 'RDB') -> Optional[float]:
         """Średni dzienny spread z ostatnich N dni (PLN/kWh)."""
-        data_do = datetime.now()
-        spreads = []
-        for i in range(dni):
-            d = (data_do - timedelta(days=i)).strftime('%Y-%m-%d')
-            s = self.spread_dzienny(d, rynek)
-            if s is not None:
-                spreads.append(s)
+        spreads = [s for _, s in self._spready_dzienne(dni, rynek)]
         if not spreads:
             return None
-        return round(sum(spreads) / len(spreads) / 1000.0, 4)
+        return round(fmean(spreads) / 1000.0, 4)
+
+    def statystyki_panel(self, okresy: tuple[int, ...] = (30, 7),
+                         rynek: str = 'RDB') -> dict:
+        """Liczba rekordów oraz średnie i spready dla kilku okresów naraz.
+
+        Zwraca {'liczba_rekordow': int, 'okresy': {dni: {'srednia_pln_mwh',
+        'srednia_pln_kwh', 'spread_sredni_kwh'}}} — wartości jak z
+        srednia_rdb / srednia_rdb_kwh / spread_sredni_kwh, ale z dwóch zapytań.
+        """
+        teraz = datetime.now()
+        data_do = _na_sekundy(teraz.strftime('%Y-%m-%d'))
+        srednie_sql = ', '.join(
+            'AVG(CASE WHEN timestamp_start >= ? AND timestamp_start < ? '
+            'THEN cena_pln_mwh END)' for _ in okresy
+        )
+        params = [p for dni in okresy for p in (
+            _na_sekundy((teraz - timedelta(days=dni)).strftime('%Y-%m-%d')), data_do
+        )]
+        with self._conn() as conn:
+            liczba, *srednie = conn.execute(
+                f"SELECT COUNT(*), {srednie_sql} FROM ceny_15min WHERE rynek = ?",
+                (*params, rynek),
+            ).fetchone()
+        spready = self._spready_dzienne(max(okresy), rynek)
+        dzis = data_do // 86400
+        wynik = {}
+        for dni, avg in zip(okresy, srednie):
+            sp = [s for d, s in spready if d > dzis - dni]
+            avg = round(avg, 2) if avg is not None else None
+            wynik[dni] = {
+                'srednia_pln_mwh': avg,
+                'srednia_pln_kwh': round(avg / 1000.0, 4) if avg is not None else None,
+                'spread_sredni_kwh': round(fmean(sp) / 1000.0, 4) if sp else None,
+            }
+        return {'liczba_rekordow': liczba, 'okresy': wynik}
 
     def liczba_rekordow(self, rynek: str = 'RDB') -> int:
         """Łączna liczba rekordów cenowych."""
@@ -272,6 +547,8 @@ class BazaCen:
 
     def pobierz_logi(self, limit: int = 20) -> pd.DataFrame:
         """Pobiera ostatnie logi scrapera."""
+        # id to INTEGER PRIMARY KEY (alias rowid) — ORDER BY id DESC LIMIT jest
+        # wstecznym skanem tabeli bez sortowania, osobny indeks nie jest potrzebny
         with self._conn() as conn:
             df = pd.read_sql_query("""
                 SELECT timestamp, rynek, data_sesji, liczba_rekordow, status, komunikat
@@ -285,27 +562,37 @@ class BazaCen:
     # Import z pliku CSV / XLSX
     # ------------------------------------------------------------------
 
-    def importuj_csv(self, sciezka: str, rynek: str = 'RDB') -> int:
-        """Importuje ceny z pliku CSV.
+    def importuj_csv(self, sciezka: str | IO, rynek: str = 'RDB') -> int:
+        """Importuje ceny z pliku CSV (ścieżka lub obiekt plikowy).
 
-        Oczekiwane kolumny: timestamp_start, timestamp_end, cena_pln_mwh
-        Opcjonalne: wolumen, waluta, zrodlo
+        Oczekiwane kolumny: timestamp_start, cena_pln_mwh
+        Opcjonalne: timestamp_end, wolumen, waluta, zrodlo
         """
-        df = pd.read_csv(sciezka)
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        # Wielowątkowy parser Arrow; kolumny trafiają do pandas jako NumPy.
+        # Czasy czytane jako tekst: Arrow sam przeliczyłby ISO z przesunięciem
+        # na UTC (dtype=str w pd.read_csv działa dopiero po tym parsowaniu),
+        # a przesunięcie odcina _kolumna_na_sekundy jak w innych ścieżkach zapisu
+        tekst = {k: pa.string() for k in ('timestamp_start', 'timestamp_end')}
+        df = pa_csv.read_csv(
+            sciezka, convert_options=pa_csv.ConvertOptions(column_types=tekst)
+        ).to_pandas()
         return self._importuj_df(df, rynek)
 
-    def importuj_xlsx(self, sciezka_lub_bytes, rynek: str = 'RDB') -> int:
-        """Importuje ceny z pliku XLSX.
+    def importuj_xlsx(self, sciezka_lub_bytes: str | IO, rynek: str = 'RDB') -> int:
+        """Importuje ceny z pliku XLSX (ścieżka lub obiekt plikowy).
 
-        Oczekiwane kolumny: timestamp_start, timestamp_end, cena_pln_mwh
-        Opcjonalne: wolumen, waluta, zrodlo
+        Oczekiwane kolumny: timestamp_start, cena_pln_mwh
+        Opcjonalne: timestamp_end, wolumen, waluta, zrodlo
         """
         df = pd.read_excel(sciezka_lub_bytes)
         return self._importuj_df(df, rynek)
 
     def _importuj_df(self, df: pd.DataFrame, rynek: str) -> int:
         """Importuje DataFrame do bazy."""
-        wymagane = {'timestamp_start', 'timestamp_end', 'cena_pln_mwh'}
+        wymagane = {'timestamp_start', 'cena_pln_mwh'}
         if not wymagane.issubset(set(df.columns)):
             # Próba automatycznego mapowania popularnych nazw kolumn
             mapping = {
@@ -324,18 +611,20 @@ class BazaCen:
                     f"Dostępne: {list(df.columns)}"
                 )
 
-        rekordy = []
-        for _, row in df.iterrows():
-            rekordy.append({
-                'timestamp_start': str(row['timestamp_start']),
-                'timestamp_end': str(row['timestamp_end']),
-                'rynek': rynek,
-                'cena_pln_mwh': float(row['cena_pln_mwh']),
-                'wolumen': float(row['wolumen']) if 'wolumen' in row and pd.notna(row.get('wolumen')) else None,
-                'waluta': row.get('waluta', 'PLN'),
-                'zrodlo': row.get('zrodlo', 'import'),
-            })
-        return self.zapisz_ceny(rekordy)
+        # Konwersja kolumnami zamiast iterrows (Series na każdy wiersz)
+        wolumen = (pd.to_numeric(df['wolumen'], errors='coerce')
+                   if 'wolumen' in df.columns else pd.Series(float('nan'), index=df.index))
+        rekordy = pd.DataFrame({
+            'timestamp_start': df['timestamp_start'],
+            'rynek': rynek,
+            'cena_pln_mwh': pd.to_numeric(df['cena_pln_mwh']).astype(float),
+            'wolumen': wolumen.astype(float),
+            'waluta': df['waluta'] if 'waluta' in df.columns else 'PLN',
+            'zrodlo': df['zrodlo'] if 'zrodlo' in df.columns else 'import',
+        }, index=df.index)
+        if 'timestamp_end' in df.columns:
+            rekordy['timestamp_end'] = df['timestamp_end']
+        return self.zapisz_ceny_df(rekordy)
 
 
 if __name__ == '__main__':
@@ -2,696 +2,606 @@
 """
 Generator formularza zbierania danych od klienta (intake form).
 Tworzy profesjonalny XLSX z checklistą dokumentów i informacji.
+
+Formularz nie ma parametrów, więc jest generowany przy budowie: plik
+Formularz_Dane_Klienta.xlsx w repozytorium to wynik tego skryptu, a aplikacja
+tylko go czyta. Treść i układ arkuszy to dane (_FORM), które
+create_intake_form interpretuje blok po bloku. Po zmianie treści lub stylów uruchom:
+    python3 generuj_formularz_klienta.py
+
+Skoroszyt w trybie write-only: wiersze są strumieniowane do XML w kolejności,
+więc szerokości kolumn i wysokości wierszy ustawiamy przed ich zapisem,
+a scalenia i walidacje — na liście arkusza (trafiają do końca pliku).
+Strumieniowy zapis XML wymaga lxml; bez niego openpyxl po cichu przechodzi
+na wolniejszy ElementTree, więc ostrzegamy przy imporcie.
 """
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.xml import LXML
+import io
 import os
+import warnings
+
+if not LXML:
+    warnings.warn('Brak lxml (lub OPENPYXL_LXML=False) — generowanie XLSX będzie '
+                  'wolniejsze. Zainstaluj: pip install lxml')
+
+
+FORM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'Formularz_Dane_Klienta.xlsx')
+
+# Litery kolumn: _COL[n] dla n = 1..10 (formularz nie wychodzi poza J)
+_COL = ' ABCDEFGHIJ'
+
+# Formaty liczb
+_FMT_INT = '#,##0'
+_FMT_MONEY = '#,##0.00'
+
+# Style — tworzone raz przy imporcie i współdzielone przez wszystkie komórki
+_HEADER_FONT = Font(name='Calibri', bold=True, size=14, color='FFFFFFFF')
+_HEADER_FILL = PatternFill(start_color='FF003366', fill_type='solid')
+_SECTION_FONT = Font(name='Calibri', bold=True, size=11, color='FF003366')
+_SECTION_FILL = PatternFill(start_color='FFD6E4F0', fill_type='solid')
+_LABEL_FONT = Font(name='Calibri', size=10)
+_BOLD_FONT = Font(name='Calibri', bold=True, size=10)
+_INPUT_FILL = PatternFill(start_color='FFFFF9C4', fill_type='solid')
+_CHECK_FILL = PatternFill(start_color='FFE8F5E9', fill_type='solid')
+_THIN_BORDER = Border(
+    left=Side(style='thin'), right=Side(style='thin'),
+    top=Side(style='thin'), bottom=Side(style='thin'),
+)
+_NOTE_FONT = Font(name='Calibri', size=9, italic=True, color='FF666666')
+
+# Nagłówki tabel: biały pogrubiony tekst na kolorowym tle
+_TABLE_HEAD_FONT = Font(name='Calibri', bold=True, size=10, color='FFFFFFFF')
+_TABLE_HEAD_FONT_SMALL = Font(name='Calibri', bold=True, size=9, color='FFFFFFFF')
+_BLUE_FILL = PatternFill(start_color='FF4472C4', fill_type='solid')
+_PURPLE_FILL = PatternFill(start_color='FF7030A0', fill_type='solid')
+
+# Wyrównania
+_ALIGN_CENTER = Alignment(horizontal='center')
+_ALIGN_CENTER_CENTER = Alignment(horizontal='center', vertical='center')
+_ALIGN_CENTER_WRAP = Alignment(horizontal='center', wrap_text=True)
+_ALIGN_HEADER = Alignment(horizontal='center', vertical='center', wrap_text=True)
+_ALIGN_VCENTER_WRAP = Alignment(vertical='center', wrap_text=True)
+_ALIGN_WRAP = Alignment(wrap_text=True)
+
+# Style nazwane — rejestrowane w styles.xml raz na skoroszyt; komórka dostaje
+# jeden indeks stylu zamiast osobnego ustawiania fontu, wypełnienia i ramki.
+# Komórki bez fontu w stylu używają domyślnego fontu skoroszytu.
+_NAMED_STYLES = (
+    NamedStyle('header', font=_HEADER_FONT, fill=_HEADER_FILL, alignment=_ALIGN_CENTER_CENTER),
+    NamedStyle('section', font=_SECTION_FONT, fill=_SECTION_FILL),
+    NamedStyle('label', font=_LABEL_FONT, border=_THIN_BORDER),
+    NamedStyle('label_bold', font=_BOLD_FONT, border=_THIN_BORDER),
+    NamedStyle('input', font=DEFAULT_FONT, fill=_INPUT_FILL, border=_THIN_BORDER),
+    NamedStyle('check', font=DEFAULT_FONT, fill=_CHECK_FILL, border=_THIN_BORDER),
+    NamedStyle('note', font=_NOTE_FONT, border=_THIN_BORDER, alignment=_ALIGN_WRAP),
+    NamedStyle('boxed', font=DEFAULT_FONT, border=_THIN_BORDER),
+    NamedStyle('table_blue', font=_TABLE_HEAD_FONT, fill=_BLUE_FILL, border=_THIN_BORDER,
+               alignment=_ALIGN_CENTER_WRAP),
+    NamedStyle('table_navy', font=_TABLE_HEAD_FONT, fill=_HEADER_FILL, border=_THIN_BORDER,
+               alignment=_ALIGN_CENTER),
+    NamedStyle('table_purple', font=_TABLE_HEAD_FONT, fill=_PURPLE_FILL, border=_THIN_BORDER,
+               alignment=_ALIGN_CENTER),
+    NamedStyle('table_invoice', font=_TABLE_HEAD_FONT_SMALL, fill=_BLUE_FILL,
+               border=_THIN_BORDER, alignment=_ALIGN_HEADER),
+)
+
+# Wiersz kroku workflow: styl kolejnych kolumn (krok, zadanie, odpow., status, uwagi)
+_WF_ROW_STYLE = (
+    {'style': 'label', 'alignment': _ALIGN_CENTER},
+    {'style': 'label', 'alignment': _ALIGN_WRAP},
+    {'style': 'input'},
+    {'style': 'check'},
+    {'style': 'note'},
+)
+
+
+# ========================================
+# TREŚĆ FORMULARZA
+# ========================================
+
+_FIELDS_BASIC = (
+    'Nazwa firmy (pełna)',
+    'NIP',
+    'Adres siedziby',
+    'Adres korespondencyjny (jeśli inny)',
+    'Osoba kontaktowa (imię, nazwisko)',
+    'Telefon',
+    'E-mail',
+    'Branża / profil działalności',
+    'Forma prawna (sp. z o.o., S.A., JDG, itp.)',
+    'Liczba pracowników (orientacyjna)',
+)
+
+_FIELDS_PROFILE = (
+    ('Dni pracy w tygodniu', 'np. Pn-Pt / Pn-Sob / 7 dni'),
+    ('Godziny pracy (zmiany)', 'np. 6:00-22:00 (2 zmiany) / 24h'),
+    ('Sezonowość produkcji', 'np. wyższa latem / równomierna / zimą'),
+    ('Główne odbiorniki energii', 'np. linie produkcyjne, chłodnie, sprężarki'),
+    ('Planowane zmiany w zużyciu', 'np. nowa linia produkcyjna, rozbudowa'),
+    ('Czy produkcja jest ciągła?', 'TAK / NIE'),
+)
+
+_PPE_HEADERS = ('Nr PPE', 'Adres PPE', 'Moc umowna (kW)', 'Moc przyłącz. (kW)', 'Grupa taryfowa')
+
+_PPG_HEADERS = ('Nr PPG', 'Adres PPG', 'Moc umowna (kWh/h)', 'Grupa taryfowa', 'Cel zużycia gazu')
+
+
+def _invoices(medium, point):
+    """12 faktur z rzędu — od najstarszej do najnowszej."""
+    suffix = {1: ' (najstarszy)', 12: ' (najnowszy)'}
+    return tuple(
+        (f'FV za {medium} – miesiąc {i}{suffix.get(i, "")}', point) for i in range(1, 13)
+    )
 
 
-def create_intake_form():
-    wb = Workbook()
-
-    # Style
-    header_font = Font(name='Calibri', bold=True, size=14, color='FFFFFF')
-    header_fill = PatternFill(start_color='003366', end_color='003366', fill_type='solid')
-    section_font = Font(name='Calibri', bold=True, size=11, color='003366')
-    section_fill = PatternFill(start_color='D6E4F0', end_color='D6E4F0', fill_type='solid')
-    label_font = Font(name='Calibri', size=10)
-    input_fill = PatternFill(start_color='FFF9C4', end_color='FFF9C4', fill_type='solid')
-    check_fill = PatternFill(start_color='E8F5E9', end_color='E8F5E9', fill_type='solid')
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin'),
-    )
-    note_font = Font(name='Calibri', size=9, italic=True, color='666666')
+_DOC_HEADERS = ('Dokument', 'Dotyczy', 'Otrzymano?', 'Data', 'Uwagi')
+
+_EE_DOCS = (
+    ('Aktualna umowa na energię elektryczną', 'ee'),
+    *_invoices('ee', 'PPE 1'),
+    ('--- Kolejne PPE: powtórzyć 12 FV ---', ''),
+)
+
+_GAS_DOCS = (
+    ('Aktualna umowa na gaz ziemny', 'gaz'),
+    *_invoices('gaz', 'PPG 1'),
+)
+
+_EXTRA_DOCS = (
+    ('Umowa dystrybucyjna (OSD)', 'ee'),
+    ('Warunki przyłączenia', 'ee'),
+    ('Schemat elektryczny zakładu', 'techniczny'),
+    ('Dane z licznika 15-min (jeśli dostępne)', 'ee'),
+    ('Dokumentacja istniejącej instalacji PV', 'OZE'),
+    ('Dokumentacja pompy ciepła / kogeneracji', 'OZE'),
+    ('Wyniki audytu energetycznego (jeśli był)', 'audyt'),
+    ('Mapka/plan zakładu (dla PV na dachu)', 'PV'),
+)
+
+_OZE_QUESTIONS = (
+    ('Czy jest zainstalowana fotowoltaika (PV)?', 'Jeśli TAK → moc kWp, rok instalacji, producent'),
+    ('Moc instalacji PV (kWp)', ''),
+    ('Rok instalacji PV', ''),
+    ('Producent falownika PV', ''),
+    ('Roczna produkcja PV (kWh/rok)', 'Z danych z falownika lub FV'),
+    ('Obecna autokonsumpcja PV (%)', 'Ile % produkcji PV zużywa zakład bezpośrednio'),
+    ('Czy nadwyżki idą do sieci?', 'Net-billing / net-metering / sprzedaż'),
+    ('Czy jest pompa ciepła?', 'Jeśli TAK → typ, moc, rok'),
+    ('Czy jest kogeneracja (CHP)?', 'Jeśli TAK → typ, moc el./cieplna'),
+    ('Czy jest magazyn energii (BESS)?', 'Jeśli TAK → pojemność kWh, producent'),
+    ('Czy jest magazyn ciepła?', 'Jeśli TAK → pojemność, typ'),
+)
+
+_INFRA_QUESTIONS = (
+    ('Czy jest wykonana kompensacja mocy biernej?', 'Bateria kondensatorów / KMB'),
+    ('Typ kompensacji (jeśli jest)', 'Stała / automatyczna / aktywna'),
+    ('Moc kompensacji (kvar)', ''),
+    ('Czy jest zainstalowany agregat prądotwórczy?', ''),
+    ('Moc agregatu (kVA)', ''),
+    ('Czy jest UPS?', 'Jeśli TAK → moc, pojemność'),
+    ('Czy są problemy z jakością energii?', 'Wahania napięcia, harmoniczne, spadki'),
+    ('Czy jest stacja transformatorowa własna?', ''),
+    ('Napięcie zasilania (nn/SN)', 'np. 400V, 15kV, 20kV'),
+    ('Czy jest wolna przestrzeń na magazyn energii?', 'Wewnątrz / na zewnątrz / dach'),
+    ('Czy jest wolna przestrzeń na dodatkowe PV?', 'Dach / grunt / wiata'),
+    ('Powierzchnia dostępna na PV (m²)', 'Orientacyjna'),
+)
+
+_EXPECT_QUESTIONS = (
+    ('Główny cel (oszczędność kosztów / niezależność / ESG)', ''),
+    ('Czy są potrzebne gwarancje pochodzenia (zielona energia)?', 'GO / brak'),
+    ('Preferowany model zakupu energii', 'FIX / RDN / MIX / brak preferencji'),
+    ('Oczekiwany budżet inwestycyjny (orientacyjny)', ''),
+    ('Preferowany model finansowania', 'Zakup / leasing / ESCO / PPA / raty'),
+    ('Planowany termin realizacji', ''),
+    ('Czy firma uczestniczy w programach ESG/CSR?', ''),
+    ('Czy firma raportuje emisje CO₂?', ''),
+    ('Czy firma jest zainteresowana DSR (redukcja popytu)?', ''),
+    ('Inne uwagi / oczekiwania klienta', ''),
+)
+
+_CONTRACT_FIELDS = (
+    ('Sprzedawca energii', ''),
+    ('Nr umowy', ''),
+    ('Data zawarcia umowy', ''),
+    ('Data końca umowy', '← KLUCZOWE: od kiedy można podpisać nową'),
+    ('Okres wypowiedzenia', 'np. 1 miesiąc, 3 miesiące'),
+    ('Czy jest auto-prolongata?', 'TAK/NIE + warunki'),
+    ('Rodzaj umowy (kompleksowa / rozdzielona)', ''),
+    ('Cena energii w umowie (PLN/kWh netto)', ''),
+    ('Czy cena jest stała (FIX) czy zmienna?', ''),
+    ('Opłata handlowa (PLN/mies.)', ''),
+    ('Operator Sieci Dystrybucyjnej (OSD)', 'Tauron/Enea/Energa/PGE/innogy'),
+    ('Grupa taryfowa', 'np. C21, C22a, C22b, B21, B23'),
+    ('Moc umowna (kW)', ''),
+    ('Moc przyłączeniowa (kW)', ''),
+    ('Kary za przekroczenie mocy (czy występowały)', ''),
+    ('Opłata mocowa – kategoria (K1-K4)', ''),
+    ('Czy jest klauzula waloryzacyjna?', ''),
+    ('Czy są kary za wcześniejsze rozwiązanie?', ''),
+)
+
+_GAS_FIELDS = (
+    ('Sprzedawca gazu', ''),
+    ('Nr umowy', ''),
+    ('Data zawarcia umowy', ''),
+    ('Data końca umowy', '← od kiedy można podpisać nową'),
+    ('Okres wypowiedzenia', ''),
+    ('Cena gazu w umowie (PLN/kWh netto)', ''),
+    ('Czy cena jest stała (FIX) czy zmienna?', ''),
+    ('Roczne zużycie gazu (kWh lub m³)', ''),
+    ('Cel zużycia gazu', 'Ogrzewanie / proces / CHP'),
+)
+
+_FV_HEADERS = (
+    'Miesiąc', 'Zużycie\n(kWh)', 'Koszt energii\n(PLN netto)',
+    'Koszt dystr.\n(PLN netto)', 'Opł. mocowa\n(PLN netto)',
+    'Opł. OZE\n(PLN netto)', 'Opł. kogener.\n(PLN netto)',
+    'Akcyza\n(PLN)', 'RAZEM netto\n(PLN)', 'Moc max.\n(kW)'
+)
+
+_MONTHS = ('Styczeń', 'Luty', 'Marzec', 'Kwiecień', 'Maj', 'Czerwiec',
+           'Lipiec', 'Sierpień', 'Wrzesień', 'Październik', 'Listopad', 'Grudzień')
+
+# Podsumowanie kolumn B..J faktur: sumy, a dla mocy maksymalnej (J) — MAX
+_FV_TOTALS = ('SUM',) * 8 + ('MAX',)
+
+_WF_HEADERS = ('Krok', 'Zadanie', 'Odpow.', 'Status', 'Uwagi')
+
+_WORKFLOW_STEPS = (
+    # Faza 1: Zbieranie danych
+    ('', 'FAZA 1: ZBIERANIE DANYCH', '', '', ''),
+    ('1.1', 'Zebranie danych klienta (arkusz "Dane klienta")', '', '', ''),
+    ('1.2', 'Zebranie 12 FV za ee dla każdego PPE', '', '', ''),
+    ('1.3', 'Zebranie 12 FV za gaz dla każdego PPG', '', '', ''),
+    ('1.4', 'Zebranie aktualnych umów ee i gaz', '', '', ''),
+    ('1.5', 'Uzupełnienie informacji technicznych', '', '', ''),
+    ('1.6', 'Wprowadzenie danych z FV do arkusza', '', '', ''),
+    # Faza 2: Analiza
+    ('', 'FAZA 2: ANALIZA', '', '', ''),
+    ('2.1', 'Analiza umów – termin zakończenia, warunki', '', '', ''),
+    ('2.2', 'Potwierdzenie rezerwacji i warunków płatności', '', '', ''),
+    ('2.3', 'Ustalenie od kiedy można podpisać nową umowę', '', '', ''),
+    ('2.4', 'Analiza profilu zużycia (wolumen, sezonowość)', '', '', ''),
+    ('2.5', 'Analiza kosztów dystrybucji (30% od oszczędności)', '', '', ''),
+    ('2.6', 'Rekomendacja produktu: FIX / RDN / MIX + wycena', '', '', ''),
+    ('2.7', 'Analiza opłaty mocowej i potencjału peak shaving', '', '', ''),
+    ('2.8', 'Analiza kompensacji mocy biernej (KMB)', '', '', ''),
+    # Faza 3: Rekomendacje OZE
+    ('', 'FAZA 3: REKOMENDACJE PRODUKTÓW DODATKOWYCH', '', '', ''),
+    ('3.1', 'Rekomendacja PV – sizing na bazie profilu (SUN HELP)', '', '', ''),
+    ('3.2', 'Rekomendacja BESS – sizing + arbitraż + rynek mocy (ALIANS)', '', '', 'Może być stand-alone'),
+    ('3.3', 'Rekomendacja DSR (ALIANS)', '', '', ''),
+    ('3.4', 'Rekomendacja KMB – kompensacja mocy biernej', '', '', ''),
+    # Faza 4: Oferta
+    ('', 'FAZA 4: PRZYGOTOWANIE OFERTY', '', '', ''),
+    ('4.1', 'Kalkulacja ROI dla każdego produktu', '', '', ''),
+    ('4.2', 'Przygotowanie opcji finansowania', '', '', 'Leasing/ESCO/PPA/raty'),
+    ('4.3', 'Generowanie oferty XLSX z kalkulatora', '', '', ''),
+    ('4.4', 'Przygotowanie prezentacji dla klienta', '', '', ''),
+    ('4.5', 'Review wewnętrzny oferty', '', '', ''),
+    # Faza 5: Prezentacja
+    ('', 'FAZA 5: PREZENTACJA I FOLLOW-UP', '', '', ''),
+    ('5.1', 'Spotkanie z klientem – prezentacja oferty', '', '', ''),
+    ('5.2', 'Follow-up – odpowiedzi na pytania', '', '', ''),
+    ('5.3', 'Negocjacje warunków', '', '', ''),
+    ('5.4', 'Podpisanie umowy', '', '', ''),
+)
+
+
+# ========================================
+# UKŁAD ARKUSZY
+# ========================================
+# Każdy arkusz to opis (tytuł, kolor zakładki, szerokości kolumn, lista
+# rozwijana) i sekwencja bloków interpretowana przez create_intake_form.
+# None oznacza pusty wiersz odstępu.
+
+_FORM = (
+    {
+        'title': 'Dane klienta', 'tab': 'FF003366', 'widths': (35, 15, 20, 20, 20),
+        'blocks': (
+            ('header', 'FORMULARZ ZBIERANIA DANYCH OD KLIENTA'), None,
+            ('section', 'A. DANE PODSTAWOWE KLIENTA'),
+            ('fields', _FIELDS_BASIC), None,
+            ('section', 'B. PROFIL DZIAŁALNOŚCI'),
+            ('fields', _FIELDS_PROFILE), None,
+            ('section', 'C. PUNKTY POBORU ENERGII (PPE)'),
+            ('table', _PPE_HEADERS, 'table_blue'),
+            ('inputs', 5), None,
+            ('section', 'D. PUNKTY POBORU GAZU (PPG)'),
+            ('table', _PPG_HEADERS, 'table_blue'),
+            ('inputs', 3),
+        ),
+    },
+    {
+        'title': 'Checklist dokumentów', 'tab': 'FF006600', 'widths': (40, 10, 12, 15, 25),
+        'validation': '"TAK,NIE,W TOKU"',
+        'blocks': (
+            ('header', 'CHECKLIST DOKUMENTÓW DO ZEBRANIA'), None,
+            ('table', _DOC_HEADERS, 'table_navy'),
+            ('section', 'ENERGIA ELEKTRYCZNA'),
+            ('documents', _EE_DOCS), None,
+            ('section', 'GAZ ZIEMNY'),
+            ('documents', _GAS_DOCS), None,
+            ('section', 'DODATKOWE DOKUMENTY'),
+            ('documents', _EXTRA_DOCS),
+        ),
+    },
+    {
+        'title': 'Informacje techniczne', 'tab': 'FFCC6600', 'widths': (45, 10, 20, 20, 20),
+        'validation': '"TAK,NIE,N/D"',
+        'blocks': (
+            ('header', 'INFORMACJE TECHNICZNE DO ZEBRANIA OD KLIENTA'), None,
+            ('section', 'E. ISTNIEJĄCE INSTALACJE OZE'),
+            ('questions', _OZE_QUESTIONS), None,
+            ('section', 'F. INFRASTRUKTURA ELEKTRYCZNA'),
+            ('questions', _INFRA_QUESTIONS), None,
+            ('section', 'G. OCZEKIWANIA KLIENTA'),
+            ('open_questions', _EXPECT_QUESTIONS),
+        ),
+    },
+    {
+        'title': 'Analiza umowy', 'tab': 'FFCC0000', 'widths': (40, 15, 20, 20, 20),
+        'blocks': (
+            ('header', 'ANALIZA AKTUALNEJ UMOWY NA ENERGIĘ / GAZ'), None,
+            ('section', 'H. UMOWA NA ENERGIĘ ELEKTRYCZNĄ'),
+            ('contract', _CONTRACT_FIELDS), None,
+            ('section', 'I. UMOWA NA GAZ ZIEMNY'),
+            ('contract', _GAS_FIELDS),
+        ),
+    },
+    {
+        'title': 'Dane z faktur ee', 'tab': 'FF4472C4', 'widths': (15,) * 10,
+        'blocks': (
+            ('header', 'DANE Z FAKTUR ZA ENERGIĘ ELEKTRYCZNĄ (12 miesięcy)'), None,
+            ('label_input', 'PPE nr:'), None,
+            ('table', _FV_HEADERS, 'table_invoice', 40),
+            ('invoices', _MONTHS),
+        ),
+    },
+    {
+        'title': 'Workflow analizy', 'tab': 'FF7030A0', 'widths': (8, 45, 15, 15, 25),
+        'validation': '"Do zrobienia,W toku,Gotowe,N/D"',
+        'blocks': (
+            ('header', 'WORKFLOW ANALIZY I PRZYGOTOWANIA OFERTY'), None,
+            ('table', _WF_HEADERS, 'table_purple'),
+            ('workflow', _WORKFLOW_STEPS),
+        ),
+    },
+)
+
+
+def create_intake_form(target=None):
+    wb = Workbook(write_only=True)
+    for styl in _NAMED_STYLES:
+        wb.add_named_style(styl)
+
+    # Liczba wierszy już zapisanych w arkuszu (write-only nie pozwala wrócić)
+    zapisane = {}
+
+    def cell(ws, value=None, style=None, **styl):
+        """Komórka write-only: styl nazwany plus ewentualne nadpisania atrybutów."""
+        c = WriteOnlyCell(ws, value=value)
+        if style is not None:
+            c.style = style
+        for atrybut, wartosc in styl.items():
+            setattr(c, atrybut, wartosc)
+        return c
+
+    def put_row(ws, row, cells, height=None):
+        """Zapisuje wiersz `row`, dopisując wcześniej puste wiersze odstępu.
+
+        Komórki są serializowane od razu przy append — tę samą listę stylowanych
+        komórek można więc dopisać wielokrotnie.
+        """
+        while zapisane.get(ws.title, 0) < row - 1:
+            ws.append([])
+            zapisane[ws.title] = zapisane.get(ws.title, 0) + 1
+        if height is not None:
+            ws.row_dimensions[row].height = height
+        ws.append(cells)
+        zapisane[ws.title] = row
 
     def set_widths(ws, widths):
         for i, w in enumerate(widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = w
+            ws.column_dimensions[_COL[i]].width = w
 
     def add_header(ws, row, text, cols=5):
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=cols)
-        cell = ws.cell(row=row, column=1, value=text)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        ws.row_dimensions[row].height = 35
+        ws.merged_cells.add(f'A{row}:{_COL[cols]}{row}')
+        put_row(ws, row, [cell(ws, text, 'header')], height=35)
 
     def add_section(ws, row, text, cols=5):
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=cols)
-        cell = ws.cell(row=row, column=1, value=text)
-        cell.font = section_font
-        cell.fill = section_fill
-        ws.row_dimensions[row].height = 25
+        ws.merged_cells.add(f'A{row}:{_COL[cols]}{row}')
+        put_row(ws, row, [cell(ws, text, 'section')], height=25)
 
-    def add_field(ws, row, label, col_span=2, input_cols=None, note=''):
-        c1 = ws.cell(row=row, column=1, value=label)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(vertical='center', wrap_text=True)
+    def add_table_header(ws, row, titles, style, height=None):
+        """Wiersz nagłówka tabeli: biały pogrubiony tekst na kolorowym tle."""
+        put_row(ws, row, [cell(ws, h, style) for h in titles], height=height)
 
+    def add_field(ws, row, label, col_span=2, input_cols=None, note=''):
         if input_cols is None:
             input_cols = [3, 4, 5]
+        cells = [None] * max(input_cols)
+        cells[0] = cell(ws, label, 'label', alignment=_ALIGN_VCENTER_WRAP)
+        # Ramka na wszystkich komórkach scalenia — w Excelu obrys rysuje każda z nich
+        for col in range(2, col_span + 1):
+            cells[col - 1] = cell(ws, style='boxed')
         for col in input_cols:
-            c = ws.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
+            cells[col - 1] = cell(ws, style='input')
 
         if note:
-            c_note = ws.cell(row=row, column=max(input_cols) + 1 if max(input_cols) < 6 else 5, value=note)
-            c_note.font = note_font
-
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=col_span)
-
-    def add_checklist_row(ws, row, item, status_col=3, note_col=4):
-        c1 = ws.cell(row=row, column=1, value=item)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(vertical='center', wrap_text=True)
-        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
-
-        c2 = ws.cell(row=row, column=status_col)
-        c2.fill = check_fill
-        c2.border = thin_border
-        c2.alignment = Alignment(horizontal='center')
-
-        for col in range(status_col + 1, 6):
-            c = ws.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
-
-    # ========================================
-    # ARKUSZ 1: DANE KLIENTA
-    # ========================================
-    ws1 = wb.active
-    ws1.title = 'Dane klienta'
-    set_widths(ws1, [35, 15, 20, 20, 20])
-    ws1.sheet_properties.tabColor = '003366'
-
-    row = 1
-    add_header(ws1, row, 'FORMULARZ ZBIERANIA DANYCH OD KLIENTA')
-    row += 2
-
-    # Dane podstawowe
-    add_section(ws1, row, 'A. DANE PODSTAWOWE KLIENTA')
-    row += 1
-    fields_basic = [
-        'Nazwa firmy (pełna)',
-        'NIP',
-        'Adres siedziby',
-        'Adres korespondencyjny (jeśli inny)',
-        'Osoba kontaktowa (imię, nazwisko)',
-        'Telefon',
-        'E-mail',
-        'Branża / profil działalności',
-        'Forma prawna (sp. z o.o., S.A., JDG, itp.)',
-        'Liczba pracowników (orientacyjna)',
-    ]
-    for f in fields_basic:
-        add_field(ws1, row, f)
-        row += 1
-
-    row += 1
-    add_section(ws1, row, 'B. PROFIL DZIAŁALNOŚCI')
-    row += 1
-    fields_profile = [
-        ('Dni pracy w tygodniu', 'np. Pn-Pt / Pn-Sob / 7 dni'),
-        ('Godziny pracy (zmiany)', 'np. 6:00-22:00 (2 zmiany) / 24h'),
-        ('Sezonowość produkcji', 'np. wyższa latem / równomierna / zimą'),
-        ('Główne odbiorniki energii', 'np. linie produkcyjne, chłodnie, sprężarki'),
-        ('Planowane zmiany w zużyciu', 'np. nowa linia produkcyjna, rozbudowa'),
-        ('Czy produkcja jest ciągła?', 'TAK / NIE'),
-    ]
-    for label, note in fields_profile:
-        add_field(ws1, row, label, note=note)
-        row += 1
-
-    row += 1
-    add_section(ws1, row, 'C. PUNKTY POBORU ENERGII (PPE)')
-    row += 1
-    # Nagłówki tabeli PPE
-    ppe_headers = ['Nr PPE', 'Adres PPE', 'Moc umowna (kW)', 'Moc przyłącz. (kW)', 'Grupa taryfowa']
-    for col, h in enumerate(ppe_headers, 1):
-        cell = ws1.cell(row=row, column=col, value=h)
-        cell.font = Font(name='Calibri', bold=True, size=10, color='FFFFFF')
-        cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', wrap_text=True)
-    row += 1
-    # 5 pustych wierszy na PPE
-    for _ in range(5):
-        for col in range(1, 6):
-            cell = ws1.cell(row=row, column=col)
-            cell.fill = input_fill
-            cell.border = thin_border
-        row += 1
-
-    row += 1
-    add_section(ws1, row, 'D. PUNKTY POBORU GAZU (PPG)')
-    row += 1
-    ppg_headers = ['Nr PPG', 'Adres PPG', 'Moc umowna (kWh/h)', 'Grupa taryfowa', 'Cel zużycia gazu']
-    for col, h in enumerate(ppg_headers, 1):
-        cell = ws1.cell(row=row, column=col, value=h)
-        cell.font = Font(name='Calibri', bold=True, size=10, color='FFFFFF')
-        cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', wrap_text=True)
-    row += 1
-    for _ in range(3):
-        for col in range(1, 6):
-            cell = ws1.cell(row=row, column=col)
-            cell.fill = input_fill
-            cell.border = thin_border
-        row += 1
-
-    # ========================================
-    # ARKUSZ 2: CHECKLIST DOKUMENTÓW
-    # ========================================
-    ws2 = wb.create_sheet('Checklist dokumentów')
-    set_widths(ws2, [40, 10, 12, 15, 25])
-    ws2.sheet_properties.tabColor = '006600'
-
-    row = 1
-    add_header(ws2, row, 'CHECKLIST DOKUMENTÓW DO ZEBRANIA')
-    row += 2
-
-    # Nagłówki
-    col_headers = ['Dokument', 'Dotyczy', 'Otrzymano?', 'Data', 'Uwagi']
-    for col, h in enumerate(col_headers, 1):
-        cell = ws2.cell(row=row, column=col, value=h)
-        cell.font = Font(name='Calibri', bold=True, size=10, color='FFFFFF')
-        cell.fill = PatternFill(start_color='003366', end_color='003366', fill_type='solid')
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
-    row += 1
-
-    # Dropdown validation TAK/NIE
-    dv_yn = DataValidation(type='list', formula1='"TAK,NIE,W TOKU"', allow_blank=True)
-    ws2.add_data_validation(dv_yn)
-
-    # Dokumenty
-    add_section(ws2, row, 'ENERGIA ELEKTRYCZNA')
-    row += 1
-
-    ee_docs = [
-        ('Aktualna umowa na energię elektryczną', 'ee'),
-        ('FV za ee – miesiąc 1 (najstarszy)', 'PPE 1'),
-        ('FV za ee – miesiąc 2', 'PPE 1'),
-        ('FV za ee – miesiąc 3', 'PPE 1'),
-        ('FV za ee – miesiąc 4', 'PPE 1'),
-        ('FV za ee – miesiąc 5', 'PPE 1'),
-        ('FV za ee – miesiąc 6', 'PPE 1'),
-        ('FV za ee – miesiąc 7', 'PPE 1'),
-        ('FV za ee – miesiąc 8', 'PPE 1'),
-        ('FV za ee – miesiąc 9', 'PPE 1'),
-        ('FV za ee – miesiąc 10', 'PPE 1'),
-        ('FV za ee – miesiąc 11', 'PPE 1'),
-        ('FV za ee – miesiąc 12 (najnowszy)', 'PPE 1'),
-        ('--- Kolejne PPE: powtórzyć 12 FV ---', ''),
-    ]
-    for doc, scope in ee_docs:
-        c1 = ws2.cell(row=row, column=1, value=doc)
-        c1.font = label_font
-        c1.border = thin_border
-        c2 = ws2.cell(row=row, column=2, value=scope)
-        c2.font = label_font
-        c2.border = thin_border
-        c2.alignment = Alignment(horizontal='center')
-        c3 = ws2.cell(row=row, column=3)
-        c3.fill = check_fill
-        c3.border = thin_border
-        dv_yn.add(c3)
-        for col in [4, 5]:
-            c = ws2.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
-        row += 1
-
-    row += 1
-    add_section(ws2, row, 'GAZ ZIEMNY')
-    row += 1
-
-    gas_docs = [
-        ('Aktualna umowa na gaz ziemny', 'gaz'),
-        ('FV za gaz – miesiąc 1 (najstarszy)', 'PPG 1'),
-        ('FV za gaz – miesiąc 2', 'PPG 1'),
-        ('FV za gaz – miesiąc 3', 'PPG 1'),
-        ('FV za gaz – miesiąc 4', 'PPG 1'),
-        ('FV za gaz – miesiąc 5', 'PPG 1'),
-        ('FV za gaz – miesiąc 6', 'PPG 1'),
-        ('FV za gaz – miesiąc 7', 'PPG 1'),
-        ('FV za gaz – miesiąc 8', 'PPG 1'),
-        ('FV za gaz – miesiąc 9', 'PPG 1'),
-        ('FV za gaz – miesiąc 10', 'PPG 1'),
-        ('FV za gaz – miesiąc 11', 'PPG 1'),
-        ('FV za gaz – miesiąc 12 (najnowszy)', 'PPG 1'),
-    ]
-    for doc, scope in gas_docs:
-        c1 = ws2.cell(row=row, column=1, value=doc)
-        c1.font = label_font
-        c1.border = thin_border
-        c2 = ws2.cell(row=row, column=2, value=scope)
-        c2.font = label_font
-        c2.border = thin_border
-        c2.alignment = Alignment(horizontal='center')
-        c3 = ws2.cell(row=row, column=3)
-        c3.fill = check_fill
-        c3.border = thin_border
-        dv_yn.add(c3)
-        for col in [4, 5]:
-            c = ws2.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
-        row += 1
-
-    row += 1
-    add_section(ws2, row, 'DODATKOWE DOKUMENTY')
-    row += 1
-
-    extra_docs = [
-        ('Umowa dystrybucyjna (OSD)', 'ee'),
-        ('Warunki przyłączenia', 'ee'),
-        ('Schemat elektryczny zakładu', 'techniczny'),
-        ('Dane z licznika 15-min (jeśli dostępne)', 'ee'),
-        ('Dokumentacja istniejącej instalacji PV', 'OZE'),
-        ('Dokumentacja pompy ciepła / kogeneracji', 'OZE'),
-        ('Wyniki audytu energetycznego (jeśli był)', 'audyt'),
-        ('Mapka/plan zakładu (dla PV na dachu)', 'PV'),
-    ]
-    for doc, scope in extra_docs:
-        c1 = ws2.cell(row=row, column=1, value=doc)
-        c1.font = label_font
-        c1.border = thin_border
-        c2 = ws2.cell(row=row, column=2, value=scope)
-        c2.font = label_font
-        c2.border = thin_border
-        c2.alignment = Alignment(horizontal='center')
-        c3 = ws2.cell(row=row, column=3)
-        c3.fill = check_fill
-        c3.border = thin_border
-        dv_yn.add(c3)
-        for col in [4, 5]:
-            c = ws2.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
-        row += 1
-
-    # ========================================
-    # ARKUSZ 3: INFORMACJE TECHNICZNE
-    # ========================================
-    ws3 = wb.create_sheet('Informacje techniczne')
-    set_widths(ws3, [45, 10, 20, 20, 20])
-    ws3.sheet_properties.tabColor = 'CC6600'
-
-    row = 1
-    add_header(ws3, row, 'INFORMACJE TECHNICZNE DO ZEBRANIA OD KLIENTA')
-    row += 2
-
-    # Dropdown TAK/NIE
-    dv_yn3 = DataValidation(type='list', formula1='"TAK,NIE,N/D"', allow_blank=True)
-    ws3.add_data_validation(dv_yn3)
-
-    add_section(ws3, row, 'E. ISTNIEJĄCE INSTALACJE OZE')
-    row += 1
-
-    oze_questions = [
-        ('Czy jest zainstalowana fotowoltaika (PV)?', 'Jeśli TAK → moc kWp, rok instalacji, producent'),
-        ('Moc instalacji PV (kWp)', ''),
-        ('Rok instalacji PV', ''),
-        ('Producent falownika PV', ''),
-        ('Roczna produkcja PV (kWh/rok)', 'Z danych z falownika lub FV'),
-        ('Obecna autokonsumpcja PV (%)', 'Ile % produkcji PV zużywa zakład bezpośrednio'),
-        ('Czy nadwyżki idą do sieci?', 'Net-billing / net-metering / sprzedaż'),
-        ('Czy jest pompa ciepła?', 'Jeśli TAK → typ, moc, rok'),
-        ('Czy jest kogeneracja (CHP)?', 'Jeśli TAK → typ, moc el./cieplna'),
-        ('Czy jest magazyn energii (BESS)?', 'Jeśli TAK → pojemność kWh, producent'),
-        ('Czy jest magazyn ciepła?', 'Jeśli TAK → pojemność, typ'),
-    ]
-    for q, note in oze_questions:
-        c1 = ws3.cell(row=row, column=1, value=q)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(wrap_text=True)
-
-        c2 = ws3.cell(row=row, column=2)
-        c2.fill = check_fill
-        c2.border = thin_border
-        if 'Czy' in q:
-            dv_yn3.add(c2)
-
-        ws3.merge_cells(start_row=row, start_column=3, end_row=row, end_column=4)
-        c3 = ws3.cell(row=row, column=3)
-        c3.fill = input_fill
-        c3.border = thin_border
-        ws3.cell(row=row, column=4).border = thin_border
-
-        c5 = ws3.cell(row=row, column=5, value=note)
-        c5.font = note_font
-        c5.border = thin_border
-        c5.alignment = Alignment(wrap_text=True)
-        row += 1
-
-    row += 1
-    add_section(ws3, row, 'F. INFRASTRUKTURA ELEKTRYCZNA')
-    row += 1
-
-    infra_questions = [
-        ('Czy jest wykonana kompensacja mocy biernej?', 'Bateria kondensatorów / KMB'),
-        ('Typ kompensacji (jeśli jest)', 'Stała / automatyczna / aktywna'),
-        ('Moc kompensacji (kvar)', ''),
-        ('Czy jest zainstalowany agregat prądotwórczy?', ''),
-        ('Moc agregatu (kVA)', ''),
-        ('Czy jest UPS?', 'Jeśli TAK → moc, pojemność'),
-        ('Czy są problemy z jakością energii?', 'Wahania napięcia, harmoniczne, spadki'),
-        ('Czy jest stacja transformatorowa własna?', ''),
-        ('Napięcie zasilania (nn/SN)', 'np. 400V, 15kV, 20kV'),
-        ('Czy jest wolna przestrzeń na magazyn energii?', 'Wewnątrz / na zewnątrz / dach'),
-        ('Czy jest wolna przestrzeń na dodatkowe PV?', 'Dach / grunt / wiata'),
-        ('Powierzchnia dostępna na PV (m²)', 'Orientacyjna'),
-    ]
-    for q, note in infra_questions:
-        c1 = ws3.cell(row=row, column=1, value=q)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(wrap_text=True)
-
-        c2 = ws3.cell(row=row, column=2)
-        c2.fill = check_fill
-        c2.border = thin_border
-        if 'Czy' in q:
-            dv_yn3.add(c2)
-
-        ws3.merge_cells(start_row=row, start_column=3, end_row=row, end_column=4)
-        c3 = ws3.cell(row=row, column=3)
-        c3.fill = input_fill
-        c3.border = thin_border
-        ws3.cell(row=row, column=4).border = thin_border
-
-        c5 = ws3.cell(row=row, column=5, value=note)
-        c5.font = note_font
-        c5.border = thin_border
-        c5.alignment = Alignment(wrap_text=True)
-        row += 1
-
-    row += 1
-    add_section(ws3, row, 'G. OCZEKIWANIA KLIENTA')
-    row += 1
-
-    expect_questions = [
-        ('Główny cel (oszczędność kosztów / niezależność / ESG)', ''),
-        ('Czy są potrzebne gwarancje pochodzenia (zielona energia)?', 'GO / brak'),
-        ('Preferowany model zakupu energii', 'FIX / RDN / MIX / brak preferencji'),
-        ('Oczekiwany budżet inwestycyjny (orientacyjny)', ''),
-        ('Preferowany model finansowania', 'Zakup / leasing / ESCO / PPA / raty'),
-        ('Planowany termin realizacji', ''),
-        ('Czy firma uczestniczy w programach ESG/CSR?', ''),
-        ('Czy firma raportuje emisje CO₂?', ''),
-        ('Czy firma jest zainteresowana DSR (redukcja popytu)?', ''),
-        ('Inne uwagi / oczekiwania klienta', ''),
-    ]
-    for q, note in expect_questions:
-        c1 = ws3.cell(row=row, column=1, value=q)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(wrap_text=True)
-
-        c2 = ws3.cell(row=row, column=2)
-        c2.fill = check_fill
-        c2.border = thin_border
-
-        ws3.merge_cells(start_row=row, start_column=3, end_row=row, end_column=4)
-        c3 = ws3.cell(row=row, column=3)
-        c3.fill = input_fill
-        c3.border = thin_border
-        ws3.cell(row=row, column=4).border = thin_border
-
-        c5 = ws3.cell(row=row, column=5, value=note)
-        c5.font = note_font
-        c5.border = thin_border
-        c5.alignment = Alignment(wrap_text=True)
-        row += 1
-
-    # ========================================
-    # ARKUSZ 4: ANALIZA UMOWY
-    # ========================================
-    ws4 = wb.create_sheet('Analiza umowy')
-    set_widths(ws4, [40, 15, 20, 20, 20])
-    ws4.sheet_properties.tabColor = 'CC0000'
-
-    row = 1
-    add_header(ws4, row, 'ANALIZA AKTUALNEJ UMOWY NA ENERGIĘ / GAZ')
-    row += 2
-
-    add_section(ws4, row, 'H. UMOWA NA ENERGIĘ ELEKTRYCZNĄ')
-    row += 1
-
-    contract_fields = [
-        ('Sprzedawca energii', ''),
-        ('Nr umowy', ''),
-        ('Data zawarcia umowy', ''),
-        ('Data końca umowy', '← KLUCZOWE: od kiedy można podpisać nową'),
-        ('Okres wypowiedzenia', 'np. 1 miesiąc, 3 miesiące'),
-        ('Czy jest auto-prolongata?', 'TAK/NIE + warunki'),
-        ('Rodzaj umowy (kompleksowa / rozdzielona)', ''),
-        ('Cena energii w umowie (PLN/kWh netto)', ''),
-        ('Czy cena jest stała (FIX) czy zmienna?', ''),
-        ('Opłata handlowa (PLN/mies.)', ''),
-        ('Operator Sieci Dystrybucyjnej (OSD)', 'Tauron/Enea/Energa/PGE/innogy'),
-        ('Grupa taryfowa', 'np. C21, C22a, C22b, B21, B23'),
-        ('Moc umowna (kW)', ''),
-        ('Moc przyłączeniowa (kW)', ''),
-        ('Kary za przekroczenie mocy (czy występowały)', ''),
-        ('Opłata mocowa – kategoria (K1-K4)', ''),
-        ('Czy jest klauzula waloryzacyjna?', ''),
-        ('Czy są kary za wcześniejsze rozwiązanie?', ''),
-    ]
-    for label, note in contract_fields:
-        c1 = ws4.cell(row=row, column=1, value=label)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(wrap_text=True)
-
-        ws4.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
-        c2 = ws4.cell(row=row, column=2)
-        c2.fill = input_fill
-        c2.border = thin_border
-        ws4.cell(row=row, column=3).border = thin_border
-
-        ws4.merge_cells(start_row=row, start_column=4, end_row=row, end_column=5)
-        c4 = ws4.cell(row=row, column=4, value=note)
-        c4.font = note_font
-        c4.border = thin_border
-        c4.alignment = Alignment(wrap_text=True)
-        ws4.cell(row=row, column=5).border = thin_border
-        row += 1
-
-    row += 1
-    add_section(ws4, row, 'I. UMOWA NA GAZ ZIEMNY')
-    row += 1
-
-    gas_fields = [
-        ('Sprzedawca gazu', ''),
-        ('Nr umowy', ''),
-        ('Data zawarcia umowy', ''),
-        ('Data końca umowy', '← od kiedy można podpisać nową'),
-        ('Okres wypowiedzenia', ''),
-        ('Cena gazu w umowie (PLN/kWh netto)', ''),
-        ('Czy cena jest stała (FIX) czy zmienna?', ''),
-        ('Roczne zużycie gazu (kWh lub m³)', ''),
-        ('Cel zużycia gazu', 'Ogrzewanie / proces / CHP'),
-    ]
-    for label, note in gas_fields:
-        c1 = ws4.cell(row=row, column=1, value=label)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(wrap_text=True)
-
-        ws4.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
-        c2 = ws4.cell(row=row, column=2)
-        c2.fill = input_fill
-        c2.border = thin_border
-        ws4.cell(row=row, column=3).border = thin_border
-
-        ws4.merge_cells(start_row=row, start_column=4, end_row=row, end_column=5)
-        c4 = ws4.cell(row=row, column=4, value=note)
-        c4.font = note_font
-        c4.border = thin_border
-        c4.alignment = Alignment(wrap_text=True)
-        ws4.cell(row=row, column=5).border = thin_border
-        row += 1
-
-    # ========================================
-    # ARKUSZ 5: DANE Z FAKTUR (szablon)
-    # ========================================
-    ws5 = wb.create_sheet('Dane z faktur ee')
-    set_widths(ws5, [15, 15, 15, 15, 15, 15, 15, 15, 15, 15])
-    ws5.sheet_properties.tabColor = '4472C4'
-
-    row = 1
-    add_header(ws5, row, 'DANE Z FAKTUR ZA ENERGIĘ ELEKTRYCZNĄ (12 miesięcy)', cols=10)
-    row += 2
-
-    ws5.cell(row=row, column=1, value='PPE nr:').font = section_font
-    ws5.cell(row=row, column=2).fill = input_fill
-    ws5.cell(row=row, column=2).border = thin_border
-    row += 2
-
-    fv_headers = [
-        'Miesiąc', 'Zużycie\n(kWh)', 'Koszt energii\n(PLN netto)',
-        'Koszt dystr.\n(PLN netto)', 'Opł. mocowa\n(PLN netto)',
-        'Opł. OZE\n(PLN netto)', 'Opł. kogener.\n(PLN netto)',
-        'Akcyza\n(PLN)', 'RAZEM netto\n(PLN)', 'Moc max.\n(kW)'
-    ]
-    for col, h in enumerate(fv_headers, 1):
-        cell = ws5.cell(row=row, column=col, value=h)
-        cell.font = Font(name='Calibri', bold=True, size=9, color='FFFFFF')
-        cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', wrap_text=True, vertical='center')
-    ws5.row_dimensions[row].height = 40
-    row += 1
-
-    months = ['Styczeń', 'Luty', 'Marzec', 'Kwiecień', 'Maj', 'Czerwiec',
-              'Lipiec', 'Sierpień', 'Wrzesień', 'Październik', 'Listopad', 'Grudzień']
-    for m in months:
-        ws5.cell(row=row, column=1, value=m).font = label_font
-        ws5.cell(row=row, column=1).border = thin_border
-        for col in range(2, 11):
-            c = ws5.cell(row=row, column=col)
-            c.fill = input_fill
-            c.border = thin_border
-            c.number_format = '#,##0.00' if col != 2 else '#,##0'
-        row += 1
-
-    # Wiersz SUMA
-    ws5.cell(row=row, column=1, value='SUMA / ŚREDNIA').font = Font(name='Calibri', bold=True, size=10)
-    ws5.cell(row=row, column=1).border = thin_border
-    for col in range(2, 11):
-        c = ws5.cell(row=row, column=col)
-        c.border = thin_border
-        c.font = Font(name='Calibri', bold=True, size=10)
-        # Formuła SUM
-        col_letter = get_column_letter(col)
-        start = row - 12
-        end = row - 1
-        if col == 10:  # Moc max = MAX
-            c.value = f'=MAX({col_letter}{start}:{col_letter}{end})'
-        else:
-            c.value = f'=SUM({col_letter}{start}:{col_letter}{end})'
-        c.number_format = '#,##0'
-
-    # ========================================
-    # ARKUSZ 6: WORKFLOW
-    # ========================================
-    ws6 = wb.create_sheet('Workflow analizy')
-    set_widths(ws6, [8, 45, 15, 15, 25])
-    ws6.sheet_properties.tabColor = '7030A0'
-
-    row = 1
-    add_header(ws6, row, 'WORKFLOW ANALIZY I PRZYGOTOWANIA OFERTY')
-    row += 2
-
-    wf_headers = ['Krok', 'Zadanie', 'Odpow.', 'Status', 'Uwagi']
-    for col, h in enumerate(wf_headers, 1):
-        cell = ws6.cell(row=row, column=col, value=h)
-        cell.font = Font(name='Calibri', bold=True, size=10, color='FFFFFF')
-        cell.fill = PatternFill(start_color='7030A0', end_color='7030A0', fill_type='solid')
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
-    row += 1
-
-    dv_status = DataValidation(type='list', formula1='"Do zrobienia,W toku,Gotowe,N/D"', allow_blank=True)
-    ws6.add_data_validation(dv_status)
-
-    workflow_steps = [
-        # Faza 1: Zbieranie danych
-        ('', 'FAZA 1: ZBIERANIE DANYCH', '', '', ''),
-        ('1.1', 'Zebranie danych klienta (arkusz "Dane klienta")', '', '', ''),
-        ('1.2', 'Zebranie 12 FV za ee dla każdego PPE', '', '', ''),
-        ('1.3', 'Zebranie 12 FV za gaz dla każdego PPG', '', '', ''),
-        ('1.4', 'Zebranie aktualnych umów ee i gaz', '', '', ''),
-        ('1.5', 'Uzupełnienie informacji technicznych', '', '', ''),
-        ('1.6', 'Wprowadzenie danych z FV do arkusza', '', '', ''),
-        # Faza 2: Analiza
-        ('', 'FAZA 2: ANALIZA', '', '', ''),
-        ('2.1', 'Analiza umów – termin zakończenia, warunki', '', '', ''),
-        ('2.2', 'Potwierdzenie rezerwacji i warunków płatności', '', '', ''),
-        ('2.3', 'Ustalenie od kiedy można podpisać nową umowę', '', '', ''),
-        ('2.4', 'Analiza profilu zużycia (wolumen, sezonowość)', '', '', ''),
-        ('2.5', 'Analiza kosztów dystrybucji (30% od oszczędności)', '', '', ''),
-        ('2.6', 'Rekomendacja produktu: FIX / RDN / MIX + wycena', '', '', ''),
-        ('2.7', 'Analiza opłaty mocowej i potencjału peak shaving', '', '', ''),
-        ('2.8', 'Analiza kompensacji mocy biernej (KMB)', '', '', ''),
-        # Faza 3: Rekomendacje OZE
-        ('', 'FAZA 3: REKOMENDACJE PRODUKTÓW DODATKOWYCH', '', '', ''),
-        ('3.1', 'Rekomendacja PV – sizing na bazie profilu (SUN HELP)', '', '', ''),
-        ('3.2', 'Rekomendacja BESS – sizing + arbitraż + rynek mocy (ALIANS)', '', '', 'Może być stand-alone'),
-        ('3.3', 'Rekomendacja DSR (ALIANS)', '', '', ''),
-        ('3.4', 'Rekomendacja KMB – kompensacja mocy biernej', '', '', ''),
-        # Faza 4: Oferta
-        ('', 'FAZA 4: PRZYGOTOWANIE OFERTY', '', '', ''),
-        ('4.1', 'Kalkulacja ROI dla każdego produktu', '', '', ''),
-        ('4.2', 'Przygotowanie opcji finansowania', '', '', 'Leasing/ESCO/PPA/raty'),
-        ('4.3', 'Generowanie oferty XLSX z kalkulatora', '', '', ''),
-        ('4.4', 'Przygotowanie prezentacji dla klienta', '', '', ''),
-        ('4.5', 'Review wewnętrzny oferty', '', '', ''),
-        # Faza 5: Prezentacja
-        ('', 'FAZA 5: PREZENTACJA I FOLLOW-UP', '', '', ''),
-        ('5.1', 'Spotkanie z klientem – prezentacja oferty', '', '', ''),
-        ('5.2', 'Follow-up – odpowiedzi na pytania', '', '', ''),
-        ('5.3', 'Negocjacje warunków', '', '', ''),
-        ('5.4', 'Podpisanie umowy', '', '', ''),
-    ]
-
-    for step, task, resp, status, notes in workflow_steps:
-        if not step:
-            # Section header
-            add_section(ws6, row, task)
+            note_col = max(input_cols) + 1 if max(input_cols) < 6 else 5
+            cells += [None] * (note_col - len(cells))
+            cells[note_col - 1] = cell(ws, note, font=_NOTE_FONT)
+
+        ws.merged_cells.add(f'A{row}:{_COL[col_span]}{row}')
+        put_row(ws, row, cells)
+
+    def add_documents(ws, row, docs, dv):
+        """Wiersze checklisty dokumentów: nazwa, zakres, status (lista), data, uwagi."""
+        for doc, scope in docs:
+            put_row(ws, row, [
+                cell(ws, doc, 'label'),
+                cell(ws, scope, 'label', alignment=_ALIGN_CENTER),
+                cell(ws, style='check'),
+                cell(ws, style='input'),
+                cell(ws, style='input'),
+            ])
+            dv.add(f'C{row}')
+            row += 1
+        return row
+
+    def add_questions(ws, row, questions, dv=None):
+        """Pytania: treść, TAK/NIE (lista dla pytań „Czy…”), odpowiedź C:D, uwaga."""
+        for q, note in questions:
+            ws.merged_cells.add(f'C{row}:D{row}')
+            put_row(ws, row, [
+                cell(ws, q, 'label', alignment=_ALIGN_WRAP),
+                cell(ws, style='check'),
+                cell(ws, style='input'),
+                cell(ws, style='boxed'),
+                cell(ws, note, 'note'),
+            ])
+            if dv is not None and 'Czy' in q:
+                dv.add(f'B{row}')
+            row += 1
+        return row
+
+    def add_contract_fields(ws, row, fields):
+        """Pola umowy: etykieta, wartość B:C, uwaga D:E."""
+        for label, note in fields:
+            ws.merged_cells.add(f'B{row}:C{row}')
+            ws.merged_cells.add(f'D{row}:E{row}')
+            put_row(ws, row, [
+                cell(ws, label, 'label', alignment=_ALIGN_WRAP),
+                cell(ws, style='input'),
+                cell(ws, style='boxed'),
+                cell(ws, note, 'note'),
+                cell(ws, style='boxed'),
+            ])
+            row += 1
+        return row
+
+    def add_invoices(ws, row, months):
+        """Wiersze miesięcy z polami liczbowymi i wiersz SUMA / ŚREDNIA."""
+        month_inputs = [
+            cell(ws, style='input', number_format=_FMT_MONEY if col != 2 else _FMT_INT)
+            for col in range(2, 11)
+        ]
+        for m in months:
+            put_row(ws, row, [cell(ws, m, 'label'), *month_inputs])
             row += 1
-            continue
-
-        c1 = ws6.cell(row=row, column=1, value=step)
-        c1.font = label_font
-        c1.border = thin_border
-        c1.alignment = Alignment(horizontal='center')
-
-        c2 = ws6.cell(row=row, column=2, value=task)
-        c2.font = label_font
-        c2.border = thin_border
-        c2.alignment = Alignment(wrap_text=True)
-
-        c3 = ws6.cell(row=row, column=3)
-        c3.fill = input_fill
-        c3.border = thin_border
-
-        c4 = ws6.cell(row=row, column=4)
-        c4.fill = check_fill
-        c4.border = thin_border
-        dv_status.add(c4)
-
-        c5 = ws6.cell(row=row, column=5, value=notes)
-        c5.font = note_font
-        c5.border = thin_border
-        c5.alignment = Alignment(wrap_text=True)
-
-        row += 1
 
-    # Zapisz
-    output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                               'Formularz_Dane_Klienta.xlsx')
-    wb.save(output_path)
-    print(f'Formularz zapisany: {output_path}')
-    return output_path
+        # Zakres formuł to wiersze miesięcy
+        start, end = row - len(months), row - 1
+        put_row(ws, row, [cell(ws, 'SUMA / ŚREDNIA', 'label_bold')] + [
+            cell(ws, f'={fn}({_COL[col]}{start}:{_COL[col]}{end})',
+                 'label_bold', number_format=_FMT_INT)
+            for col, fn in enumerate(_FV_TOTALS, 2)
+        ])
+        return row + 1
+
+    def add_workflow(ws, row, steps, dv):
+        """Kroki workflow; wiersze bez numeru to nagłówki faz."""
+        for step, task, resp, status, notes in steps:
+            if not step:
+                add_section(ws, row, task)
+            else:
+                put_row(ws, row, [
+                    cell(ws, value, **styl)
+                    for value, styl in zip((step, task, None, None, notes), _WF_ROW_STYLE)
+                ])
+                dv.add(f'D{row}')
+            row += 1
+        return row
+
+    # Interpretacja układu _FORM — blok po bloku, od pierwszego wiersza arkusza
+    for arkusz in _FORM:
+        ws = wb.create_sheet(arkusz['title'])
+        set_widths(ws, arkusz['widths'])
+        ws.sheet_properties.tabColor = arkusz['tab']
+        cols = len(arkusz['widths'])
+
+        dv = None
+        if 'validation' in arkusz:
+            dv = DataValidation(type='list', formula1=arkusz['validation'], allow_blank=True)
+            ws.data_validations.append(dv)
+
+        row = 1
+        for blok in arkusz['blocks']:
+            if blok is None:
+                row += 1
+                continue
+            rodzaj, dane, *opcje = blok
+            if rodzaj == 'header':
+                add_header(ws, row, dane, cols=cols)
+                row += 1
+            elif rodzaj == 'section':
+                add_section(ws, row, dane)
+                row += 1
+            elif rodzaj == 'fields':
+                for f in dane:
+                    label, note = (f, '') if isinstance(f, str) else f
+                    add_field(ws, row, label, note=note)
+                    row += 1
+            elif rodzaj == 'table':
+                add_table_header(ws, row, dane, *opcje)
+                row += 1
+            elif rodzaj == 'inputs':
+                # Te same komórki dopisywane kilkukrotnie
+                input_row = [cell(ws, style='input') for _ in range(cols)]
+                for _ in range(dane):
+                    put_row(ws, row, input_row)
+                    row += 1
+            elif rodzaj == 'label_input':
+                put_row(ws, row, [
+                    cell(ws, dane, font=_SECTION_FONT),
+                    cell(ws, style='input'),
+                ])
+                row += 1
+            elif rodzaj == 'documents':
+                row = add_documents(ws, row, dane, dv)
+            elif rodzaj == 'questions':
+                row = add_questions(ws, row, dane, dv)
+            elif rodzaj == 'open_questions':
+                row = add_questions(ws, row, dane)
+            elif rodzaj == 'contract':
+                row = add_contract_fields(ws, row, dane)
+            elif rodzaj == 'invoices':
+                row = add_invoices(ws, row, dane)
+            elif rodzaj == 'workflow':
+                row = add_workflow(ws, row, dane, dv)
+            else:
+                raise ValueError(f'Nieznany blok formularza: {rodzaj}')
+
+    # Zapisz — do pliku obok skryptu albo do podanego celu (ścieżka / obiekt plikowy)
+    if target is None:
+        target = FORM_PATH
+    wb.save(target)
+    if isinstance(target, str):
+        print(f'Formularz zapisany: {target}')
+    return target
 
 
 def create_intake_form_bytes() -> bytes:
-    """Generuje formularz XLSX i zwraca jako bytes (do st.download_button)."""
-    path = create_intake_form()
-    with open(path, 'rb') as f:
-        return f.read()
+    """Zwraca formularz XLSX jako bytes (do st.download_button).
+
+    Czyta plik wygenerowany przy budowie; gdy go brak — generuje w pamięci.
+    """
+    try:
+        with open(FORM_PATH, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        buf = io.BytesIO()
+        create_intake_form(buf)
+        return buf.getvalue()
 
 
 if __name__ == '__main__':
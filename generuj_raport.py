@@ -5,11 +5,25 @@ Raport zawiera pełny research prawny, technologiczny i rynkowy.
 """
 
 from docx import Document
-from docx.shared import Inches, Pt, Cm, RGBColor
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 import os
 
+
+# Rozmiary i kolory — Pt i RGBColor są niezmienne, więc jedna instancja
+# wystarcza dla wszystkich komórek i runów
+_PT0 = Pt(0)
+_PT2 = Pt(2)
+_PT9 = Pt(9)
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+_PT16 = Pt(16)
+_PT28 = Pt(28)
+_NAVY = RGBColor(0, 51, 102)
+_GREY = RGBColor(80, 80, 80)
+
+
 def add_styled_table(doc, headers, rows, col_widths=None):
     """Dodaje sformatowaną tabelę do dokumentu."""
     table = doc.add_table(rows=1 + len(rows), cols=len(headers))
@@ -23,7 +37,7 @@ def add_styled_table(doc, headers, rows, col_widths=None):
         for paragraph in cell.paragraphs:
             for run in paragraph.runs:
                 run.bold = True
-                run.font.size = Pt(9)
+                run.font.size = _PT9
 
     # Dane
     for row_idx, row_data in enumerate(rows):
@@ -32,7 +46,7 @@ def add_styled_table(doc, headers, rows, col_widths=None):
             cell.text = str(cell_data)
             for paragraph in cell.paragraphs:
                 for run in paragraph.runs:
-                    run.font.size = Pt(9)
+                    run.font.size = _PT9
 
     return table
 
@@ -44,7 +58,7 @@ def create_report():
     style = doc.styles['Normal']
     font = style.font
     font.name = 'Calibri'
-    font.size = Pt(11)
+    font.size = _PT11
 
     # ===== STRONA TYTUŁOWA =====
     for _ in range(4):
@@ -54,16 +68,16 @@ def create_report():
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = title.add_run('PV + Magazyn Energii (BESS)\ndla Zakładów Produkcyjnych w Polsce')
     run.bold = True
-    run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    run.font.size = _PT28
+    run.font.color.rgb = _NAVY
 
     doc.add_paragraph()
 
     subtitle = doc.add_paragraph()
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = subtitle.add_run('Raport: Analiza prawna, technologiczna i rynkowa\nLuty 2026')
-    run.font.size = Pt(16)
-    run.font.color.rgb = RGBColor(80, 80, 80)
+    run.font.size = _PT16
+    run.font.color.rgb = _GREY
 
     doc.add_paragraph()
     doc.add_paragraph()
@@ -74,7 +88,7 @@ def create_report():
         'Strategia: Autokonsumpcja PV + Arbitraż cenowy z magazynem energii\n'
         'Taryfa dynamiczna (ceny 15-minutowe TGE) + Peak Shaving'
     )
-    run.font.size = Pt(12)
+    run.font.size = _PT12
     run.font.italic = True
 
     doc.add_page_break()
@@ -107,8 +121,8 @@ def create_report():
     ]
     for item in toc_items:
         p = doc.add_paragraph(item)
-        p.paragraph_format.space_after = Pt(2)
-        p.paragraph_format.space_before = Pt(0)
+        p.paragraph_format.space_after = _PT2
+        p.paragraph_format.space_before = _PT0
 
     doc.add_page_break()
 
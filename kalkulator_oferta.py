@@ -41,7 +41,7 @@ def _cfg() -> ConfigManager:
 # DATA MODELS
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DaneKlienta:
     nazwa_firmy: str
     nip: str
@@ -0,0 +1,2 @@
+# Auto-generated base64 logo data (logo.svg)
+LOGO_SVG = "PHN2ZyB3aWR0aD0iMzExIiBoZWlnaHQ9IjUyIiB2aWV3Qm94PSIwIDAgMzExIDUyIiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPgo8cGF0aCBkPSJNNDEuMzgwMSAxMi44MTQ4TDM0Ljc2MjQgMTkuNTQ2SDc0LjgxNjFWMjYuMDcxNUg1Mi43NTcxQzUwLjYyMjIgMjYuMDcxNSA0OC41NzIzIDI2LjkxNTYgNDcuMDYxNSAyOC40MTkzTDM4LjA3NDggMzcuMzg0N0MzNS4wNjAzIDQwLjM5OTIgMzAuOTY3NyA0Mi4wODczIDI2LjY5NzcgNDIuMDg3M0gwVjM2LjA3OTZIMjUuNTI3NEMyOC40OTIzIDM2LjA3OTYgMzEuMzQzNiAzNC45MDIyIDMzLjQ0MzEgMzIuODA5OEw0MC4wNjA4IDI2LjA3ODZIMFYxOS41NTMxSDIyLjA2NjFDMjQuMjAxIDE5LjU1MzEgMjYuMjUwOSAxOC43MDkgMjcuNzU0NiAxNy4yMDUzTDM2Ljc0MTMgOC4yMzk5QzM5Ljc2MjkgNS4yMzI1IDQzLjg1NTUgMy41MzcyOSA0OC4xMjU1IDMuNTM3MjlINzQuODE2MVY5LjU0NUg0OS4yOTU4QzQ2LjMyMzkgOS41NDUgNDMuNDc5NiAxMC43MjI0IDQxLjM4MDEgMTIuODE0OFoiIGZpbGw9IndoaXRlIi8+CjxwYXRoIGQ9Ik0xMTkuNzA3IDMzLjk4NjRDMTE5LjcwNyAzNi43NTI2IDExOC41NzIgMzguOTM3MiAxMTYuMzMxIDQwLjQ4MzVDMTE0LjA2MSA0Mi4wMDg1IDExMS4wNzUgNDIuNzc0NSAxMDcuNDU4IDQyLjc3NDVDMTAzLjU4NSA0Mi43NzQ1IDEwMC40NzEgNDEuOTMwNCA5OC4yMDE0IDQwLjI1NjVDOTUuOTk1NSAzOC42MjUxIDk0LjgzMjMgMzYuMTIxMyA5NC43NjE0IDMyLjgwMThIMTAwLjMwOEMxMDAuMzc5IDM0Ljc2NjYgMTAxLjAxIDM2LjIyNzcgMTAyLjE5NSAzNy4xNDI3QzEwMy40MjkgMzguMDI5MyAxMDUuMjM4IDM4LjQ3NjIgMTA3LjU3MSAzOC40NzYyQzEwOS41NjQgMzguNDc2MiAxMTEuMTYgMzguMTI4NiAxMTIuMzE2IDM3LjQzMzVDMTEzLjUwOCAzNi43MTcxIDExNC4xMDQgMzUuNjc0NSAxMTQuMTA0IDM0LjMyNjhDMTE0LjEwNCAzMy40MjYgMTEzLjkyNiAzMi43MDk2IDExMy41NjUgMzIuMTg0OEMxMTMuMjAzIDMxLjY1OTkgMTEyLjUwMSAzMS4yMTMgMTExLjQ0NCAzMC44MTU4QzExMC40MTUgMzAuMzk3MyAxMDguODM0IDMwLjAxNDMgMTA2Ljc1NSAyOS42NzM5QzEwMy43OTEgMjkuMTg0NSAxMDEuNDY0IDI4LjUzOSA5OS44MjU3IDI3Ljc1ODhDOTguMTk0NCAyNi45NDMxIDk3LjAzODIgMjUuOTc4NSA5Ni4zNzg2IDI0Ljg3OTFDOTUuNzE4OSAyMy43MzcxIDk1LjM3ODUgMjIuMzM5OCA5NS4zNzg1IDIwLjcwODRDOTUuMzc4NSAxOC4xMzM3IDk2LjQyODIgMTYuMDYyNiA5OC40ODUyIDE0LjU1ODlDMTAwLjU2MyAxMy4wMzM5IDEwMy4zMzcgMTIuMjYwOCAxMDYuNzIgMTIuMjYwOEMxMTAuNiAxMi4yNjA4IDExMy42MzYgMTMuMTI2MSAxMTUuNzQ5IDE0LjgzNTVDMTE3Ljg0OSAxNi41MDIzIDExOC45NDggMTguODM1OSAxMTkuMDI2IDIxLjc3OTRIMTEzLjY1QzExMy41NzIgMTkuODkyNyAxMTIuOTE5IDE4LjU0NTEgMTExLjY5OSAxNy43ODYxQzExMC40NjUgMTYuOTcwNSAxMDguNzkxIDE2LjU1OTEgMTA2LjcyIDE2LjU1OTFDMTA1LjA2NyAxNi41NTkxIDEwMy42NjMgMTYuOTEzNyAxMDIuNTQyIDE3LjYwODhDMTAxLjQzNiAxOC4yODI2IDEwMC44NjggMTkuMjU0NCAxMDAuODY4IDIwLjQ4MTRDMTAwLjg2OCAyMS4zNTM5IDEwMS4wOTUgMjIuMDYzMiAxMDEuNTM1IDIyLjU4OEMxMDEuOTc1IDIzLjA5ODcgMTAyLjcyIDIzLjU1MjcgMTAzLjc3NiAyMy45NDI4QzEwNC44MzMgMjQuMjgzMyAxMDYuNDI5IDI0LjY1MjEgMTA4LjUwNyAyNS4wMjhDMTExLjQzIDI1LjU1MjkgMTEzLjcyMSAyNi4yMTI1IDExNS4zMjQgMjYuOTk5OEMxMTYuOTEzIDI3Ljc3MyAxMTguMDU1IDI4LjcyMzQgMTE4LjcxNCAyOS44MjI4QzExOS4zNzQgMzAuOTI5MyAxMTkuNzA3IDMyLjMyNjYgMTE5LjcwNyAzMy45ODY0WiIgZmlsbD0id2hpdGUiLz4KPHBhdGggZD0iTTE1MS4xMzYgMTIuOTQyM1Y0Mi4wOTQySDE0NS41MzNWMzcuMTY0N0MxNDUuNTMzIDM3LjA4NjYgMTQ1LjQ3NiAzNy4wMTU3IDE0NS4zOTggMzYuOTk0NEMxNDUuMzIgMzYuOTczMSAxNDUuMjM1IDM3LjAxNTcgMTQ1LjE5OSAzNy4wODY2QzE0NC4yNyAzOC44MzE1IDE0My4wMTUgNDAuMjM1OSAxNDEuNDU0IDQxLjI3MTVDMTM5LjkwMSA0Mi4yNzE2IDEzOC4wMDcgNDIuNzc1MiAxMzUuODIyIDQyLjc3NTJDMTMyLjI5NyA0Mi43NzUyIDEyOS42NTEgNDEuNzQ2NyAxMjcuOTU2IDM5LjcxODFDMTI2LjI1NCAzNy42ODI0IDEyNS4zODkgMzUuMDA4NCAxMjUuMzg5IDMxLjc3NFYxMi45NDIzSDEzMC45OTJWMzEuMzc2OEMxMzAuOTkyIDMzLjQxOTYgMTMxLjU1OSAzNS4wNjUyIDEzMi42ODcgMzYuMjYzOUMxMzMuODE1IDM3LjQ2OTcgMTM1LjUzOSAzOC4wNzk2IDEzNy44MDggMzguMDc5NkMxMzkuMzkgMzguMDc5NiAxNDAuOTg2IDM3LjU1NDggMTQyLjU2MSAzNi41MTkyQzE0My43ODEgMzUuNzM5IDE0NC42NDYgMzQuNTE5IDE0NS4xNSAzMi44ODA1QzE0NS40MzMgMzEuOTY1NSAxNDUuNTMzIDMxLjAwMDkgMTQ1LjUzMyAzMC4wNDM0VjEyLjk0OTRIMTUxLjEzNlYxMi45NDIzWiIgZmlsbD0id2hpdGUiLz4KPHBhdGggZD0iTTE4NC41OTMgMjMuMjYxOVY0Mi4wOTM2SDE3OC45OVYyMy42NTkxQzE3OC45OSAyMS42MjM0IDE3OC40MjIgMTkuOTc3OCAxNzcuMzAyIDE4Ljc3MjFDMTc2LjE3NCAxNy41NjYzIDE3NC40NSAxNi45NTYzIDE3Mi4xNzQgMTYuOTU2M0MxNzAuNTk5IDE2Ljk1NjMgMTY4Ljk4MiAxNy40ODExIDE2Ny4zNzIgMTguNTIzOEMxNjYuMTggMTkuMzA0IDE2NS4zMjIgMjAuNTMxMSAxNjQuODI1IDIyLjE3NjdDMTY0LjU0OSAyMy4wODQ1IDE2NC40NDkgMjQuMDQyMSAxNjQuNDQ5IDI0Ljk5MjVWNDIuMDkzNkgxNTguODQ2VjEyLjk0MTdIMTY0LjQ0OVYxNy44NzEzQzE2NC40NDkgMTcuOTU2NCAxNjQuNTA2IDE4LjAyNzMgMTY0LjU4NCAxOC4wNDg2QzE2NC42NjkgMTguMDYyOCAxNjQuNzQ3IDE4LjAyNzMgMTY0Ljc5IDE3Ljk1NjRDMTY1LjcxMiAxNi4yMTE1IDE2Ni45NzQgMTQuODIxMyAxNjguNTI4IDEzLjgyMTJDMTcwLjA4MSAxMi43ODU2IDE3MS45NzUgMTIuMjYwOCAxNzQuMTYgMTIuMjYwOEMxNzcuNjg1IDEyLjI2MDggMTgwLjMzIDEzLjI4OTIgMTgyLjAyNiAxNS4zMTc4QzE4My43MzUgMTcuMzYwNiAxODQuNTkzIDIwLjAzNDYgMTg0LjU5MyAyMy4yNjE5WiIgZmlsbD0id2hpdGUiLz4KPHBhdGggZD0iTTE5Mi40NzMgMy41MzcyOUgxOTYuMDQ4VjE4LjA0OTRDMTk4LjAyIDE0LjA3NzQgMjAxLjM2OCAxMi4wOTE0IDIwNi4wOTIgMTIuMDkxNEMyMDkuODM3IDEyLjA5MTQgMjEyLjUwNCAxMy4xNDgyIDIxNC4wOTMgMTUuMjY5QzIxNS42ODEgMTcuMzQ3MiAyMTYuNDc2IDE5Ljc1MTcgMjE2LjQ3NiAyMi40NzU0VjQyLjEwMTVIMjEyLjk1OFYyMi43NTkxQzIxMi45NTggMjAuNTI0OCAyMTIuMjk4IDE4Ljc1MTYgMjEwLjk3MiAxNy40MjUyQzIwOS42NDUgMTYuMDk4OSAyMDcuNzE2IDE1LjQzOTIgMjA1LjE4NCAxNS40MzkyQzIwMy4yMTkgMTUuNDM5MiAyMDEuMTkxIDE2LjEyMDEgMTk5LjExMiAxNy40ODJDMTk3LjA3IDE4LjgwODMgMTk2LjA0OCAyMS4yODM4IDE5Ni4wNDggMjUuNTk2M1Y0Mi4xMDE1SDE5Mi40NzNWMy41MzcyOVoiIGZpbGw9IndoaXRlIi8+CjxwYXRoIGQ9Ik0yMzUuODQ3IDQyLjk2MDFDMjMxLjU3IDQyLjk2MDEgMjI4LjI2NCA0MS42MzM4IDIyNS45MTcgMzguOTg4MUMyMjMuNjExIDM2LjI5OTkgMjIyLjQ1NSAzMi40ODM5IDIyMi40NTUgMjcuNTI1OUMyMjIuNDU1IDIyLjU2OCAyMjMuNjExIDE4Ljc2NjIgMjI1LjkxNyAxNi4xMjA1QzIyOC4yNjQgMTMuNDMyMyAyMzEuNTcgMTIuMDkxNyAyMzUuODQ3IDEyLjA5MTdDMjQwLjEyNCAxMi4wOTE3IDI0My40MTUgMTMuNDE4MSAyNDUuNzIgMTYuMDYzOEMyNDguMDY4IDE4LjY3NCAyNDkuMjM4IDIyLjM5NzggMjQ5LjIzOCAyNy4yNDIyVjI4Ljk0NDVIMjI2LjAzQzIyNi4yNTcgMzIuMzEzNyAyMjcuMjU3IDM0LjkzOCAyMjkuMDM3IDM2LjgzMThDMjMwLjgxOCAzOC43MjU3IDIzMy4wODggMzkuNjY5IDIzNS44NDcgMzkuNjY5QzI0MS4yMTYgMzkuNjY5IDI0NC4yOCAzNy4zMDcxIDI0NS4wMzkgMzIuNTc2MUgyNDguNjE0QzI0OC4xOTUgMzYuMDU4NyAyNDYuNzk4IDM4LjY2ODkgMjQ0LjQxNSA0MC40MDY3QzI0Mi4wNjcgNDIuMTA5IDIzOS4yMTYgNDIuOTYwMSAyMzUuODQ3IDQyLjk2MDFaTTI0NS44MzMgMjYuMDUwNkMyNDUuNjQyIDIyLjYxMDUgMjQ0LjY5OSAxOS45NzkxIDI0Mi45OTYgMTguMTYzM0MyNDEuMjk0IDE2LjMxMiAyMzguOTQ2IDE1LjM4MjkgMjM1Ljk2IDE1LjM4MjlDMjMyLjk3NCAxNS4zODI5IDIzMC42MDUgMTYuMzEyIDIyOC44NjcgMTguMTYzM0MyMjcuMTY1IDE5Ljk3OTEgMjI2LjIyMiAyMi42MTA1IDIyNi4wMyAyNi4wNTA2SDI0NS44MzNaIiBmaWxsPSJ3aGl0ZSIvPgo8cGF0aCBkPSJNMjU4LjM4MSAzLjU0NDIyVjQyLjEwMTNIMjU0LjgwNlYzLjU0NDIySDI1OC4zODFaIiBmaWxsPSJ3aGl0ZSIvPgo8cGF0aCBkPSJNMjY4LjgzNiAxMi45NjQyVjE5LjQ2ODRDMjcwLjQ2IDE0LjU1MyAyNzQuMDc3IDEyLjA5MTcgMjc5LjY3NCAxMi4wOTE3QzI4My42NDYgMTIuMDkxNyAyODYuNzg4IDEzLjQ1MzYgMjg5LjA5MyAxNi4xNzczQzI5MS4zOTggMTguOTAwOSAyOTIuNTU0IDIyLjY4MTUgMjkyLjU1NCAyNy41MjU5QzI5Mi41NTQgMzIuMzcwNCAyOTEuMzk4IDM2LjE1MDkgMjg5LjA5MyAzOC44NzQ2QzI4Ni43ODggNDEuNTk4MyAyODMuNjQ2IDQyLjk2MDEgMjc5LjY3NCA0Mi45NjAxQzI3Ni44MzcgNDIuOTYwMSAyNzQuNTY3IDQyLjQyODIgMjcyLjg2NSA0MS4zNzEzQzI3MS4xNjIgNDAuMjcxOSAyNjkuODkzIDM4LjY4MzEgMjY5LjA2MyAzNi42MDQ5VjUxLjVIMjY1LjQ4OFYxMi45NjQySDI2OC44MzZaTTI2OC43NzkgMjcuNTI1OUMyNjguNzc5IDMxLjM4NDUgMjY5LjY1MSAzNC4zNTY0IDI3MS4zODkgMzYuNDM0NkMyNzMuMTI3IDM4LjUxMjkgMjc1LjU2NyAzOS41NTU1IDI3OC43MDkgMzkuNTU1NUMyODEuODUxIDM5LjU1NTUgMjg0LjQ2MSAzOC41MTI5IDI4Ni4xOTkgMzYuNDM0NkMyODcuOTggMzQuMzU2NCAyODguODY2IDMxLjM4NDUgMjg4Ljg2NiAyNy41MjU5QzI4OC44NjYgMjMuNjY3NCAyODcuOTggMjAuNjk1NSAyODYuMTk5IDE4LjYxNzJDMjg0LjQ2MSAxNi41MzkgMjgxLjk2NSAxNS40OTYzIDI3OC43MDkgMTUuNDk2M0MyNzUuNDUzIDE1LjQ5NjMgMjczLjEyNyAxNi41MzkgMjcxLjM4OSAxOC42MTcyQzI2OS42NTEgMjAuNjk1NSAyNjguNzc5IDIzLjY2NzQgMjY4Ljc3OSAyNy41MjU5WiIgZmlsbD0id2hpdGUiLz4KPHBhdGggZD0iTTMwNS4xNTQgOC43MDkxMkMzMDYuMDQ4IDguMjk3NTQgMzA2LjU4MSA3LjQzMDI5IDMwNi41ODEgNi4zODY2NkMzMDYuNTgxIDQuOTUzNDkgMzA1LjQwNiAzLjc0MDgxIDMwNC4wMTYgMy43NDA4MUgyOTkuOTM3QzI5OS43ODkgMy43NDA4MSAyOTkuNyAzLjgyOTAxIDI5OS43IDMuOTc2VjEyLjA1MzJDMjk5LjcgMTIuMjAwMiAyOTkuNzg5IDEyLjI4ODQgMjk5LjkzNyAxMi4yODg0SDMwMC44NjFDMzAxLjAwOCAxMi4yODg0IDMwMS4wOTcgMTIuMjAwMiAzMDEuMDk3IDEyLjA1MzJWOC45OTU3NUgzMDMuODE3QzMwMy44MjQgOC45OTU3NSAzMDMuODMxIDguOTk1NzUgMzAzLjgzOSA4Ljk5NTc1TDMwNS4yMDYgMTIuMTI2N0MzMDUuMjggMTIuMjQ0MyAzMDUuNDI4IDEyLjI4ODQgMzA1LjUyNCAxMi4yODg0SDMwNi40NDhDMzA2LjU2NiAxMi4yODg0IDMwNi42MjUgMTIuMjM2OSAzMDYuNjU0IDEyLjE5MjhDMzA2LjY4NCAxMi4xNDg3IDMwNi42OTkgMTIuMDc1MiAzMDYuNjU0IDExLjk3OTdMMzA1LjE2MiA4LjcyMzgyTDMwNS4xNTQgOC43MDkxMlpNMzA1LjE3NiA2LjM4NjY2QzMwNS4xNzYgNi43NTQxNCAzMDUuMDUxIDcuMDcwMTcgMzA0Ljc5MiA3LjMyMDA1QzMwNC41MzMgNy41NzcyOSAzMDQuMjM4IDcuNzA5NTggMzAzLjkxMyA3LjcxNjkzSDMwMS4wOVY1LjAxMjI5SDMwMy44NzZDMzA0LjIxNiA1LjAxMjI5IDMwNC41MTEgNS4xNDQ1OCAzMDQuNzc3IDUuNDE2NTFDMzA1LjAzNiA1LjY5NTggMzA1LjE2OSA2LjAxOTE4IDMwNS4xNjkgNi4zODY2NkgzMDUuMTc2WiIgZmlsbD0id2hpdGUiLz4KPHBhdGggZD0iTTMwMi45ODkgMEMyOTguNTg0IDAgMjk1IDMuNTg2NTkgMjk1IDcuOTg4OThDMjk1IDEwLjEwNTcgMjk1LjgyOCAxMi4xMTIxIDI5Ny4zNDMgMTMuNjQwOEMyOTguODI4IDE1LjE0MDEgMzAwLjg5IDE2IDMwMi45ODkgMTZDMzA3LjQwOCAxNS45NzggMzExIDEyLjM4NCAzMTEgNy45ODg5OEMzMTEgMy41OTM5NCAzMDcuNDA4IDAgMzAyLjk4OSAwWk0zMDkuNjg1IDcuOTg4OThDMzA5LjY4NSAxMS42Nzg1IDMwNi42ODQgMTQuNjc3MSAzMDIuOTg5IDE0LjY3NzFDMjk5LjI5NCAxNC42NzcxIDI5Ni4zMDggMTEuNjc4NSAyOTYuMzA4IDcuOTg4OThDMjk2LjMwOCA0LjI5OTUgMjk5LjMwOSAxLjMyMjkyIDMwMi45ODkgMS4zMDA4N0MzMDYuNjg0IDEuMzIyOTIgMzA5LjY4NSA0LjMyMTU0IDMwOS42ODUgNy45ODg5OFoiIGZpbGw9IndoaXRlIi8+Cjwvc3ZnPgo="